@@ -0,0 +1,71 @@
+"""Grow a ChatLog to a long session and check that costs stay flat.
+
+python benchmarks/bench_chatlog.py [--messages 5000] [--live 100]
+
+Prints, at a few session lengths, the time to add a batch of messages, the
+number of live widgets, peak RSS, and the time to page in older history
+when scrolled to the top.
+"""
+
+from groqmate.interfaces.cli.widgets import ChatLog, ChatMessage
+from textual.app import App
+import argparse
+import asyncio
+import resource
+import time
+
+BATCH = 100
+
+
+class ChatApp(App):
+    def __init__(self, live: int):
+        super().__init__()
+        self.live = live
+
+    def compose(self):
+        yield ChatLog(live_limit=self.live)
+
+
+async def run(messages: int, live: int) -> None:
+    app = ChatApp(live)
+    async with app.run_test(size=(100, 40)) as pilot:
+        chat = app.query_one(ChatLog)
+        print(
+            f"{'messages':>10}{'add ms/msg':>12}{'live':>8}{'RSS MiB':>9}{'page ms':>10}"
+        )
+        added = 0
+        checkpoints = {BATCH, messages // 8, messages // 4, messages // 2}
+        while added < messages:
+            start = time.perf_counter()
+            for _ in range(BATCH):
+                chat.add_message(
+                    "Groqmate", f"Message {added}\nwith a second line of text"
+                )
+                added += 1
+            await pilot.pause()
+            add = (time.perf_counter() - start) / BATCH
+
+            if added in checkpoints or added >= messages:
+                start = time.perf_counter()
+                chat.scroll_home(animate=False)
+                await pilot.pause()
+                page = time.perf_counter() - start
+                chat.scroll_end(animate=False)
+                await pilot.pause()
+                memory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+                print(
+                    f"{added:>10,}{add * 1e3:>12.2f}"
+                    f"{len(app.query(ChatMessage)):>8}{memory:>9.1f}{page * 1e3:>10.1f}"
+                )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--messages", type=int, default=5000)
+    parser.add_argument("--live", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(run(args.messages, args.live))
+
+
+if __name__ == "__main__":
+    main()
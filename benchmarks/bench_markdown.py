@@ -0,0 +1,84 @@
+"""Compare incremental markdown rendering with a full re-render per frame.
+
+python benchmarks/bench_markdown.py [--tokens 5000] [--frame 8] [--width 80]
+
+Streams a reply made of paragraphs, lists and fenced code blocks into one
+ChatMessage, rendering every --frame tokens, and does the same by rendering
+the whole accumulated markdown from scratch each time.
+"""
+
+from groqmate.interfaces.cli.markdown import render_block, render_lines
+from groqmate.interfaces.cli.widgets import ChatMessage
+import argparse
+import time
+
+SECTION = """**Step {n}.** A recursive function calls *itself* on a smaller input.
+
+```python
+def fact(n):
+    return 1 if n == 0 else n * fact(n - 1)
+```
+
+- the base case stops it
+- each call waits on the `next` one
+
+"""
+
+
+def make_tokens(count: int) -> list[str]:
+    tokens: list[str] = []
+    n = 0
+    while len(tokens) < count:
+        text = SECTION.format(n=n)
+        tokens += [text[i : i + 4] for i in range(0, len(text), 4)]
+        n += 1
+    return tokens[:count]
+
+
+def run_full(tokens: list[str], frame: int, width: int) -> tuple[float, float]:
+    content = ""
+    last = 0.0
+    start = time.perf_counter()
+    for i, token in enumerate(tokens, 1):
+        content += token
+        if i % frame == 0:
+            began = time.perf_counter()
+            render_lines(content, width)
+            last = time.perf_counter() - began
+    return time.perf_counter() - start, last
+
+
+def run_incremental(tokens: list[str], frame: int, width: int) -> tuple[float, float]:
+    render_block.cache_clear()
+    message = ChatMessage("Groqmate", is_streaming=True)
+    last = 0.0
+    start = time.perf_counter()
+    for i, token in enumerate(tokens, 1):
+        message.append_content(token)
+        if i % frame == 0:
+            began = time.perf_counter()
+            # Laying out the reply is the frame's work; the widget then turns
+            # only the rows on screen into strips.
+            message.get_content_height(None, None, width)
+            last = time.perf_counter() - began
+    return time.perf_counter() - start, last
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tokens", type=int, default=5000)
+    parser.add_argument("--frame", type=int, default=8)
+    parser.add_argument("--width", type=int, default=80)
+    args = parser.parse_args()
+
+    tokens = make_tokens(args.tokens)
+    print(f"{'tokens':30}{args.tokens:>12,}")
+    print(f"{'characters':30}{len(''.join(tokens)):>12,}")
+    for name, run in [("full", run_full), ("incremental", run_incremental)]:
+        total, last = run(tokens, args.frame, args.width)
+        print(f"{name + ': total (s)':30}{total:12.2f}")
+        print(f"{name + ': last render (ms)':30}{last * 1e3:12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Compare pydantic lesson models with their compact runtime forms.
+
+python benchmarks/bench_models.py [--plans 10000]
+"""
+
+from groqmate.core.models import CompactPlan, LessonPlan
+import argparse
+import gc
+import timeit
+import tracemalloc
+
+
+def make_plan_dict(n: int) -> dict:
+    return {
+        "topic": f"Topic {n}",
+        "steps": [
+            {
+                "index": i,
+                "title": f"Step {i} of topic {n}",
+                "concept": f"Concept {i} for topic {n}, explained in a sentence or two.",
+                "quiz_question": f"What is the key idea of step {i}?",
+                "quiz_answer": f"answer {i}",
+                "accepted_answers": [f"alt {i}"],
+            }
+            for i in range(5)
+        ],
+    }
+
+
+def measure_memory(build, count: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [build(i) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return (after - before) / 1024 / 1024
+
+
+def throughput(fn, items, repeat: int = 5) -> float:
+    best = min(
+        timeit.repeat(lambda: [fn(item) for item in items], number=1, repeat=repeat)
+    )
+    return len(items) / best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--plans", type=int, default=10_000)
+    args = parser.parse_args()
+    count = args.plans
+
+    dicts = [make_plan_dict(i) for i in range(count)]
+    models = [LessonPlan.model_validate(d) for d in dicts]
+    compacts = [CompactPlan.from_dict(d) for d in dicts]
+    payloads = [m.model_dump_json() for m in models]
+
+    # Memory is measured on plans decoded from JSON, as caches hold them.
+    rows = [
+        (
+            f"memory for {count:,} plans (MiB)",
+            measure_memory(
+                lambda i: LessonPlan.model_validate_json(payloads[i]), count
+            ),
+            measure_memory(lambda i: CompactPlan.from_json(payloads[i]), count),
+        ),
+        (
+            "construct from dict (plans/s)",
+            throughput(LessonPlan.model_validate, dicts),
+            throughput(CompactPlan.from_dict, dicts),
+        ),
+        (
+            "serialize to JSON (plans/s)",
+            throughput(lambda m: m.model_dump_json(), models),
+            throughput(lambda c: c.to_json(), compacts),
+        ),
+        (
+            "parse from JSON (plans/s)",
+            throughput(LessonPlan.model_validate_json, payloads),
+            throughput(CompactPlan.from_json, payloads),
+        ),
+        # Lesson packs, journal snapshots and daemon requests are validated.
+        (
+            "parse + validate JSON (plans/s)",
+            throughput(LessonPlan.model_validate_json, payloads),
+            throughput(CompactPlan.validate_json, payloads),
+        ),
+    ]
+
+    print(f"{'':34} {'pydantic':>12} {'compact':>12} {'ratio':>7}")
+    for name, before, after in rows:
+        ratio = before / after if name.startswith("memory") else after / before
+        print(f"{name:34} {before:12,.1f} {after:12,.1f} {ratio:6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Time progress writes and stats queries on a large progress database.
+
+python benchmarks/bench_progress.py [--attempts 1000000] [--topics 200]
+"""
+
+from groqmate.core.progress import ProgressReader, ProgressStore
+from groqmate.core.state import Session
+from groqmate.core.models import CompactPlan, CompactStep
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+
+
+def make_plan(n: int) -> CompactPlan:
+    steps = tuple(
+        CompactStep(i, f"Step {i}", "concept", "question?", "answer", ())
+        for i in range(5)
+    )
+    return CompactPlan(f"Topic {n}", steps)
+
+
+def best_of(fn, repeat: int = 5) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--attempts", type=int, default=1_000_000)
+    parser.add_argument("--topics", type=int, default=200)
+    args = parser.parse_args()
+    plans = [make_plan(i) for i in range(args.topics)]
+    rng = random.Random(0)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "progress.db"
+        store = ProgressStore(path)
+        tracker = store.track()
+        session = Session()
+        session.subscribe(tracker.observe)
+
+        start = time.perf_counter()
+        recorded = 0
+        while recorded < args.attempts:
+            session.load_plan(rng.choice(plans))
+            while True:
+                tracker.attempt(rng.random() < 0.7)
+                if rng.random() < 0.05:
+                    tracker.wtf()
+                recorded += 1
+                if rng.random() < 0.7 and not session.advance():
+                    break
+        enqueued = time.perf_counter() - start
+        store.close()
+        total = time.perf_counter() - start
+
+        reader = ProgressReader(path)
+        topic = plans[0].topic
+        print(f"attempts recorded        {recorded:>12,}")
+        print(f"enqueue (us/event)       {enqueued / recorded * 1e6:12.2f}")
+        print(f"write throughput (ev/s)  {recorded / total:12,.0f}")
+        print(f"stats: all topics (ms)   {best_of(reader.topics) * 1e3:12.2f}")
+        print(
+            f"stats: one topic (ms)    {best_of(lambda: reader.steps(topic)) * 1e3:12.2f}"
+        )
+        print(f"database size (MiB)      {path.stat().st_size / 1024 / 1024:12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Measure the longest event-loop stall while a large summary is shown.
+
+python benchmarks/bench_stall.py [--sections 40] [--width 100]
+
+Adds one summary-sized Markdown reply to a ChatLog and samples the event
+loop every millisecond until the reply is fully laid out, once with layout
+in the worker process and once inline on the loop. Both start with the code
+highlighter warm, as the app warms it at launch.
+"""
+
+from groqmate.interfaces.cli import executor, widgets
+from groqmate.interfaces.cli.markdown import render_block, warm
+from groqmate.interfaces.cli.widgets import ChatLog
+from textual.app import App
+import argparse
+import asyncio
+import time
+
+SECTION = """## Step {n}: Base cases
+
+A recursive function calls *itself* on a smaller input. **Always** define
+the base case first, or the calls never stop.
+
+```python
+def fact(n):
+    if n == 0:
+        return 1
+    return n * fact(n - 1)
+```
+
+- the base case stops it
+- each call waits on the `next` one
+
+"""
+
+
+class ChatApp(App):
+    def compose(self):
+        yield ChatLog()
+
+
+async def run(summary: str, width: int) -> tuple[float, float]:
+    render_block.cache_clear()
+    app = ChatApp()
+    async with app.run_test(size=(width, 40)) as pilot:
+        chat = app.query_one(ChatLog)
+        await pilot.pause()
+        worst = 0.0
+        start = time.perf_counter()
+        message = chat.add_message("Groqmate", summary)
+        blocks = len(message._blocks.blocks)
+        last = time.perf_counter()
+        while not (message._rendered and message._rendered[1] == blocks):
+            await asyncio.sleep(0.001)
+            now = time.perf_counter()
+            worst = max(worst, now - last - 0.001)
+            last = now
+        return worst, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sections", type=int, default=40)
+    parser.add_argument("--width", type=int, default=100)
+    args = parser.parse_args()
+
+    summary = "".join(SECTION.format(n=n) for n in range(args.sections))
+    for future in executor.start(warm):
+        future.result()
+    warm()
+    print(f"{'summary chars':30}{len(summary):>12,}")
+    for name, limit in [("process", widgets.OFFLOAD_CHARS), ("inline", 1 << 62)]:
+        widgets.OFFLOAD_CHARS = limit
+        worst, total = asyncio.run(run(summary, args.width))
+        print(f"{name + ': longest stall (ms)':30}{worst * 1e3:12.1f}")
+        print(f"{name + ': laid out after (ms)':30}{total * 1e3:12.1f}")
+    executor.shutdown()
+
+
+if __name__ == "__main__":
+    main()
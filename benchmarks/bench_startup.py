@@ -0,0 +1,80 @@
+"""Check cold-start import time of the CLI against budgets.
+
+python benchmarks/bench_startup.py [--repeat 5] [--slack 1.0]
+
+Runs each entry point in a fresh interpreter under `python -X importtime`,
+takes the best of --repeat runs, and exits with status 1 if any of them
+goes over its budget (scaled by --slack) or imports a module it should
+not need.
+"""
+
+import argparse
+import subprocess
+import sys
+
+HEAVY = ("litellm", "textual", "rich")
+
+# name, code, budget for all imports in ms, top-level packages it must not load
+CASES = [
+    (
+        "groqmate --help",
+        "from groqmate.interfaces.cli.main import run\nrun(['--help'])",
+        250,
+        HEAVY,
+    ),
+    (
+        "groqmate --list-providers",
+        "from groqmate.interfaces.cli.main import run\nrun(['--list-providers'])",
+        250,
+        HEAVY,
+    ),
+    ("import core.tutor", "import groqmate.core.tutor", 600, ("litellm",)),
+    ("import cli.app (TUI)", "import groqmate.interfaces.cli.app", 1200, ("litellm",)),
+]
+
+
+def import_profile(code: str) -> tuple[float, set[str]]:
+    wrapped = f"try:\n    exec({code!r})\nexcept SystemExit:\n    pass"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", wrapped],
+        capture_output=True,
+        text=True,
+    )
+    total = 0
+    modules = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        modules.add(name.strip().split(".")[0])
+        # Top-level imports carry no indent; their cumulative time covers
+        # everything they pulled in.
+        if name.startswith(" ") and not name.startswith("  "):
+            total += int(cumulative)
+    return total / 1e3, modules
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--slack", type=float, default=1.0)
+    args = parser.parse_args()
+
+    failed = False
+    print(f"{'entry point':30}{'imports (ms)':>14}{'budget':>10}")
+    for name, code, budget, forbidden in CASES:
+        runs = [import_profile(code) for _ in range(args.repeat)]
+        best = min(ms for ms, _ in runs)
+        loaded = sorted(set(forbidden) & runs[0][1])
+        over = best > budget * args.slack
+        failed |= over or bool(loaded)
+        note = f"  loads {', '.join(loaded)}" if loaded else ""
+        note += "  OVER BUDGET" if over else ""
+        print(f"{name:30}{best:14.1f}{budget:10}{note}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""Stream tokens into one ChatMessage and time appends and renders.
+
+python benchmarks/bench_stream.py [--tokens 20000] [--frame 8] [--width 80]
+
+--frame is how many tokens arrive between two renders (Textual renders at
+most once per frame however often refresh() is called).
+
+Plain messages (user, system) are rendered with render(). Tutor replies are
+markdown and go through the line API, so a frame there is the content height
+plus the rows on screen; "markdown: joined" is the same reply rendered as one
+Text each frame, as it was before.
+"""
+
+from groqmate.interfaces.cli.widgets import ChatMessage
+from rich.text import Text
+import argparse
+import random
+import time
+
+
+def make_tokens(count: int, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    words = ["the", "recursion", "base", "case", "stack", "call", "returns", "n"]
+    tokens = []
+    for _ in range(count):
+        token = " " + rng.choice(words)
+        if rng.random() < 0.05:
+            token += ".\n" if rng.random() < 0.5 else "\n\n"
+        tokens.append(token)
+    return tokens
+
+
+SCREEN_ROWS = 40
+
+
+def rebuild_render(content: str) -> Text:
+    # What ChatMessage.render did before: re-split and rebuild everything.
+    result = Text()
+    result.append("Groqmate: ", style="bold green")
+    for i, line in enumerate(content.split("\n")):
+        if i > 0:
+            result.append("\n")
+            result.append("          ", style="dim")
+        result.append(line)
+    result.append(" ▏", style="bold green blink")
+    return result
+
+
+def run_rebuild(tokens: list[str], frame: int, width: int) -> tuple[float, float]:
+    content = ""
+    render = 0.0
+    start = time.perf_counter()
+    for i, token in enumerate(tokens, 1):
+        content += token
+        if i % frame == 0:
+            began = time.perf_counter()
+            rebuild_render(content)
+            render = time.perf_counter() - began
+    return time.perf_counter() - start, render
+
+
+def run_message(message: ChatMessage, draw, tokens: list[str], frame: int):
+    render = 0.0
+    start = time.perf_counter()
+    for i, token in enumerate(tokens, 1):
+        message.append_content(token)
+        if i % frame == 0:
+            began = time.perf_counter()
+            draw(message)
+            render = time.perf_counter() - began
+    return time.perf_counter() - start, render
+
+
+def run_plain(tokens: list[str], frame: int, width: int) -> tuple[float, float]:
+    message = ChatMessage("System", is_system=True, is_streaming=True)
+    return run_message(message, ChatMessage.render, tokens, frame)
+
+
+def run_joined(tokens: list[str], frame: int, width: int) -> tuple[float, float]:
+    def draw(message: ChatMessage) -> None:
+        done, tail = message._markdown_lines(width)
+        Text("\n").join([*done[:-1], *tail])
+
+    message = ChatMessage("Groqmate", is_streaming=True)
+    return run_message(message, draw, tokens, frame)
+
+
+def run_markdown(tokens: list[str], frame: int, width: int) -> tuple[float, float]:
+    def draw(message: ChatMessage) -> None:
+        height = message.get_content_height(None, None, width)
+        for y in range(max(0, height - SCREEN_ROWS), height):
+            message._markdown_line(y, width)
+
+    message = ChatMessage("Groqmate", is_streaming=True)
+    return run_message(message, draw, tokens, frame)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tokens", type=int, default=20_000)
+    parser.add_argument("--frame", type=int, default=8)
+    parser.add_argument("--width", type=int, default=80)
+    args = parser.parse_args()
+
+    tokens = make_tokens(args.tokens)
+    print(f"{'tokens':34}{args.tokens:>12,}")
+    print(f"{'lines':34}{''.join(tokens).count(chr(10)) + 1:>12,}")
+    runs = [
+        ("rebuild", run_rebuild),
+        ("plain", run_plain),
+        ("markdown: joined", run_joined),
+        ("markdown", run_markdown),
+    ]
+    for name, run in runs:
+        total, last = run(tokens, args.frame, args.width)
+        print(f"{name + ': total (s)':34}{total:12.2f}")
+        print(f"{name + ': us per token':34}{total / args.tokens * 1e6:12.1f}")
+        print(f"{name + ': last render (ms)':34}{last * 1e3:12.2f}")
+
+
+if __name__ == "__main__":
+    main()
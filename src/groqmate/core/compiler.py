@@ -0,0 +1,253 @@
+from pathlib import Path
+from pydantic import BaseModel, Field
+from groqmate.core.ledger import estimate_tokens
+from groqmate.core.models import LessonPlan
+from groqmate.core.packs import LessonPackWriter
+from groqmate.core.state import Session
+from groqmate.core.topics import normalize_topic
+from typing import Callable, Dict, Iterable, List, Optional, Protocol, Set
+import asyncio
+import json
+import os
+import time
+
+PACK_SUFFIXES = (".gmpack", ".db", ".sqlite")
+
+
+def read_topics(lines: Iterable[str]) -> List[str]:
+    topics = []
+    seen = set()
+    for line in lines:
+        topic = line.strip()
+        if not topic or topic.startswith("#"):
+            continue
+        key = normalize_topic(topic)
+        if key and key not in seen:
+            seen.add(key)
+            topics.append(topic)
+    return topics
+
+
+class CompiledLesson(BaseModel):
+    topic: str
+    plan: LessonPlan
+    explanations: List[str] = Field(default_factory=list)
+    summary: str = ""
+
+    def estimated_tokens(self) -> int:
+        texts = [self.plan.model_dump_json(), self.summary, *self.explanations]
+        return sum(estimate_tokens(t) for t in texts)
+
+
+class CompileStats(BaseModel):
+    compiled: int = 0
+    skipped: int = 0
+    failed: int = 0
+    tokens: int = 0
+    elapsed: float = 0.0
+    errors: Dict[str, str] = Field(default_factory=dict)
+
+    @property
+    def lessons_per_minute(self) -> float:
+        return self.compiled / (self.elapsed / 60) if self.elapsed else 0.0
+
+    @property
+    def tokens_per_second(self) -> float:
+        return self.tokens / self.elapsed if self.elapsed else 0.0
+
+    def report(self) -> str:
+        minutes, seconds = divmod(int(self.elapsed), 60)
+        return (
+            f"Compiled {self.compiled} lessons ({self.skipped} skipped, "
+            f"{self.failed} failed) in {minutes}m{seconds:02d}s: "
+            f"{self.lessons_per_minute:.1f} lessons/min, "
+            f"~{self.tokens_per_second:.0f} tokens/sec"
+        )
+
+
+class LessonSink(Protocol):
+    def done_topics(self) -> Set[str]: ...
+
+    def write(self, lesson: CompiledLesson) -> None: ...
+
+    def close(self) -> None: ...
+
+
+class JsonlSink:
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._checked = False
+
+    def done_topics(self) -> Set[str]:
+        done = set()
+        if not self.path.exists():
+            return done
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                done.add(normalize_topic(record.get("topic", "")))
+        return done
+
+    def _torn(self) -> bool:
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(-1, os.SEEK_END)
+                return f.read(1) != b"\n"
+        except OSError:
+            return False
+
+    def write(self, lesson: CompiledLesson) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # A crash mid-write leaves the last record without its newline; start
+        # on a fresh line so the next record isn't glued onto it.
+        prefix = "\n" if not self._checked and self._torn() else ""
+        self._checked = True
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(prefix + lesson.model_dump_json() + "\n")
+
+    def close(self) -> None:
+        pass
+
+
+class PackSink:
+    def __init__(self, path: Path):
+        self.writer = LessonPackWriter(path)
+
+    def done_topics(self) -> Set[str]:
+        return self.writer.topics()
+
+    def write(self, lesson: CompiledLesson) -> None:
+        self.writer.add_lesson(
+            lesson.plan,
+            explanations=dict(enumerate(lesson.explanations)),
+            summary=lesson.summary or None,
+            topic=lesson.topic,
+        )
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+def open_sink(path: Path) -> LessonSink:
+    if Path(path).suffix in PACK_SUFFIXES:
+        return PackSink(path)
+    return JsonlSink(path)
+
+
+class RateLimiter:
+    def __init__(self, requests_per_minute: Optional[float] = None):
+        self.interval = 60.0 / requests_per_minute if requests_per_minute else 0.0
+        self._next = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        if not self.interval:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            wait = self._next - now
+            self._next = max(now, self._next) + self.interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+def _is_rate_limited(error: Exception) -> bool:
+    return (
+        getattr(error, "status_code", None) == 429
+        or "RateLimit" in type(error).__name__
+    )
+
+
+class LessonCompiler:
+    def __init__(
+        self,
+        tutor,
+        concurrency: int = 4,
+        requests_per_minute: Optional[float] = None,
+        max_retries: int = 5,
+        backoff: float = 2.0,
+    ):
+        self.tutor = tutor
+        self.concurrency = max(1, concurrency)
+        self.limiter = RateLimiter(requests_per_minute)
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self._requests = asyncio.Semaphore(self.concurrency)
+
+    async def _call(self, make_call):
+        for attempt in range(self.max_retries + 1):
+            await self.limiter.acquire()
+            try:
+                async with self._requests:
+                    return await make_call()
+            except Exception as e:
+                if not _is_rate_limited(e) or attempt == self.max_retries:
+                    raise
+                await asyncio.sleep(self.backoff * 2**attempt)
+
+    async def _explain(self, plan: LessonPlan, index: int) -> str:
+        session = Session()
+        session.load_plan(plan)
+        session.state.current_step = index
+
+        async def stream() -> str:
+            return "".join([t async for t in self.tutor.explain_step_stream(session)])
+
+        return await self._call(stream)
+
+    async def compile_topic(self, topic: str) -> CompiledLesson:
+        plan = await self._call(lambda: self.tutor.generate_plan(topic))
+
+        session = Session()
+        session.load_plan(plan)
+        explanations, summary = await asyncio.gather(
+            asyncio.gather(*(self._explain(plan, i) for i in range(plan.total_steps))),
+            self._call(lambda: self.tutor.generate_summary(session)),
+        )
+        return CompiledLesson(
+            topic=topic, plan=plan, explanations=list(explanations), summary=summary
+        )
+
+    async def run(
+        self,
+        topics: List[str],
+        sink: LessonSink,
+        on_progress: Optional[Callable[[str, Optional[Exception]], None]] = None,
+    ) -> CompileStats:
+        stats = CompileStats()
+        done = sink.done_topics()
+        queue: asyncio.Queue = asyncio.Queue()
+        for topic in topics:
+            if normalize_topic(topic) in done:
+                stats.skipped += 1
+            else:
+                queue.put_nowait(topic)
+
+        started = time.monotonic()
+
+        async def worker() -> None:
+            while True:
+                try:
+                    topic = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    lesson = await self.compile_topic(topic)
+                except Exception as e:
+                    stats.failed += 1
+                    stats.errors[topic] = str(e)
+                    if on_progress:
+                        on_progress(topic, e)
+                    continue
+                sink.write(lesson)
+                stats.compiled += 1
+                stats.tokens += lesson.estimated_tokens()
+                if on_progress:
+                    on_progress(topic, None)
+
+        await asyncio.gather(*(worker() for _ in range(self.concurrency)))
+        stats.elapsed = time.monotonic() - started
+        return stats
@@ -1,17 +1,55 @@
 from pathlib import Path
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+from groqmate.core.providers import Provider
+from typing import Dict, Optional, Tuple
+import asyncio
+import os
+import tempfile
 import tomllib
 import tomli_w
-import os
 
 CONFIG_DIR = Path.home() / ".groqmate"
 CONFIG_PATH = CONFIG_DIR / "config.toml"
 
+Signature = Tuple[int, int]
+
+
+class ConfigError(ValueError):
+    def __init__(self, path: Path, detail: str):
+        super().__init__(f"Invalid config {path}: {detail}")
+        self.path = path
+        self.detail = detail
+
+
+def file_signature(path: Path) -> Optional[Signature]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
 
 class Settings(BaseModel):
-    provider: str = "groq"
+    # Providers are checked on load but kept as plain strings, as the rest of
+    # the app (and the TOML file) expects.
+    model_config = ConfigDict(use_enum_values=True, validate_default=True)
+
+    provider: Provider = Provider.GROQ
     model: Optional[str] = None
+    reuse_plans: bool = True
+    plan_match_threshold: float = Field(0.6, ge=0, le=1)
+    lesson_pack: Optional[str] = None
+    llm_grading: bool = True
+    grader_model: Optional[str] = None
+    usage_ledger: bool = True
+    resume_sessions: bool = True
+    save_transcripts: bool = True
+    track_progress: bool = True
+    review_cards: bool = True
+    stream_fps: int = Field(30, ge=1)
+    max_requests: int = Field(3, ge=1)
+    perf_hud: bool = False
+    use_daemon: bool = True
 
 
 class ApiKeys(BaseModel):
@@ -24,35 +62,74 @@ class ApiKeys(BaseModel):
     mistral: Optional[str] = None
 
 
+# Parsed configs by path, valid while the file's (mtime, size) is unchanged.
+_cache: Dict[Path, Tuple[Signature, "Config"]] = {}
+
+
 class Config(BaseModel):
     settings: Settings = Settings()
     api_keys: ApiKeys = ApiKeys()
 
     @classmethod
-    def load(cls) -> "Config":
-        if not CONFIG_PATH.exists():
+    def load(cls, path: Optional[Path] = None) -> "Config":
+        path = Path(path or CONFIG_PATH)
+        signature = file_signature(path)
+        if signature is None:
             return cls()
 
+        cached = _cache.get(path)
+        if cached and cached[0] == signature:
+            return cached[1].model_copy(deep=True)
+
         try:
-            with open(CONFIG_PATH, "rb") as f:
+            with open(path, "rb") as f:
                 data = tomllib.load(f)
-
-            settings = Settings(**data.get("settings", {}))
-            api_keys = ApiKeys(**data.get("api_keys", {}))
-            return cls(settings=settings, api_keys=api_keys)
-        except Exception:
-            return cls()
-
-    def save(self) -> None:
-        CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+            config = cls(
+                settings=Settings(**data.get("settings", {})),
+                api_keys=ApiKeys(**data.get("api_keys", {})),
+            )
+        except (OSError, tomllib.TOMLDecodeError) as e:
+            raise ConfigError(path, str(e)) from e
+        except ValidationError as e:
+            detail = "; ".join(
+                f"{'.'.join(map(str, error['loc']))}: {error['msg']}"
+                for error in e.errors()
+            )
+            raise ConfigError(path, detail) from e
+        except (TypeError, AttributeError) as e:
+            raise ConfigError(path, str(e)) from e
+
+        _cache[path] = (signature, config)
+        return config.model_copy(deep=True)
+
+    def save(self, path: Optional[Path] = None) -> None:
+        path = Path(path or CONFIG_PATH)
+        path.parent.mkdir(parents=True, exist_ok=True)
 
         data = {
             "settings": self.settings.model_dump(exclude_none=True),
             "api_keys": self.api_keys.model_dump(exclude_none=True),
         }
 
-        with open(CONFIG_PATH, "wb") as f:
-            tomli_w.dump(data, f)
+        # Write beside the target and rename over it, so readers never see a
+        # half-written file. mkstemp creates it 0600, which suits API keys.
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".config-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                tomli_w.dump(data, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+        signature = file_signature(path)
+        if signature:
+            _cache[path] = (signature, self.model_copy(deep=True))
+
+    async def save_async(self, path: Optional[Path] = None) -> None:
+        await asyncio.to_thread(self.save, path)
 
     def get_api_key(self, provider: str) -> Optional[str]:
         provider_lower = provider.lower()
@@ -80,3 +157,18 @@ class Config(BaseModel):
         provider_lower = provider.lower()
         if hasattr(self.api_keys, provider_lower):
             setattr(self.api_keys, provider_lower, key if key else None)
+
+
+class ConfigWatcher:
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path or CONFIG_PATH)
+        self.signature = file_signature(self.path)
+
+    def check(self) -> Optional[Config]:
+        signature = file_signature(self.path)
+        if signature == self.signature:
+            return None
+        # Record the signature first so a broken file is reported once, not
+        # on every poll until it is fixed.
+        self.signature = signature
+        return Config.load(self.path)
@@ -0,0 +1,408 @@
+from contextvars import ContextVar
+from groqmate.core.config import CONFIG_DIR, Config, ConfigError
+from groqmate.core.ledger import UsageLedger, UsageRecord
+from groqmate.core.models import CompactState, LessonPlan
+from groqmate.core.pool import TutorPool
+from groqmate.core.providers import Provider, ProviderConfig
+from groqmate.core.state import Session
+from groqmate.core.tutor import Tutor, answer_feedback
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+import asyncio
+import contextlib
+import importlib
+import os
+import pydantic_core
+import time
+
+SOCKET_PATH = CONFIG_DIR / "daemon.sock"
+IDLE_SHUTDOWN = 900.0
+IDLE_CHECK = 5.0
+MAX_REQUESTS = 16
+LINE_LIMIT = 1 << 20
+STREAMS = ("explain", "rephrase")
+
+Message = Dict[str, Any]
+
+# How the request being served sends a message back to its client.
+_reply: ContextVar[Optional[Callable[[Message], None]]] = ContextVar(
+    "reply", default=None
+)
+
+
+class DaemonError(Exception):
+    pass
+
+
+# The daemon cannot serve the request at all (not running, gone mid-request,
+# or unable to set up the client's provider); the client works in-process.
+class DaemonUnavailable(DaemonError):
+    pass
+
+
+def encode(message: Message) -> bytes:
+    return pydantic_core.to_json(message) + b"\n"
+
+
+async def replies(path: Path, request: Message) -> AsyncIterator[Message]:
+    try:
+        reader, writer = await asyncio.open_unix_connection(str(path), limit=LINE_LIMIT)
+    except OSError as e:
+        raise DaemonUnavailable(f"No daemon on {path}: {e}") from e
+    try:
+        writer.write(encode(request))
+        await writer.drain()
+        while True:
+            try:
+                line = await reader.readline()
+                reply = pydantic_core.from_json(line) if line else None
+            except (OSError, ValueError) as e:
+                raise DaemonUnavailable(f"Lost the daemon connection: {e}") from e
+            if reply is None:
+                raise DaemonUnavailable(
+                    "The daemon closed the connection before replying"
+                )
+            if "error" in reply:
+                error = DaemonUnavailable if reply.get("unavailable") else DaemonError
+                raise error(reply["error"])
+            yield reply
+            if "result" in reply:
+                return
+    except OSError as e:
+        raise DaemonUnavailable(f"Lost the daemon connection: {e}") from e
+    finally:
+        writer.close()
+
+
+async def call(path: Path, request: Message) -> Any:
+    async with contextlib.aclosing(replies(path, request)) as stream:
+        async for reply in stream:
+            if "result" in reply:
+                return reply["result"]
+
+
+async def ping(path: Path = SOCKET_PATH) -> Optional[Message]:
+    try:
+        return await call(path, {"op": "ping"})
+    except DaemonError:
+        return None
+
+
+class ForwardingLedger(UsageLedger):
+    # The daemon keeps no ledger file: each record goes back to the client
+    # that made the request, which books it in its own ledger.
+    def record(self, *args: Any, **kwargs: Any) -> UsageRecord:
+        record = super().record(*args, **kwargs)
+        send = _reply.get()
+        if send is not None:
+            send({"usage": record.to_line()})
+        return record
+
+
+class TutorDaemon:
+    def __init__(
+        self,
+        path: Path = SOCKET_PATH,
+        idle_shutdown: float = IDLE_SHUTDOWN,
+        max_requests: int = MAX_REQUESTS,
+        config_path: Optional[Path] = None,
+    ):
+        self.path = Path(path)
+        self.idle_shutdown = idle_shutdown
+        self.config_path = config_path
+        self.config = Config()
+        self.pool = TutorPool(ForwardingLedger(), max_requests=max_requests)
+        self.active = 0
+        self.served = 0
+        self._idle_since = time.monotonic()
+        self._stopped: Optional[asyncio.Event] = None
+
+    def _load_config(self) -> Config:
+        # Config.load is cached on the file's signature, so this is a stat
+        # per request; a broken file keeps the last good settings.
+        with contextlib.suppress(ConfigError):
+            self.config = Config.load(self.config_path)
+        return self.config
+
+    def _client_config(self, request: Message) -> Config:
+        # Clients send their settings and API key, so a request is answered
+        # with what the client would have used in-process, not with whatever
+        # the daemon's own environment and config file hold.
+        settings = request.get("settings")
+        if settings is None:
+            return self._load_config()
+        api_key = request.get("api_key")
+        return Config.model_validate(
+            {
+                "settings": settings,
+                "api_keys": {request["provider"]: api_key} if api_key else {},
+            }
+        )
+
+    def _tutor(self, request: Message) -> Tutor:
+        provider_config = ProviderConfig(
+            provider=Provider(request["provider"]), model=request.get("model")
+        )
+        return self.pool.get(provider_config, self._client_config(request))
+
+    def warm(self) -> None:
+        # Pay for litellm and the default provider's Tutor before the first
+        # client is waiting on them.
+        importlib.import_module("litellm")
+        config = self._load_config()
+        with contextlib.suppress(ValueError):
+            self._tutor(
+                {"provider": config.settings.provider, "model": config.settings.model}
+            )
+
+    def status(self) -> Message:
+        return {"pid": os.getpid(), "clients": self.active, "served": self.served}
+
+    def idle(self, now: Optional[float] = None) -> bool:
+        now = time.monotonic() if now is None else now
+        return self.active == 0 and now - self._idle_since >= self.idle_shutdown
+
+    def stop(self) -> None:
+        if self._stopped is not None:
+            self._stopped.set()
+
+    async def serve(self) -> None:
+        self._stopped = asyncio.Event()
+        if await ping(self.path):
+            raise DaemonError(f"A daemon is already listening on {self.path}")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.unlink(missing_ok=True)
+        # The socket is created owner-only, so other users cannot connect.
+        umask = os.umask(0o177)
+        try:
+            server = await asyncio.start_unix_server(
+                self._handle, path=str(self.path), limit=LINE_LIMIT
+            )
+        finally:
+            os.umask(umask)
+
+        self._idle_since = time.monotonic()
+        try:
+            async with server:
+                while not self._stopped.is_set():
+                    with contextlib.suppress(asyncio.TimeoutError):
+                        await asyncio.wait_for(
+                            self._stopped.wait(),
+                            timeout=min(IDLE_CHECK, self.idle_shutdown),
+                        )
+                    if self.idle():
+                        self.stop()
+                    self.pool.evict_idle()
+        finally:
+            self.path.unlink(missing_ok=True)
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        # One request per connection, so a client with several tabs just
+        # opens several connections and they are served concurrently.
+        self.active += 1
+        try:
+            line = await reader.readline()
+            if not line:
+                return
+            request = pydantic_core.from_json(line)
+            work = asyncio.ensure_future(self._answer(request, writer))
+            # A client that hangs up (a stopped reply) cancels its request,
+            # which closes the provider stream as well.
+            hangup = asyncio.ensure_future(reader.read())
+            await asyncio.wait({work, hangup}, return_when=asyncio.FIRST_COMPLETED)
+            hangup.cancel()
+            work.cancel()
+            with contextlib.suppress(asyncio.CancelledError, ConnectionError):
+                await work
+        except (ValueError, ConnectionError):
+            pass
+        finally:
+            self.active -= 1
+            self.served += 1
+            self._idle_since = time.monotonic()
+            writer.close()
+
+    async def _answer(self, request: Message, writer: asyncio.StreamWriter) -> None:
+        def send(message: Message) -> None:
+            writer.write(encode(message))
+
+        _reply.set(send)
+        try:
+            result = await self._run(request, send, writer)
+        except DaemonUnavailable as e:
+            send({"error": str(e), "unavailable": True})
+        except Exception as e:
+            send({"error": str(e) or type(e).__name__})
+        else:
+            send({"result": result})
+        await writer.drain()
+
+    async def _run(
+        self,
+        request: Message,
+        send: Callable[[Message], None],
+        writer: asyncio.StreamWriter,
+    ) -> Any:
+        op = request.get("op")
+        if op == "ping":
+            return self.status()
+        if op == "stop":
+            self.stop()
+            return True
+
+        try:
+            tutor = self._tutor(request)
+        except (KeyError, ValueError) as e:
+            raise DaemonUnavailable(f"Cannot set up the provider: {e}") from e
+        if op == "plan":
+            plan = await tutor.generate_plan(request["topic"])
+            return plan.model_dump()
+        if op == "judge":
+            return await tutor.judge(request["prompt"])
+
+        session = Session()
+        session.restore(CompactState.validate(request["state"]))
+        if op == "summary":
+            return await tutor.generate_summary(session)
+        if op in STREAMS:
+            stream = (
+                tutor.explain_step_stream(session)
+                if op == "explain"
+                else tutor.rephrase_stream(session)
+            )
+            async with contextlib.aclosing(stream):
+                async for token in stream:
+                    send({"token": token})
+                    await writer.drain()
+            return None
+        raise DaemonError(f"Unknown request: {op}")
+
+
+class RemoteTutor:
+    def __init__(self, fallback: Tutor, path: Path = SOCKET_PATH):
+        self.fallback = fallback
+        self.path = Path(path)
+        self.grader = fallback.grader
+        self.ledger = fallback.ledger
+        self.remote = True
+
+    @property
+    def config(self) -> Config:
+        return self.fallback.config
+
+    @property
+    def limiter(self) -> Optional[asyncio.Semaphore]:
+        # The pool's limiter, so the client's max_requests still caps what it
+        # has in flight while the daemon does the work.
+        return self.fallback.limiter
+
+    def _slot(self):
+        return self.limiter if self.limiter is not None else contextlib.nullcontext()
+
+    async def _replies(self, op: str, **args: Any) -> AsyncIterator[Message]:
+        if not self.remote:
+            raise DaemonUnavailable("The daemon is not running")
+        provider_config = self.fallback.provider_config
+        # The socket is owner-only, so the key goes no further than this user.
+        request = {
+            "op": op,
+            "provider": provider_config.provider.value,
+            "model": provider_config.model,
+            "api_key": self.fallback.api_key,
+            "settings": self.config.settings.model_dump(),
+            **args,
+        }
+        try:
+            async with self._slot():
+                async with contextlib.aclosing(replies(self.path, request)) as stream:
+                    async for reply in stream:
+                        if "usage" in reply:
+                            self._book(UsageRecord.from_line(reply["usage"]))
+                        else:
+                            yield reply
+        except DaemonUnavailable:
+            # The daemon exited (or never started): stay in-process from now on.
+            self.remote = False
+            raise
+
+    def _book(self, record: UsageRecord) -> None:
+        self.ledger.record(
+            record.operation,
+            record.provider,
+            record.model,
+            record.prompt_tokens,
+            record.completion_tokens,
+            record.cached_tokens,
+            latency=record.latency,
+            cost=record.cost,
+        )
+
+    async def _result(self, op: str, **args: Any) -> Any:
+        async with contextlib.aclosing(self._replies(op, **args)) as stream:
+            async for reply in stream:
+                if "result" in reply:
+                    return reply["result"]
+
+    async def _stream(
+        self,
+        op: str,
+        session: Session,
+        fallback: Callable[[Session], AsyncIterator[str]],
+    ) -> AsyncIterator[str]:
+        sent = False
+        try:
+            async with contextlib.aclosing(
+                self._replies(op, state=session.state.to_dict())
+            ) as stream:
+                async for reply in stream:
+                    if "token" in reply:
+                        sent = True
+                        yield reply["token"]
+        except DaemonUnavailable:
+            # Restarting a reply the user has partly seen would repeat it.
+            if sent:
+                raise
+            async for token in fallback(session):
+                yield token
+
+    async def generate_plan(self, topic: str) -> LessonPlan:
+        try:
+            return LessonPlan(**await self._result("plan", topic=topic))
+        except DaemonUnavailable:
+            return await self.fallback.generate_plan(topic)
+
+    def explain_step_stream(self, session: Session) -> AsyncIterator[str]:
+        return self._stream("explain", session, self.fallback.explain_step_stream)
+
+    def rephrase_stream(self, session: Session) -> AsyncIterator[str]:
+        return self._stream("rephrase", session, self.fallback.rephrase_stream)
+
+    async def generate_summary(self, session: Session) -> str:
+        try:
+            return await self._result("summary", state=session.state.to_dict())
+        except DaemonUnavailable:
+            return await self.fallback.generate_summary(session)
+
+    async def judge(self, prompt: str) -> str:
+        try:
+            return await self._result("judge", prompt=prompt)
+        except DaemonUnavailable:
+            return await self.fallback.judge(prompt)
+
+    async def check_answer(
+        self, user_answer: str, session: Session
+    ) -> tuple[bool, str]:
+        # Grading runs here so most answers never leave the process; only an
+        # ambiguous one is sent to the daemon for the model's judgement.
+        step = session.current_step()
+        answer = session.current_answer()
+        if not step or not answer:
+            return False, "No active lesson."
+
+        judge = self.judge if self.config.settings.llm_grading else None
+        verdict = await self.grader.grade(
+            step.quiz_question, answer, user_answer, judge=judge
+        )
+        return verdict.correct, answer_feedback(verdict.correct, verdict.score, answer)
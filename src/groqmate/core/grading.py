@@ -0,0 +1,301 @@
+from collections import OrderedDict
+from enum import Enum
+from pydantic import BaseModel, Field
+from groqmate.core.matching import (
+    CompiledAnswer,
+    compile_answer,
+    stem,
+    tokenize,
+    typo_match,
+)
+from groqmate.core.models import AnyStep
+from typing import Awaitable, Callable, Dict, List, NamedTuple, Optional, Tuple
+import asyncio
+
+GRADE_PROMPT = """Grade a student's quiz answer.
+
+Question: {question}
+Expected answer: {answer}
+Student answer: {user_answer}
+
+Accept answers that mean the same thing even if worded differently.
+Reply with exactly one word: CORRECT or INCORRECT."""
+
+Judge = Callable[[str], Awaitable[str]]
+
+# Judge calls in flight at once while grading a batch.
+BULK_JUDGE_CONCURRENCY = 8
+
+
+class Tier(str, Enum):
+    LOCAL_ACCEPT = "local_accept"
+    LOCAL_REJECT = "local_reject"
+    CACHE = "cache"
+    LLM = "llm"
+    JUDGE_FAILED = "judge_failed"
+
+
+class Verdict(NamedTuple):
+    correct: bool
+    score: float
+    tier: Tier
+
+
+class AnswerCluster(NamedTuple):
+    answer: str
+    normalized: str
+    count: int
+    indices: List[int]
+
+
+class BulkGrade(NamedTuple):
+    verdicts: List[Verdict]
+    clusters: List[AnswerCluster]
+
+
+class GradingStats(BaseModel):
+    counts: Dict[Tier, int] = Field(default_factory=dict)
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    def record(self, tier: Tier) -> None:
+        self.counts[tier] = self.counts.get(tier, 0) + 1
+
+    def fraction(self, *tiers: Tier) -> float:
+        if not self.total:
+            return 0.0
+        return sum(self.counts.get(t, 0) for t in tiers) / self.total
+
+    def report(self) -> str:
+        local = self.fraction(Tier.LOCAL_ACCEPT, Tier.LOCAL_REJECT)
+        report = (
+            f"Answers graded: {self.total} "
+            f"({local:.0%} local, {self.fraction(Tier.CACHE):.0%} cached, "
+            f"{self.fraction(Tier.LLM):.0%} LLM)"
+        )
+        failed = self.counts.get(Tier.JUDGE_FAILED, 0)
+        if failed:
+            report += f", {failed} judge call(s) failed"
+        return report
+
+
+def parse_judgement(text: str) -> Optional[bool]:
+    word = text.strip().upper()
+    if word.startswith("INCORRECT"):
+        return False
+    if word.startswith("CORRECT"):
+        return True
+    return None
+
+
+def _numpy():
+    # Imported on first bulk grade, so numpy stays off the startup path.
+    try:
+        import numpy
+    except ImportError:  # pragma: no cover
+        return None
+    return numpy
+
+
+def _bounded(judge: Judge, limit: int) -> Judge:
+    slots = asyncio.Semaphore(limit)
+
+    async def bounded(prompt: str) -> str:
+        async with slots:
+            return await judge(prompt)
+
+    return bounded
+
+
+def _term_matches(token: str, vocab: Dict[str, int]) -> List[int]:
+    if token in vocab:
+        return [vocab[token]]
+    return [i for term, i in vocab.items() if typo_match(term, token)]
+
+
+def score_unique(answer: CompiledAnswer, unique: List[Tuple[str, ...]]) -> List[float]:
+    if not answer.forms or not unique:
+        return [0.0] * len(unique)
+
+    vocab: Dict[str, int] = {}
+    for form in answer.forms:
+        for term in form:
+            vocab.setdefault(term, len(vocab))
+
+    # Typo matching runs once per distinct token across the whole batch.
+    matches: Dict[str, List[int]] = {}
+    hits: List[List[int]] = []
+    conflicts: List[List[bool]] = []
+    for raw in unique:
+        row = set()
+        stemmed = frozenset(stem(token) for token in raw)
+        for token in stemmed:
+            if token not in matches:
+                matches[token] = _term_matches(token, vocab)
+            row.update(matches[token])
+        hits.append(sorted(row))
+        conflicts.append(
+            [answer.conflicts(col, stemmed) for col in range(len(answer.forms))]
+        )
+
+    np = _numpy()
+    if np is not None:
+        present = np.zeros((len(unique), len(vocab)), dtype=np.float32)
+        for row, terms in enumerate(hits):
+            present[row, terms] = 1.0
+        weights = np.zeros((len(vocab), len(answer.forms)), dtype=np.float32)
+        for col, form in enumerate(answer.forms):
+            for term in form:
+                weights[vocab[term], col] += 1.0 / len(form)
+        coverage = present @ weights
+        coverage[np.array(conflicts, dtype=bool)] = 0.0
+        scores = coverage.max(axis=1).tolist()
+    else:
+        scores = []
+        for terms, clashes in zip(hits, conflicts):
+            found = set(terms)
+            scores.append(
+                max(
+                    0.0 if clash else sum(vocab[t] in found for t in form) / len(form)
+                    for form, clash in zip(answer.forms, clashes)
+                )
+            )
+
+    for row, raw in enumerate(unique):
+        if not raw:
+            scores[row] = 0.0
+        elif stem("".join(raw)) in answer.joined:
+            scores[row] = 1.0
+    return [min(1.0, round(score, 6)) for score in scores]
+
+
+class Grader:
+    def __init__(self, cache_size: int = 4096, max_reject_tokens: int = 2):
+        self.cache_size = cache_size
+        self.max_reject_tokens = max_reject_tokens
+        self.stats = GradingStats()
+        self._cache: "OrderedDict[Tuple[str, str, str], bool]" = OrderedDict()
+
+    def decide(
+        self, answer: CompiledAnswer, score: float, tokens: Tuple[str, ...]
+    ) -> Optional[bool]:
+        if score >= answer.threshold:
+            return True
+        if not tokens or (score == 0 and len(tokens) <= self.max_reject_tokens):
+            return False
+        return None
+
+    def classify(
+        self, answer: CompiledAnswer, user_answer: str
+    ) -> Tuple[Optional[bool], float, Tuple[str, ...]]:
+        tokens = tokenize(user_answer)
+        score = answer.score_tokens(tokens)
+        return self.decide(answer, score, tokens), score, tokens
+
+    def _remember(self, key: Tuple[str, str, str], correct: bool) -> None:
+        self._cache[key] = correct
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    async def grade(
+        self,
+        question: str,
+        answer: CompiledAnswer,
+        user_answer: str,
+        judge: Optional[Judge] = None,
+    ) -> Verdict:
+        local, score, tokens = self.classify(answer, user_answer)
+        verdict = await self._resolve(
+            question, answer, user_answer, score, tokens, local, judge
+        )
+        self.stats.record(verdict.tier)
+        return verdict
+
+    async def _resolve(
+        self,
+        question: str,
+        answer: CompiledAnswer,
+        user_answer: str,
+        score: float,
+        tokens: Tuple[str, ...],
+        local: Optional[bool],
+        judge: Optional[Judge],
+    ) -> Verdict:
+        if local is not None or judge is None:
+            tier = Tier.LOCAL_ACCEPT if local else Tier.LOCAL_REJECT
+            return Verdict(bool(local), score, tier)
+
+        key = (question, answer.answer, " ".join(tokens))
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return Verdict(cached, score, Tier.CACHE)
+
+        prompt = GRADE_PROMPT.format(
+            question=question, answer=answer.answer, user_answer=user_answer.strip()
+        )
+        try:
+            correct = parse_judgement(await judge(prompt))
+        except Exception:
+            correct = None
+
+        if correct is None:
+            return Verdict(False, score, Tier.JUDGE_FAILED)
+
+        self._remember(key, correct)
+        return Verdict(correct, score, Tier.LLM)
+
+    async def grade_bulk(
+        self,
+        step: AnyStep,
+        answers: List[str],
+        judge: Optional[Judge] = None,
+        answer: Optional[CompiledAnswer] = None,
+        concurrency: int = BULK_JUDGE_CONCURRENCY,
+    ) -> BulkGrade:
+        answer = answer or compile_answer(step)
+        if judge is not None:
+            # A class-sized batch can hold hundreds of distinct ambiguous
+            # answers; only a few judge calls go out at a time.
+            judge = _bounded(judge, concurrency)
+
+        groups: Dict[Tuple[str, ...], List[int]] = {}
+        for i, text in enumerate(answers):
+            groups.setdefault(tokenize(text), []).append(i)
+        unique = list(groups)
+        scores = score_unique(answer, unique)
+
+        async def resolve(tokens: Tuple[str, ...], score: float) -> Verdict:
+            first = answers[groups[tokens][0]]
+            local = self.decide(answer, score, tokens)
+            return await self._resolve(
+                step.quiz_question, answer, first, score, tokens, local, judge
+            )
+
+        resolved = await asyncio.gather(
+            *(resolve(tokens, score) for tokens, score in zip(unique, scores))
+        )
+
+        verdicts: List[Optional[Verdict]] = [None] * len(answers)
+        clusters = []
+        for tokens, verdict in zip(unique, resolved):
+            indices = groups[tokens]
+            for n, i in enumerate(indices):
+                tier = Tier.CACHE if n and verdict.tier == Tier.LLM else verdict.tier
+                verdicts[i] = verdict._replace(tier=tier)
+                self.stats.record(tier)
+            if not verdict.correct:
+                clusters.append(
+                    AnswerCluster(
+                        answer=answers[indices[0]].strip(),
+                        normalized=" ".join(tokens),
+                        count=len(indices),
+                        indices=indices,
+                    )
+                )
+
+        clusters.sort(key=lambda c: -c.count)
+        return BulkGrade(verdicts=verdicts, clusters=clusters)
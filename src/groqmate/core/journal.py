@@ -0,0 +1,108 @@
+from pathlib import Path
+from groqmate.core.config import CONFIG_DIR
+from groqmate.core.models import CompactState
+from groqmate.core.state import Session
+from typing import Any, Dict, IO, Optional
+import os
+import pydantic_core
+
+SESSION_DIR = CONFIG_DIR / "session"
+
+# Transitions replayed from the event log. Plan loads and resets always
+# write a fresh snapshot, so the log only ever holds these small events.
+REPLAYABLE = {
+    "advance": Session.advance,
+    "back": Session.back,
+    "enter_quiz": Session.enter_quiz,
+    "exit_quiz": Session.exit_quiz,
+}
+
+
+class SessionJournal:
+    def __init__(self, directory: Path = SESSION_DIR, snapshot_every: int = 32):
+        self.directory = Path(directory)
+        self.snapshot_path = self.directory / "snapshot.json"
+        self.log_path = self.directory / "events.log"
+        self.snapshot_every = max(1, snapshot_every)
+        self.session: Optional[Session] = None
+        # The transcript of the journaled lesson, so a resume replays that
+        # lesson's chat and not whichever transcript is newest.
+        self.transcript: Optional[Path] = None
+        self._log: Optional[IO[str]] = None
+        self._pending = 0
+
+    def restore(self, session: Session) -> bool:
+        state = self._read_snapshot()
+        if state is None:
+            return False
+
+        session.restore(state)
+        if self.log_path.exists():
+            with open(self.log_path, encoding="utf-8") as f:
+                for line in f:
+                    transition = REPLAYABLE.get(line.strip())
+                    if transition:
+                        transition(session)
+                        self._pending += 1
+        return state.plan is not None
+
+    def _read_snapshot(self) -> Optional[CompactState]:
+        try:
+            data = pydantic_core.from_json(self.snapshot_path.read_bytes())
+            state = CompactState.validate(data)
+        except (OSError, ValueError):
+            return None
+        transcript = data.get("transcript")
+        self.transcript = Path(transcript) if transcript else None
+        return state
+
+    def attach(self, session: Session) -> None:
+        self.session = session
+        session.subscribe(self.record)
+
+    def detach(self) -> None:
+        if self.session:
+            self.session.unsubscribe(self.record)
+        self.session = None
+
+    def record(self, event: str, data: Dict[str, Any]) -> None:
+        if not self.session:
+            return
+        if event not in REPLAYABLE:
+            self.snapshot()
+            return
+
+        if self._log is None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._log = open(self.log_path, "a", encoding="utf-8")
+        self._log.write(event + "\n")
+        self._log.flush()
+        self._pending += 1
+        if self._pending >= self.snapshot_every:
+            self.snapshot()
+
+    def snapshot(self) -> None:
+        if not self.session:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp = self.snapshot_path.with_suffix(".tmp")
+        data = self.session.state.to_dict()
+        data["transcript"] = str(self.transcript) if self.transcript else None
+        tmp.write_bytes(pydantic_core.to_json(data))
+
+        # Drop the log before publishing the snapshot: a crash in between
+        # loses the last few events instead of replaying them twice.
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+        self.log_path.unlink(missing_ok=True)
+        os.replace(tmp, self.snapshot_path)
+        self._pending = 0
+
+    def close(self) -> None:
+        if self.session and self._pending:
+            self.snapshot()
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+        self.detach()
@@ -0,0 +1,222 @@
+from datetime import date, datetime
+from pathlib import Path
+from pydantic import BaseModel
+from groqmate.core.config import CONFIG_DIR
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+import time
+import uuid
+
+LEDGER_PATH = CONFIG_DIR / "usage.tsv"
+
+ROLLUP_KEYS = ("day", "session", "operation", "provider", "model")
+
+
+def estimate_tokens(text: str) -> int:
+    return max(1, len(text) // 4) if text else 0
+
+
+def _field(obj, name: str):
+    if isinstance(obj, dict):
+        return obj.get(name)
+    return getattr(obj, name, None)
+
+
+def _count(obj, name: str) -> int:
+    value = _field(obj, name)
+    return value if isinstance(value, int) else 0
+
+
+def read_usage(response) -> Optional[Tuple[int, int, int]]:
+    usage = _field(response, "usage")
+    if usage is None:
+        return None
+    prompt = _count(usage, "prompt_tokens")
+    completion = _count(usage, "completion_tokens")
+    if not prompt and not completion:
+        return None
+    details = _field(usage, "prompt_tokens_details")
+    cached = _count(details, "cached_tokens") if details is not None else 0
+    return prompt, completion, cached or _count(usage, "cache_read_input_tokens")
+
+
+def estimate_cost(model: str, prompt_tokens: int, completion_tokens: int) -> float:
+    try:
+        from litellm import cost_per_token
+
+        prompt_cost, completion_cost = cost_per_token(
+            model=model,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+        )
+    except Exception:
+        return 0.0
+    return prompt_cost + completion_cost
+
+
+class UsageRecord(BaseModel):
+    timestamp: float
+    session: str
+    operation: str
+    provider: str
+    model: str
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cached_tokens: int = 0
+    latency: float = 0.0
+    cost: float = 0.0
+
+    @property
+    def day(self) -> str:
+        return datetime.fromtimestamp(self.timestamp).date().isoformat()
+
+    def to_line(self) -> str:
+        return "\t".join(
+            [
+                f"{self.timestamp:.3f}",
+                self.session,
+                self.operation,
+                self.provider,
+                self.model,
+                str(self.prompt_tokens),
+                str(self.completion_tokens),
+                str(self.cached_tokens),
+                str(round(self.latency * 1000)),
+                f"{self.cost:.8g}",
+            ]
+        )
+
+    @classmethod
+    def from_line(cls, line: str) -> "UsageRecord":
+        ts, session, operation, provider, model, p, c, cached, ms, cost = line.rstrip(
+            "\n"
+        ).split("\t")
+        return cls(
+            timestamp=float(ts),
+            session=session,
+            operation=operation,
+            provider=provider,
+            model=model,
+            prompt_tokens=int(p),
+            completion_tokens=int(c),
+            cached_tokens=int(cached),
+            latency=int(ms) / 1000,
+            cost=float(cost),
+        )
+
+
+class Rollup(BaseModel):
+    calls: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cached_tokens: int = 0
+    latency: float = 0.0
+    cost: float = 0.0
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+    @property
+    def avg_latency(self) -> float:
+        return self.latency / self.calls if self.calls else 0.0
+
+    def add(self, record: UsageRecord) -> None:
+        self.calls += 1
+        self.prompt_tokens += record.prompt_tokens
+        self.completion_tokens += record.completion_tokens
+        self.cached_tokens += record.cached_tokens
+        self.latency += record.latency
+        self.cost += record.cost
+
+
+def rollup(
+    records: Iterable[UsageRecord], by: Iterable[str] = ("day", "provider", "operation")
+) -> Dict[Tuple[str, ...], Rollup]:
+    keys = tuple(by)
+    for key in keys:
+        if key not in ROLLUP_KEYS:
+            raise ValueError(f"Unknown rollup key: {key}")
+
+    groups: Dict[Tuple[str, ...], Rollup] = {}
+    for record in records:
+        group = tuple(getattr(record, key) for key in keys)
+        groups.setdefault(group, Rollup()).add(record)
+    return dict(sorted(groups.items()))
+
+
+class UsageLedger:
+    def __init__(self, path: Optional[Path] = None, session: Optional[str] = None):
+        self.path = path
+        self.session = session or uuid.uuid4().hex[:8]
+        self.totals = Rollup()
+        self.operations: Dict[str, Rollup] = {}
+
+    def record(
+        self,
+        operation: str,
+        provider: str,
+        model: str,
+        prompt_tokens: int,
+        completion_tokens: int,
+        cached_tokens: int = 0,
+        latency: float = 0.0,
+        cost: Optional[float] = None,
+    ) -> UsageRecord:
+        if cost is None:
+            cost = estimate_cost(model, prompt_tokens, completion_tokens)
+        record = UsageRecord(
+            timestamp=time.time(),
+            session=self.session,
+            operation=operation,
+            provider=provider,
+            model=model,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            cached_tokens=cached_tokens,
+            latency=latency,
+            cost=cost,
+        )
+        self.totals.add(record)
+        self.operations.setdefault(operation, Rollup()).add(record)
+
+        if self.path:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(record.to_line() + "\n")
+        return record
+
+    def records(self, since: Optional[date] = None) -> Iterator[UsageRecord]:
+        if not self.path or not self.path.exists():
+            return
+        cutoff = since.isoformat() if since else None
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = UsageRecord.from_line(line)
+                except ValueError:
+                    continue
+                if cutoff and record.day < cutoff:
+                    continue
+                yield record
+
+    def rollup(
+        self,
+        by: Iterable[str] = ("day", "provider", "operation"),
+        since: Optional[date] = None,
+    ) -> Dict[Tuple[str, ...], Rollup]:
+        return rollup(self.records(since), by)
+
+    def report(self) -> str:
+        totals = self.totals
+        parts: List[str] = [
+            f"Tokens this session: {totals.total_tokens:,} "
+            f"({totals.cached_tokens:,} cached) in {totals.calls} calls"
+        ]
+        if totals.cost:
+            parts.append(f"~${totals.cost:.4f}")
+        if totals.total_tokens:
+            top, usage = max(
+                self.operations.items(), key=lambda item: item[1].total_tokens
+            )
+            parts.append(f"{top} {usage.total_tokens / totals.total_tokens:.0%}")
+        return ", ".join(parts)
@@ -0,0 +1,290 @@
+from groqmate.core.models import AnyStep
+from typing import FrozenSet, List, NamedTuple, Tuple
+import re
+import unicodedata
+
+SYMBOLS = {
+    "≤": " <= ",
+    "≥": " >= ",
+    "≠": " != ",
+    "×": " * ",
+    "·": " * ",
+    "÷": " / ",
+    "−": "-",
+    "–": "-",
+    "—": " ",
+    "√": " sqrt ",
+    "π": " pi ",
+    "∞": " infinity ",
+    "→": " -> ",
+    "∑": " sum ",
+    "∫": " integral ",
+    "²": "^2",
+    "³": "^3",
+    "½": " 0.5 ",
+    "¼": " 0.25 ",
+}
+
+NUMBER_WORDS = {
+    "zero": "0",
+    "one": "1",
+    "two": "2",
+    "three": "3",
+    "four": "4",
+    "five": "5",
+    "six": "6",
+    "seven": "7",
+    "eight": "8",
+    "nine": "9",
+    "ten": "10",
+    "eleven": "11",
+    "twelve": "12",
+    "twenty": "20",
+    "hundred": "100",
+    "thousand": "1000",
+    "million": "1000000",
+    "half": "0.5",
+    "once": "1",
+    "twice": "2",
+}
+
+COMPLEXITY = {
+    "1": "constant",
+    "logn": "logarithmic",
+    "n": "linear",
+    "nlogn": "linearithmic",
+    "n^2": "quadratic",
+    "n*n": "quadratic",
+    "n^3": "cubic",
+    "2^n": "exponential",
+    "n!": "factorial",
+}
+
+STOPWORDS = frozenset(
+    {
+        "a",
+        "an",
+        "and",
+        "are",
+        "as",
+        "at",
+        "be",
+        "by",
+        "called",
+        "for",
+        "from",
+        "in",
+        "is",
+        "it",
+        "its",
+        "of",
+        "on",
+        "or",
+        "that",
+        "the",
+        "their",
+        "then",
+        "there",
+        "this",
+        "to",
+        "using",
+        "was",
+        "which",
+        "with",
+        "you",
+    }
+)
+
+OPERATORS = frozenset(
+    {"<", ">", "<=", ">=", "==", "!=", "=", "+", "-", "*", "/", "^", "%"}
+)
+
+NEGATING_PREFIXES = ("a", "il", "im", "in", "ir", "un")
+
+_SUFFIXES = (
+    ("ational", "ate"),
+    ("ization", "ize"),
+    ("iveness", "ive"),
+    ("fulness", "ful"),
+    ("ousness", "ous"),
+    ("ies", "y"),
+    ("sses", "ss"),
+    ("ing", ""),
+    ("edly", ""),
+    ("ed", ""),
+    ("ly", ""),
+)
+
+_SYMBOL_TABLE = str.maketrans(SYMBOLS)
+_COMPLEXITY_RE = re.compile(r"\bo\s*\(\s*([^()]*?)\s*\)")
+_TOKEN_RE = re.compile(r"\d+(?:\.\d+)?|[^\W\d_]+|[<>!=]=|->|[<>^*/+=%-]")
+# A hyphen inside a word ("base-case", "x-axis") splits it; next to a digit or
+# between single-letter operands ("n-1", "-1", "i-j") it is a minus sign.
+_PUNCT_RE = re.compile(
+    r"[_'’`\"]|(?<=[^\W\d_]{2})-(?=[^\W\d_])|(?<=[^\W\d_])-(?=[^\W\d_]{2})"
+)
+
+
+def _complexity(match: re.Match) -> str:
+    inner = re.sub(r"\s+|\blg\b", "", match.group(1)).replace("log(n)", "logn")
+    return f" {COMPLEXITY.get(inner, match.group(0))} "
+
+
+def stem(word: str) -> str:
+    if len(word) <= 3 or not word.isalpha():
+        return word
+    for suffix, replacement in _SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            word = word[: -len(suffix)] + replacement
+            if (
+                not replacement
+                and len(word) > 3
+                and word[-1] == word[-2]
+                and word[-1] not in "lsz"
+            ):
+                word = word[:-1]
+            break
+    else:
+        if word.endswith("s") and not word.endswith(("ss", "us", "is")):
+            word = word[:-1]
+    if len(word) > 3 and word.endswith("e"):
+        word = word[:-1]
+    return word
+
+
+def _number(token: str) -> str:
+    token = NUMBER_WORDS.get(token, token)
+    if token[0].isdigit():
+        value = float(token)
+        return str(int(value)) if value.is_integer() else repr(value)
+    return token
+
+
+def tokenize(text: str) -> Tuple[str, ...]:
+    if not text.isascii():
+        text = unicodedata.normalize("NFKC", text.translate(_SYMBOL_TABLE))
+        text = unicodedata.normalize("NFKD", text)
+        text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    text = _COMPLEXITY_RE.sub(_complexity, text.casefold())
+    text = _PUNCT_RE.sub(" ", text)
+    return tuple(
+        _number(token) for token in _TOKEN_RE.findall(text) if token not in STOPWORDS
+    )
+
+
+def normalize(text: str) -> Tuple[str, ...]:
+    return tuple(stem(token) for token in tokenize(text))
+
+
+def within_distance(a: str, b: str, limit: int) -> bool:
+    if abs(len(a) - len(b)) > limit:
+        return False
+    if a == b:
+        return True
+    if limit == 0:
+        return False
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(
+                min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb))
+            )
+        if min(current) > limit:
+            return False
+        previous = current
+    return previous[-1] <= limit
+
+
+def typo_budget(token: str) -> int:
+    if len(token) >= 9:
+        return 2
+    if len(token) >= 5 and token.isalpha():
+        return 1
+    return 0
+
+
+def negates(a: str, b: str) -> bool:
+    longer, shorter = (a, b) if len(a) > len(b) else (b, a)
+    return any(longer == prefix + shorter for prefix in NEGATING_PREFIXES)
+
+
+def typo_match(expected: str, token: str) -> bool:
+    budget = typo_budget(expected)
+    return (
+        budget > 0
+        and not negates(expected, token)
+        and within_distance(expected, token, budget)
+    )
+
+
+class MatchResult(NamedTuple):
+    correct: bool
+    score: float
+
+
+class CompiledAnswer:
+    __slots__ = ("answer", "forms", "joined", "operators", "threshold")
+
+    def __init__(self, answer: str, synonyms: List[str] = (), threshold: float = 1.0):
+        self.answer = answer
+        self.threshold = threshold
+        forms = []
+        joined = set()
+        for text in (answer, *synonyms):
+            raw = tokenize(text)
+            tokens = tuple(stem(t) for t in raw)
+            if tokens and tokens not in forms:
+                forms.append(tokens)
+                joined.add(stem("".join(raw)))
+        self.forms: List[Tuple[str, ...]] = forms
+        self.joined: FrozenSet[str] = frozenset(joined)
+        self.operators: List[FrozenSet[str]] = [
+            OPERATORS.intersection(form) for form in forms
+        ]
+
+    def conflicts(self, form: int, tokens: FrozenSet[str]) -> bool:
+        # A different operator or a negated term changes the meaning, however
+        # many of the other tokens match.
+        if OPERATORS.intersection(tokens) != self.operators[form]:
+            return True
+        return any(
+            negates(expected, token)
+            for expected in self.forms[form]
+            if expected not in tokens
+            for token in tokens
+        )
+
+    def _covered(self, form: Tuple[str, ...], tokens: FrozenSet[str]) -> int:
+        matched = 0
+        for expected in form:
+            if expected in tokens or any(typo_match(expected, t) for t in tokens):
+                matched += 1
+        return matched
+
+    def score(self, user_answer: str) -> float:
+        return self.score_tokens(tokenize(user_answer))
+
+    def score_tokens(self, raw: Tuple[str, ...]) -> float:
+        if not raw or not self.forms:
+            return 0.0
+        if stem("".join(raw)) in self.joined:
+            return 1.0
+
+        token_set = frozenset(stem(t) for t in raw)
+        return max(
+            (
+                0.0
+                if self.conflicts(i, token_set)
+                else self._covered(form, token_set) / len(form)
+            )
+            for i, form in enumerate(self.forms)
+        )
+
+    def check(self, user_answer: str) -> MatchResult:
+        score = self.score(user_answer)
+        return MatchResult(correct=score >= self.threshold, score=score)
+
+
+def compile_answer(step: AnyStep) -> CompiledAnswer:
+    return CompiledAnswer(step.quiz_answer, step.accepted_answers)
@@ -1,6 +1,10 @@
+from dataclasses import dataclass, field
 from enum import Enum
-from pydantic import BaseModel, Field
-from typing import List, Optional
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+from typing import List, NamedTuple, Optional, Tuple, Union
+import pydantic_core
+
+_new_tuple = tuple.__new__
 
 
 class SessionStatus(str, Enum):
@@ -17,6 +21,7 @@ class LessonStep(BaseModel):
     concept: str
     quiz_question: str
     quiz_answer: str
+    accepted_answers: List[str] = Field(default_factory=list)
 
 
 class LessonPlan(BaseModel):
@@ -33,3 +38,162 @@ class SessionState(BaseModel):
     current_step: int = 0
     completed: List[int] = Field(default_factory=list)
     status: SessionStatus = SessionStatus.IDLE
+
+
+# Runtime forms. The pydantic models above validate data at the edges (LLM
+# output, config, user input); sessions and plan caches hold these instead.
+
+
+class CompactStep(NamedTuple):
+    index: int
+    title: str
+    concept: str
+    quiz_question: str
+    quiz_answer: str
+    accepted_answers: Tuple[str, ...] = ()
+
+    @classmethod
+    def from_model(cls, step: LessonStep) -> "CompactStep":
+        return cls(
+            step.index,
+            step.title,
+            step.concept,
+            step.quiz_question,
+            step.quiz_answer,
+            tuple(step.accepted_answers),
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "CompactStep":
+        # Every field is supplied, so skip the generated __new__ and its
+        # default handling; this runs once per step on every plan load.
+        return _new_tuple(
+            cls,
+            (
+                data["index"],
+                data["title"],
+                data["concept"],
+                data["quiz_question"],
+                data["quiz_answer"],
+                tuple(data.get("accepted_answers", ())),
+            ),
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "index": self.index,
+            "title": self.title,
+            "concept": self.concept,
+            "quiz_question": self.quiz_question,
+            "quiz_answer": self.quiz_answer,
+            "accepted_answers": list(self.accepted_answers),
+        }
+
+    def to_model(self) -> LessonStep:
+        return LessonStep.model_construct(**self.to_dict())
+
+
+class CompactPlan(NamedTuple):
+    topic: str
+    steps: Tuple[CompactStep, ...] = ()
+
+    @property
+    def total_steps(self) -> int:
+        return len(self.steps)
+
+    @classmethod
+    def from_model(cls, plan: LessonPlan) -> "CompactPlan":
+        return cls(plan.topic, tuple(CompactStep.from_model(s) for s in plan.steps))
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "CompactPlan":
+        try:
+            steps = tuple([CompactStep.from_dict(s) for s in data.get("steps", ())])
+            return _new_tuple(cls, (data["topic"], steps))
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"Malformed lesson plan: {e}") from e
+
+    @classmethod
+    def from_json(cls, data: Union[str, bytes]) -> "CompactPlan":
+        return cls.from_dict(pydantic_core.from_json(data))
+
+    @classmethod
+    def validate_json(cls, data: Union[str, bytes]) -> "CompactPlan":
+        try:
+            return _PLAN.validate_json(data)
+        except ValidationError as e:
+            raise ValueError(f"Malformed lesson plan: {e}") from e
+
+    def to_dict(self) -> dict:
+        return {"topic": self.topic, "steps": [s.to_dict() for s in self.steps]}
+
+    def to_json(self) -> str:
+        return pydantic_core.to_json(self.to_dict()).decode()
+
+    def to_model(self) -> LessonPlan:
+        steps = [s.to_model() for s in self.steps]
+        return LessonPlan.model_construct(topic=self.topic, steps=steps)
+
+
+# from_dict/from_json trust their input and build the tuples directly. Data
+# from outside the process (lesson packs, journal snapshots, daemon requests)
+# is checked once on arrival through these instead.
+_PLAN = TypeAdapter(CompactPlan)
+
+AnyStep = Union[LessonStep, CompactStep]
+AnyPlan = Union[LessonPlan, CompactPlan]
+
+
+def as_compact(plan: AnyPlan) -> CompactPlan:
+    if isinstance(plan, CompactPlan):
+        return plan
+    return CompactPlan.from_model(plan)
+
+
+@dataclass(slots=True)
+class CompactState:
+    plan: Optional[CompactPlan] = None
+    current_step: int = 0
+    completed: List[int] = field(default_factory=list)
+    status: SessionStatus = SessionStatus.IDLE
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "CompactState":
+        plan = data.get("plan")
+        return cls(
+            CompactPlan.from_dict(plan) if plan else None,
+            data.get("current_step", 0),
+            list(data.get("completed", ())),
+            SessionStatus(data.get("status", SessionStatus.IDLE)),
+        )
+
+    @classmethod
+    def validate(cls, data: dict) -> "CompactState":
+        try:
+            return _STATE.validate_python(data)
+        except ValidationError as e:
+            raise ValueError(f"Malformed session state: {e}") from e
+
+    def to_dict(self) -> dict:
+        return {
+            "plan": self.plan.to_dict() if self.plan else None,
+            "current_step": self.current_step,
+            "completed": list(self.completed),
+            "status": self.status.value,
+        }
+
+    @classmethod
+    def from_model(cls, state: SessionState) -> "CompactState":
+        plan = CompactPlan.from_model(state.plan) if state.plan else None
+        return cls(plan, state.current_step, list(state.completed), state.status)
+
+    def to_model(self) -> SessionState:
+        return SessionState(
+            plan=self.plan.to_model() if self.plan else None,
+            current_step=self.current_step,
+            completed=list(self.completed),
+            status=self.status,
+        )
+
+
+_STATE = TypeAdapter(CompactState)
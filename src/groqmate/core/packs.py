@@ -0,0 +1,271 @@
+from pathlib import Path
+from groqmate.core.models import AnyPlan, CompactPlan, CompactStep, as_compact
+from groqmate.core.state import Session
+from groqmate.core.topics import TopicIndex, normalize_topic
+from groqmate.core.grading import Grader
+from groqmate.core.ledger import UsageLedger
+from groqmate.core.tutor import Tutor, answer_feedback
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Set
+import re
+import sqlite3
+
+PACK_FORMAT = "1"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS plans (key TEXT PRIMARY KEY, plan TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS aliases (alias TEXT PRIMARY KEY, key TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS texts (
+    key TEXT NOT NULL,
+    step INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    variant INTEGER NOT NULL DEFAULT 0,
+    body TEXT NOT NULL,
+    PRIMARY KEY (key, step, kind, variant)
+);
+"""
+
+EXPLANATION = "explain"
+ANALOGY = "rephrase"
+SUMMARY = "summary"
+
+_CHUNK_RE = re.compile(r"\S+\s*|\s+")
+
+
+class LessonPackWriter:
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.path)
+        self._db.executescript(SCHEMA)
+        self._db.execute(
+            "INSERT OR REPLACE INTO meta (name, value) VALUES ('format', ?)",
+            (PACK_FORMAT,),
+        )
+        self._db.commit()
+
+    def __enter__(self) -> "LessonPackWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def topics(self) -> Set[str]:
+        rows = self._db.execute("SELECT alias FROM aliases")
+        return {alias for (alias,) in rows}
+
+    def add_lesson(
+        self,
+        plan: AnyPlan,
+        explanations: Optional[Dict[int, str]] = None,
+        analogies: Optional[Dict[int, List[str]]] = None,
+        summary: Optional[str] = None,
+        topic: Optional[str] = None,
+    ) -> None:
+        plan = as_compact(plan)
+        key = normalize_topic(plan.topic)
+        rows = [
+            (key, step, EXPLANATION, 0, body)
+            for step, body in (explanations or {}).items()
+        ]
+        for step, bodies in (analogies or {}).items():
+            rows.extend(
+                (key, step, ANALOGY, variant, body)
+                for variant, body in enumerate(bodies)
+            )
+        if summary:
+            rows.append((key, -1, SUMMARY, 0, summary))
+
+        aliases = {key}
+        if topic:
+            aliases.add(normalize_topic(topic))
+
+        with self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO plans (key, plan) VALUES (?, ?)",
+                (key, plan.to_json()),
+            )
+            self._db.execute("DELETE FROM texts WHERE key = ?", (key,))
+            self._db.executemany(
+                "INSERT INTO texts (key, step, kind, variant, body) VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._db.executemany(
+                "INSERT OR REPLACE INTO aliases (alias, key) VALUES (?, ?)",
+                [(alias, key) for alias in aliases if alias],
+            )
+
+    def close(self) -> None:
+        self._db.close()
+
+
+class LessonPack:
+    def __init__(self, path: Path, threshold: float = 0.6, mmap_size: int = 256 << 20):
+        self.path = Path(path)
+        if not self.path.exists():
+            raise FileNotFoundError(f"Lesson pack not found: {self.path}")
+
+        self._db = sqlite3.connect(
+            f"{self.path.resolve().as_uri()}?mode=ro", uri=True, check_same_thread=False
+        )
+        self._db.execute(f"PRAGMA mmap_size = {int(mmap_size)}")
+        self._index = TopicIndex(threshold=threshold)
+        self._aliases: Optional[Dict[str, str]] = None
+        self._plans: Dict[str, CompactPlan] = {}
+        self._rephrase_turns: Dict[tuple, int] = {}
+
+    def _ensure_index(self) -> Dict[str, str]:
+        if self._aliases is None:
+            self._aliases = dict(self._db.execute("SELECT alias, key FROM aliases"))
+            for alias in self._aliases:
+                self._index.add_key(alias)
+        return self._aliases
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM plans").fetchone()[0]
+
+    def _plan_for_key(self, key: str) -> Optional[CompactPlan]:
+        plan = self._plans.get(key)
+        if plan is None:
+            row = self._db.execute(
+                "SELECT plan FROM plans WHERE key = ?", (key,)
+            ).fetchone()
+            if not row:
+                return None
+            plan = CompactPlan.validate_json(row[0])
+            self._plans[key] = plan
+        return plan
+
+    def find_plan(self, topic: str) -> Optional[CompactPlan]:
+        aliases = self._ensure_index()
+        found = self._index.match(topic)
+        if not found:
+            return None
+        return self._plan_for_key(aliases[found[0]])
+
+    def _key_for_step(self, plan: AnyPlan, step: CompactStep) -> Optional[str]:
+        key = normalize_topic(plan.topic)
+        stored = self._plan_for_key(key)
+        if not stored or step.index >= stored.total_steps:
+            return None
+        if stored.steps[step.index].title != step.title:
+            return None
+        return key
+
+    def _texts(self, key: str, step: int, kind: str) -> List[str]:
+        rows = self._db.execute(
+            "SELECT body FROM texts WHERE key = ? AND step = ? AND kind = ? ORDER BY variant",
+            (key, step, kind),
+        )
+        return [body for (body,) in rows]
+
+    def explanation(self, plan: AnyPlan, step: CompactStep) -> Optional[str]:
+        key = self._key_for_step(plan, step)
+        if not key:
+            return None
+        texts = self._texts(key, step.index, EXPLANATION)
+        return texts[0] if texts else None
+
+    def analogy(self, plan: AnyPlan, step: CompactStep) -> Optional[str]:
+        key = self._key_for_step(plan, step)
+        if not key:
+            return None
+        texts = self._texts(key, step.index, ANALOGY)
+        if not texts:
+            return None
+        turn = self._rephrase_turns.get((key, step.index), 0)
+        self._rephrase_turns[(key, step.index)] = turn + 1
+        return texts[turn % len(texts)]
+
+    def summary(self, plan: AnyPlan) -> Optional[str]:
+        key = normalize_topic(plan.topic)
+        if self._plan_for_key(key) is None:
+            return None
+        texts = self._texts(key, -1, SUMMARY)
+        return texts[0] if texts else None
+
+    def close(self) -> None:
+        self._db.close()
+
+
+def _chunks(text: str) -> Iterable[str]:
+    return _CHUNK_RE.findall(text)
+
+
+class PackTutor:
+    def __init__(self, pack: LessonPack, fallback: Optional[Tutor] = None):
+        self.pack = pack
+        self.fallback = fallback
+        self.grader = fallback.grader if fallback else Grader()
+        self.ledger = fallback.ledger if fallback else UsageLedger()
+
+    async def generate_plan(self, topic: str) -> AnyPlan:
+        plan = self.pack.find_plan(topic)
+        if plan:
+            return plan
+        if self.fallback:
+            return await self.fallback.generate_plan(topic)
+        raise ValueError(
+            f"'{topic}' is not in the lesson pack and no provider is configured."
+        )
+
+    async def explain_step_stream(self, session: Session) -> AsyncIterator[str]:
+        step = session.current_step()
+        plan = session.state.plan
+        text = self.pack.explanation(plan, step) if step and plan else None
+
+        if text is None and self.fallback:
+            async for token in self.fallback.explain_step_stream(session):
+                yield token
+            return
+
+        if text is None and step:
+            text = f"{step.concept}\n\nQuiz: {step.quiz_question}"
+
+        for token in _chunks(text or "No active lesson. Start with 'Teach me <topic>'"):
+            yield token
+
+    async def rephrase_stream(self, session: Session) -> AsyncIterator[str]:
+        step = session.current_step()
+        plan = session.state.plan
+        text = self.pack.analogy(plan, step) if step and plan else None
+
+        if text is None and self.fallback:
+            async for token in self.fallback.rephrase_stream(session):
+                yield token
+            return
+
+        if text is None:
+            text = "No alternative explanation is available offline for this step."
+
+        for token in _chunks(text):
+            yield token
+
+    async def check_answer(
+        self, user_answer: str, session: Session
+    ) -> tuple[bool, str]:
+        if self.fallback:
+            return await self.fallback.check_answer(user_answer, session)
+
+        step = session.current_step()
+        answer = session.current_answer()
+        if not step or not answer:
+            return False, "No active lesson."
+        verdict = await self.grader.grade(step.quiz_question, answer, user_answer)
+        return verdict.correct, answer_feedback(verdict.correct, verdict.score, answer)
+
+    async def generate_summary(self, session: Session) -> str:
+        plan = session.state.plan
+        if not plan:
+            return "No lesson to summarize."
+
+        summary = self.pack.summary(plan)
+        if summary:
+            return summary
+        if self.fallback:
+            return await self.fallback.generate_summary(session)
+
+        sections = [f"# {plan.topic}"]
+        for i, step in enumerate(plan.steps):
+            sections.append(f"## {i + 1}. {step.title}\n\n- {step.concept}")
+        return "\n\n".join(sections)
@@ -0,0 +1,86 @@
+from groqmate.core.config import Config
+from groqmate.core.ledger import UsageLedger
+from groqmate.core.providers import ProviderConfig
+from groqmate.core.tutor import Tutor
+from typing import Dict, Optional, Tuple
+import asyncio
+import time
+
+IDLE_TIMEOUT = 600.0
+MAX_REQUESTS = 3
+
+PoolKey = Tuple[str, str, str, Optional[str]]
+
+
+class TutorPool:
+    def __init__(
+        self,
+        ledger: Optional[UsageLedger] = None,
+        idle_timeout: float = IDLE_TIMEOUT,
+        max_requests: int = MAX_REQUESTS,
+    ):
+        self.ledger = ledger or UsageLedger()
+        self.idle_timeout = idle_timeout
+        self.max_requests = max_requests
+        self.limiter = asyncio.Semaphore(max(1, max_requests))
+        self.current: Optional[PoolKey] = None
+        self._tutors: Dict[PoolKey, Tutor] = {}
+        self._used: Dict[PoolKey, float] = {}
+
+    @staticmethod
+    def key(provider_config: ProviderConfig, config: Config) -> PoolKey:
+        provider = provider_config.provider.value
+        return (
+            provider,
+            provider_config.get_model_string(),
+            provider_config.get_grader_model_string(config.settings.grader_model),
+            None if provider_config.is_local() else config.get_api_key(provider),
+        )
+
+    def __len__(self) -> int:
+        return len(self._tutors)
+
+    def get(
+        self,
+        provider_config: ProviderConfig,
+        config: Config,
+        now: Optional[float] = None,
+    ) -> Tutor:
+        now = time.monotonic() if now is None else now
+        key = self.key(provider_config, config)
+        tutor = self._tutors.get(key)
+        if tutor is None:
+            tutor = Tutor(provider_config, config, self.ledger)
+            tutor.limiter = self.limiter
+            self._tutors[key] = tutor
+        else:
+            # Settings outside the key, like llm_grading, apply immediately.
+            tutor.config = config
+        self._used[key] = now
+        self.current = key
+        self.evict_idle(now)
+        return tutor
+
+    def set_max_requests(self, max_requests: int) -> None:
+        # Requests already holding a slot release it on the old limiter;
+        # new ones queue on the new cap.
+        if max_requests == self.max_requests:
+            return
+        self.max_requests = max_requests
+        self.limiter = asyncio.Semaphore(max(1, max_requests))
+        for tutor in self._tutors.values():
+            tutor.limiter = self.limiter
+
+    def evict_idle(self, now: Optional[float] = None) -> int:
+        # Dropping a Tutor only removes it from the pool; a stream still
+        # running on it holds its own reference and finishes normally.
+        now = time.monotonic() if now is None else now
+        stale = [
+            key
+            for key, used in self._used.items()
+            if key != self.current and now - used >= self.idle_timeout
+        ]
+        for key in stale:
+            del self._tutors[key]
+            del self._used[key]
+        return len(stale)
@@ -0,0 +1,361 @@
+from pathlib import Path
+from groqmate.core.config import CONFIG_DIR
+from groqmate.core.models import CompactState
+from groqmate.core.topics import normalize_topic
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+import queue
+import sqlite3
+import threading
+import time
+
+PROGRESS_PATH = CONFIG_DIR / "progress.db"
+
+# Raw lessons and events are kept for ad-hoc queries; topic_totals and
+# step_totals are rollups updated in the same transaction, so stats never
+# scan the history.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS lessons (
+    id INTEGER PRIMARY KEY,
+    topic TEXT NOT NULL,
+    title TEXT NOT NULL,
+    steps INTEGER NOT NULL,
+    completed INTEGER NOT NULL DEFAULT 0,
+    started REAL NOT NULL,
+    finished REAL
+);
+CREATE INDEX IF NOT EXISTS lessons_by_topic ON lessons (topic, finished);
+CREATE TABLE IF NOT EXISTS events (
+    lesson INTEGER NOT NULL,
+    step INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS events_by_step ON events (lesson, step, kind);
+CREATE TABLE IF NOT EXISTS topic_totals (
+    topic TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    lessons INTEGER NOT NULL DEFAULT 0,
+    finished INTEGER NOT NULL DEFAULT 0
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS step_totals (
+    topic TEXT NOT NULL,
+    step INTEGER NOT NULL,
+    title TEXT NOT NULL DEFAULT '',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    correct INTEGER NOT NULL DEFAULT 0,
+    wtf INTEGER NOT NULL DEFAULT 0,
+    completed INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (topic, step)
+) WITHOUT ROWID;
+"""
+
+CORRECT = "correct"
+WRONG = "wrong"
+WTF = "wtf"
+COMPLETE = "complete"
+
+_TOTAL_COLUMNS = {CORRECT: "attempts", WRONG: "attempts", WTF: "wtf"}
+_MAX_BATCH = 1024
+
+
+class TopicProgress(NamedTuple):
+    topic: str
+    lessons: int
+    finished: int
+    attempts: int
+    correct: int
+    wtf: int
+
+    @property
+    def completion_rate(self) -> float:
+        return self.finished / self.lessons if self.lessons else 0.0
+
+    @property
+    def accuracy(self) -> float:
+        return self.correct / self.attempts if self.attempts else 0.0
+
+
+class StepProgress(NamedTuple):
+    step: int
+    title: str
+    attempts: int
+    correct: int
+    wtf: int
+    completed: int
+
+    @property
+    def attempts_per_pass(self) -> float:
+        return self.attempts / self.correct if self.correct else 0.0
+
+
+def connect(path: Path, readonly: bool = False) -> sqlite3.Connection:
+    path = Path(path)
+    if readonly:
+        return sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    db = sqlite3.connect(path, check_same_thread=False)
+    db.execute("PRAGMA journal_mode = WAL")
+    db.execute("PRAGMA synchronous = NORMAL")
+    db.executescript(SCHEMA)
+    return db
+
+
+class ProgressTracker:
+    # Follows one session's lesson; any number of trackers share a store.
+    def __init__(self, store: "ProgressStore"):
+        self.store = store
+        self.topic: Optional[str] = None
+        self.step = 0
+        # The open lesson row, only touched on the store's writer thread.
+        self.lesson: Optional[Tuple[int, str]] = None
+
+    def _put(self, op: str, *args: Any) -> None:
+        self.store._put(op, self, *args)
+
+    def observe(self, event: str, data: Dict[str, Any]) -> None:
+        if event == "load_plan":
+            plan = data["plan"]
+            self.topic = normalize_topic(plan.topic)
+            self.step = 0
+            titles = [step.title for step in plan.steps]
+            self._put("lesson", self.topic, plan.topic, titles, time.time())
+        elif event == "reset":
+            self.topic = None
+        elif self.topic is None:
+            return
+        elif event == "advance":
+            completed = self.step
+            self.step = data["step"]
+            self._put("complete", completed, data["complete"], time.time())
+        elif "step" in data:
+            self.step = data["step"]
+
+    def resume(self, state: CompactState) -> None:
+        if not state.plan:
+            return
+        self.topic = normalize_topic(state.plan.topic)
+        self.step = state.current_step
+        titles = [step.title for step in state.plan.steps]
+        self._put("resume", self.topic, state.plan.topic, titles, time.time())
+
+    def attempt(self, correct: bool) -> None:
+        if self.topic is not None:
+            self._put("event", self.step, CORRECT if correct else WRONG, time.time())
+
+    def wtf(self) -> None:
+        if self.topic is not None:
+            self._put("event", self.step, WTF, time.time())
+
+
+class ProgressStore:
+    # One writer thread and connection per database, however many sessions
+    # are tracked, so tabs never contend for the WAL write lock.
+    def __init__(
+        self,
+        path: Path = PROGRESS_PATH,
+        on_error: Optional[Callable[[Exception], None]] = None,
+    ):
+        self.path = Path(path)
+        self.on_error = on_error
+        self.error: Optional[Exception] = None
+        self.failed = 0
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+
+    def track(self) -> ProgressTracker:
+        return ProgressTracker(self)
+
+    def _put(self, op: str, *args: Any) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="progress-writer", daemon=True
+            )
+            self._thread.start()
+        self._queue.put((op, args))
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        if self._thread is None:
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            return
+        self._queue.put(None)
+        self._thread.join(timeout=5.0)
+
+    def _fail(self, error: Exception) -> None:
+        # Runs on the writer thread. Only the first failure is reported, so
+        # a database that stays locked does not repeat the same message.
+        self.failed += 1
+        first = self.error is None
+        self.error = error
+        if first and self.on_error:
+            self.on_error(error)
+
+    def _run(self) -> None:
+        try:
+            db = connect(self.path)
+        except (sqlite3.Error, OSError) as e:
+            self._fail(e)
+            return
+        try:
+            stop = False
+            while not stop:
+                batch = [self._queue.get()]
+                while len(batch) < _MAX_BATCH:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+                stop = None in batch
+                self._write(db, batch)
+        finally:
+            db.close()
+
+    def _write(self, db: sqlite3.Connection, batch: List) -> None:
+        waiters = [item for item in batch if isinstance(item, threading.Event)]
+        try:
+            with db:
+                for item in batch:
+                    if isinstance(item, tuple):
+                        op, args = item
+                        getattr(self, f"_write_{op}")(db, *args)
+        except sqlite3.Error as e:
+            self._fail(e)
+        finally:
+            for waiter in waiters:
+                waiter.set()
+
+    def _ensure_steps(
+        self, db: sqlite3.Connection, topic: str, titles: List[str]
+    ) -> None:
+        db.executemany(
+            "INSERT INTO step_totals (topic, step, title) VALUES (?, ?, ?) "
+            "ON CONFLICT (topic, step) DO UPDATE SET title = excluded.title",
+            [(topic, step, title) for step, title in enumerate(titles)],
+        )
+
+    def _write_lesson(
+        self,
+        db: sqlite3.Connection,
+        tracker: ProgressTracker,
+        topic: str,
+        title: str,
+        titles: List[str],
+        at: float,
+    ) -> None:
+        cursor = db.execute(
+            "INSERT INTO lessons (topic, title, steps, started) VALUES (?, ?, ?, ?)",
+            (topic, title, len(titles), at),
+        )
+        tracker.lesson = (cursor.lastrowid, topic)
+        db.execute(
+            "INSERT INTO topic_totals (topic, title, lessons) VALUES (?, ?, 1) "
+            "ON CONFLICT (topic) DO UPDATE SET lessons = lessons + 1, "
+            "title = excluded.title",
+            (topic, title),
+        )
+        self._ensure_steps(db, topic, titles)
+
+    def _write_resume(
+        self,
+        db: sqlite3.Connection,
+        tracker: ProgressTracker,
+        topic: str,
+        title: str,
+        titles: List[str],
+        at: float,
+    ) -> None:
+        row = db.execute(
+            "SELECT id FROM lessons WHERE topic = ? AND finished IS NULL "
+            "ORDER BY started DESC LIMIT 1",
+            (topic,),
+        ).fetchone()
+        if row:
+            tracker.lesson = (row[0], topic)
+        else:
+            self._write_lesson(db, tracker, topic, title, titles, at)
+
+    def _write_event(
+        self,
+        db: sqlite3.Connection,
+        tracker: ProgressTracker,
+        step: int,
+        kind: str,
+        at: float,
+    ) -> None:
+        if tracker.lesson is None:
+            return
+        lesson, topic = tracker.lesson
+        db.execute(
+            "INSERT INTO events (lesson, step, kind, at) VALUES (?, ?, ?, ?)",
+            (lesson, step, kind, at),
+        )
+        column = _TOTAL_COLUMNS.get(kind, "completed")
+        db.execute(
+            f"UPDATE step_totals SET {column} = {column} + 1, "
+            "correct = correct + ? WHERE topic = ? AND step = ?",
+            (kind == CORRECT, topic, step),
+        )
+
+    def _write_complete(
+        self,
+        db: sqlite3.Connection,
+        tracker: ProgressTracker,
+        step: int,
+        final: bool,
+        at: float,
+    ) -> None:
+        if tracker.lesson is None:
+            return
+        lesson, topic = tracker.lesson
+        self._write_event(db, tracker, step, COMPLETE, at)
+        db.execute(
+            "UPDATE lessons SET completed = max(completed, ?) WHERE id = ?",
+            (step + 1, lesson),
+        )
+        if not final:
+            return
+        finished = db.execute(
+            "UPDATE lessons SET finished = ? WHERE id = ? AND finished IS NULL",
+            (at, lesson),
+        )
+        if finished.rowcount:
+            db.execute(
+                "UPDATE topic_totals SET finished = finished + 1 WHERE topic = ?",
+                (topic,),
+            )
+
+
+class ProgressReader:
+    def __init__(self, path: Path = PROGRESS_PATH):
+        self.path = Path(path)
+
+    def _query(self, sql: str, params: Tuple = ()) -> List[Tuple]:
+        if not self.path.exists():
+            return []
+        db = connect(self.path, readonly=True)
+        try:
+            return db.execute(sql, params).fetchall()
+        finally:
+            db.close()
+
+    def topics(self) -> List[TopicProgress]:
+        rows = self._query(
+            "SELECT t.title, t.lessons, t.finished, sum(s.attempts), "
+            "sum(s.correct), sum(s.wtf) "
+            "FROM topic_totals AS t JOIN step_totals AS s USING (topic) "
+            "GROUP BY t.topic ORDER BY t.lessons DESC, t.title"
+        )
+        return [TopicProgress(*row) for row in rows]
+
+    def steps(self, topic: str) -> List[StepProgress]:
+        rows = self._query(
+            "SELECT step, title, attempts, correct, wtf, completed "
+            "FROM step_totals WHERE topic = ? ORDER BY step",
+            (normalize_topic(topic),),
+        )
+        return [StepProgress(*row) for row in rows]
@@ -25,6 +25,17 @@ DEFAULTS: dict = {
     Provider.MISTRAL: "mistral-small-latest",
 }
 
+GRADER_DEFAULTS: dict = {
+    Provider.GROQ: "llama-3.1-8b-instant",
+    Provider.GEMINI: "gemini-2.0-flash-lite",
+    Provider.OPENAI: "gpt-4o-mini",
+    Provider.DEEPSEEK: "deepseek-chat",
+    Provider.OPENROUTER: "openrouter/auto",
+    Provider.OLLAMA: "llama3.2",
+    Provider.ANTHROPIC: "claude-3-5-haiku-20241022",
+    Provider.MISTRAL: "ministral-8b-latest",
+}
+
 ENV_KEYS: dict = {
     Provider.GROQ: "GROQ_API_KEY",
     Provider.GEMINI: "GEMINI_API_KEY",
@@ -47,6 +58,10 @@ class ProviderConfig(BaseModel):
         model = self.model or DEFAULTS.get(self.provider)
         return f"{self.provider.value}/{model}"
 
+    def get_grader_model_string(self, grader_model: Optional[str] = None) -> str:
+        model = grader_model or GRADER_DEFAULTS.get(self.provider)
+        return f"{self.provider.value}/{model}"
+
     def get_env_key(self) -> str:
         return ENV_KEYS.get(self.provider, "")
 
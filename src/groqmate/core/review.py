@@ -0,0 +1,277 @@
+from pathlib import Path
+from groqmate.core.config import CONFIG_DIR
+from groqmate.core.grading import Grader, Verdict
+from groqmate.core.matching import compile_answer
+from groqmate.core.models import AnyStep
+from groqmate.core.topics import normalize_topic
+from typing import Dict, IO, List, NamedTuple, Optional, Tuple
+import heapq
+import json
+import pydantic_core
+import struct
+import time
+
+REVIEW_DIR = CONFIG_DIR / "review"
+
+# One fixed-size schedule entry per card, addressed by card id:
+# due timestamp, easiness, interval in days, repetitions, lapses.
+SCHEDULE_ENTRY = struct.Struct("<dffHH")
+SCHEDULE_DUE = struct.Struct("<d12x")
+
+DAY = 86400.0
+RELEARN_DELAY = 600.0
+MIN_EASINESS = 1.3
+START_EASINESS = 2.5
+
+
+class Card(NamedTuple):
+    topic: str
+    quiz_question: str
+    quiz_answer: str
+    accepted_answers: Tuple[str, ...] = ()
+
+
+class Schedule(NamedTuple):
+    due: float
+    easiness: float = START_EASINESS
+    interval: float = 0.0
+    repetitions: int = 0
+    lapses: int = 0
+
+
+def quality(verdict: Optional[Verdict]) -> int:
+    if verdict is None:
+        return 0
+    if verdict.correct:
+        return 5 if verdict.score >= 1.0 else 4
+    return 2 if verdict.score > 0 else 1
+
+
+def sm2(schedule: Schedule, grade: int, now: float) -> Schedule:
+    easiness = schedule.easiness + 0.1 - (5 - grade) * (0.08 + (5 - grade) * 0.02)
+    easiness = max(MIN_EASINESS, easiness)
+    if grade < 3:
+        return Schedule(
+            due=now + RELEARN_DELAY,
+            easiness=easiness,
+            interval=0.0,
+            repetitions=0,
+            lapses=min(schedule.lapses + 1, 0xFFFF),
+        )
+
+    repetitions = schedule.repetitions + 1
+    if repetitions == 1:
+        interval = 1.0
+    elif repetitions == 2:
+        interval = 6.0
+    else:
+        interval = round(max(schedule.interval, 1.0) * schedule.easiness, 1)
+    return Schedule(
+        due=now + interval * DAY,
+        easiness=easiness,
+        interval=interval,
+        repetitions=min(repetitions, 0xFFFF),
+        lapses=schedule.lapses,
+    )
+
+
+def format_wait(seconds: float) -> str:
+    if seconds < 3600:
+        return f"{max(1, round(seconds / 60))} min"
+    if seconds < DAY:
+        return f"{round(seconds / 3600)} h"
+    days = round(seconds / DAY)
+    return f"{days} day" if days == 1 else f"{days} days"
+
+
+class ReviewDeck:
+    def __init__(self, directory: Path = REVIEW_DIR):
+        self.directory = Path(directory)
+        self.cards_path = self.directory / "cards.jsonl"
+        self.schedule_path = self.directory / "schedule.bin"
+        self._rows: List[list] = []
+        self._keys: Optional[Dict[Tuple[str, str], int]] = None
+        self._table = bytearray()
+        self._heap: List[Tuple[float, int]] = []
+        self._schedule_file: Optional[IO[bytes]] = None
+        self._load()
+
+    def _read_cards(self) -> List[list]:
+        if not self.cards_path.exists():
+            return []
+        data = self.cards_path.read_bytes().strip()
+        if not data:
+            return []
+        # Records never contain raw newlines, so the whole file parses as one
+        # JSON array; only a torn or corrupt file falls back to line by line.
+        try:
+            return pydantic_core.from_json(b"[" + data.replace(b"\n", b",") + b"]")
+        except ValueError:
+            rows = []
+            for line in data.splitlines():
+                try:
+                    rows.append(pydantic_core.from_json(line))
+                except ValueError:
+                    continue
+            return rows
+
+    def _load(self) -> None:
+        # Rows stay as parsed; Card objects and the dedupe index are only
+        # built when a card is shown or added, keeping startup cheap.
+        self._rows = [row for row in self._read_cards() if len(row) == 4]
+
+        if self.schedule_path.exists():
+            self._table = bytearray(self.schedule_path.read_bytes())
+        # Cards whose schedule entry never made it to disk start out due.
+        known = len(self._table) // SCHEDULE_ENTRY.size
+        del self._table[min(known, len(self._rows)) * SCHEDULE_ENTRY.size :]
+        for _ in range(known, len(self._rows)):
+            self._table += SCHEDULE_ENTRY.pack(*Schedule(due=0.0))
+
+        self._heap = [
+            (due, card_id)
+            for card_id, (due,) in enumerate(SCHEDULE_DUE.iter_unpack(self._table))
+        ]
+        heapq.heapify(self._heap)
+
+    def _index(self) -> Dict[Tuple[str, str], int]:
+        if self._keys is None:
+            topics: Dict[str, str] = {}
+            self._keys = {}
+            for card_id, (topic, question, *_) in enumerate(self._rows):
+                if topic not in topics:
+                    topics[topic] = normalize_topic(topic)
+                self._keys[(topics[topic], question.strip().casefold())] = card_id
+        return self._keys
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def card(self, card_id: int) -> Card:
+        topic, question, answer, accepted = self._rows[card_id]
+        return Card(topic, question, answer, tuple(accepted))
+
+    def schedule(self, card_id: int) -> Schedule:
+        return Schedule(
+            *SCHEDULE_ENTRY.unpack_from(self._table, card_id * SCHEDULE_ENTRY.size)
+        )
+
+    def _due(self, card_id: int) -> float:
+        return SCHEDULE_DUE.unpack_from(self._table, card_id * SCHEDULE_ENTRY.size)[0]
+
+    def add(self, topic: str, step: AnyStep, now: Optional[float] = None) -> int:
+        card = Card(
+            topic, step.quiz_question, step.quiz_answer, tuple(step.accepted_answers)
+        )
+        keys = self._index()
+        key = (normalize_topic(topic), card.quiz_question.strip().casefold())
+        if key in keys:
+            return keys[key]
+
+        # Passing the lesson quiz counts as the first successful repetition.
+        now = time.time() if now is None else now
+        schedule = Schedule(due=now + DAY, interval=1.0, repetitions=1)
+        card_id = len(self._rows)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with open(self.cards_path, "ab") as f:
+            if f.tell() and not self._ends_with_newline():
+                f.write(b"\n")
+            f.write(json.dumps(list(card), ensure_ascii=False).encode() + b"\n")
+        self._rows.append(list(card))
+        keys[key] = card_id
+        self._table += bytes(SCHEDULE_ENTRY.size)
+        self._store(card_id, schedule)
+        return card_id
+
+    def _ends_with_newline(self) -> bool:
+        with open(self.cards_path, "rb") as f:
+            f.seek(-1, 2)
+            return f.read(1) == b"\n"
+
+    def _store(self, card_id: int, schedule: Schedule) -> None:
+        offset = card_id * SCHEDULE_ENTRY.size
+        SCHEDULE_ENTRY.pack_into(self._table, offset, *schedule)
+        if self._schedule_file is None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self.schedule_path.touch()
+            self._schedule_file = open(self.schedule_path, "r+b")
+        self._schedule_file.seek(offset)
+        self._schedule_file.write(self._table[offset : offset + SCHEDULE_ENTRY.size])
+        self._schedule_file.flush()
+        heapq.heappush(self._heap, (schedule.due, card_id))
+
+    def _peek(self) -> Optional[Tuple[float, int]]:
+        # Rescheduled cards leave their old entry behind; drop stale tops lazily.
+        while self._heap:
+            due, card_id = self._heap[0]
+            if self._due(card_id) == due:
+                return due, card_id
+            heapq.heappop(self._heap)
+        return None
+
+    def next_due(self, now: Optional[float] = None) -> Optional[int]:
+        top = self._peek()
+        now = time.time() if now is None else now
+        if top is None or top[0] > now:
+            return None
+        return top[1]
+
+    def next_due_at(self) -> Optional[float]:
+        top = self._peek()
+        return top[0] if top else None
+
+    def due_count(self, now: Optional[float] = None) -> int:
+        now = time.time() if now is None else now
+        return sum(due <= now for (due,) in SCHEDULE_DUE.iter_unpack(self._table))
+
+    def review(self, card_id: int, grade: int, now: Optional[float] = None) -> Schedule:
+        now = time.time() if now is None else now
+        schedule = sm2(self.schedule(card_id), grade, now)
+        self._store(card_id, schedule)
+        return schedule
+
+    def close(self) -> None:
+        if self._schedule_file is not None:
+            self._schedule_file.close()
+            self._schedule_file = None
+
+
+class ReviewSession:
+    def __init__(self, deck: ReviewDeck, grader: Optional[Grader] = None):
+        self.deck = deck
+        self.grader = grader or Grader()
+        self.current: Optional[int] = None
+        self.reviewed = 0
+        self.correct = 0
+
+    def next_card(self, now: Optional[float] = None) -> Optional[Card]:
+        self.current = self.deck.next_due(now)
+        return None if self.current is None else self.deck.card(self.current)
+
+    async def answer(
+        self, user_answer: str, now: Optional[float] = None
+    ) -> Tuple[Verdict, Schedule]:
+        if self.current is None:
+            raise ValueError("No card to review")
+        card = self.deck.card(self.current)
+        # Grading stays local: no judge is passed, so no LLM call is made.
+        verdict = await self.grader.grade(
+            card.quiz_question, compile_answer(card), user_answer
+        )
+        schedule = self._record(quality(verdict), verdict.correct, now)
+        return verdict, schedule
+
+    def skip(self, now: Optional[float] = None) -> Schedule:
+        if self.current is None:
+            raise ValueError("No card to review")
+        return self._record(quality(None), False, now)
+
+    def _record(self, grade: int, correct: bool, now: Optional[float]) -> Schedule:
+        schedule = self.deck.review(self.current, grade, now)
+        self.reviewed += 1
+        self.correct += correct
+        self.current = None
+        return schedule
+
+    def report(self) -> str:
+        return f"Reviewed {self.reviewed} cards, {self.correct} correct."
@@ -0,0 +1,364 @@
+from array import array
+from pathlib import Path
+from groqmate.core.config import CONFIG_DIR
+from groqmate.core.matching import stem, tokenize
+from groqmate.core.models import CompactPlan
+from groqmate.core.topics import PLANS_PATH, normalize_topic
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+import heapq
+import math
+import os
+import re
+import sqlite3
+
+NOTES_DIR = CONFIG_DIR / "notes"
+SEARCH_PATH = CONFIG_DIR / "search.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS docs (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL UNIQUE,
+    kind TEXT NOT NULL,
+    title TEXT NOT NULL,
+    path TEXT NOT NULL,
+    signature TEXT NOT NULL,
+    length INTEGER NOT NULL,
+    body TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    doc INTEGER NOT NULL,
+    tf INTEGER NOT NULL,
+    positions BLOB NOT NULL,
+    PRIMARY KEY (term, doc)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS postings_by_doc ON postings (doc);
+CREATE INDEX IF NOT EXISTS postings_tf ON postings (term, doc, tf);
+"""
+
+NOTE = "note"
+PLAN = "plan"
+
+K1 = 1.2
+B = 0.75
+
+_PHRASE_RE = re.compile(r'"([^"]+)"')
+_SNIPPET_WIDTH = 120
+
+
+class SearchHit(NamedTuple):
+    key: str
+    kind: str
+    title: str
+    path: str
+    score: float
+    snippet: str
+
+
+def terms(text: str) -> List[str]:
+    stems: Dict[str, str] = {}
+    result = []
+    for token in tokenize(text):
+        if token[0].isalnum():
+            if token not in stems:
+                stems[token] = stem(token)
+            result.append(stems[token])
+    return result
+
+
+def plan_text(plan: CompactPlan) -> str:
+    lines = [plan.topic]
+    for step in plan.steps:
+        lines += [step.title, step.concept, step.quiz_question, step.quiz_answer]
+    return "\n".join(lines)
+
+
+def note_title(path: Path, text: str) -> str:
+    for line in text.splitlines():
+        if line.startswith("#"):
+            return line.lstrip("#").strip()
+    return path.stem.removesuffix("_notes").replace("_", " ")
+
+
+def positions(blob: bytes) -> Set[int]:
+    found = array("I")
+    found.frombytes(blob)
+    return set(found)
+
+
+def has_phrase(positions: List[Set[int]]) -> bool:
+    first, *rest = positions
+    return any(
+        all(start + i in later for i, later in enumerate(rest, 1)) for start in first
+    )
+
+
+def snippet(body: str, stems: Set[str]) -> str:
+    for line in body.splitlines():
+        if stems & set(terms(line)):
+            line = line.strip()
+            break
+    else:
+        line = body.strip().split("\n", 1)[0]
+    return line if len(line) <= _SNIPPET_WIDTH else line[: _SNIPPET_WIDTH - 3] + "..."
+
+
+class SearchIndex:
+    def __init__(
+        self,
+        path: Path = SEARCH_PATH,
+        notes_dir: Path = NOTES_DIR,
+        plans_path: Optional[Path] = PLANS_PATH,
+    ):
+        self.path = Path(path)
+        self.notes_dir = Path(notes_dir)
+        self.plans_path = Path(plans_path) if plans_path else None
+        self._db: Optional[sqlite3.Connection] = None
+        self._lengths: Optional[Dict[int, int]] = None
+
+    @property
+    def db(self) -> sqlite3.Connection:
+        if self._db is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(self.path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode = WAL")
+            self._db.execute("PRAGMA synchronous = NORMAL")
+            self._db.execute("PRAGMA cache_size = -32768")
+            self._db.executescript(SCHEMA)
+        return self._db
+
+    def __len__(self) -> int:
+        return self.db.execute("SELECT count(*) FROM docs").fetchone()[0]
+
+    def _signatures(self, kind: str) -> Dict[str, str]:
+        rows = self.db.execute(
+            "SELECT key, signature FROM docs WHERE kind = ?", (kind,)
+        )
+        return dict(rows)
+
+    def add(
+        self,
+        key: str,
+        kind: str,
+        title: str,
+        text: str,
+        path: str = "",
+        signature: str = "",
+    ) -> None:
+        with self.db:
+            self._add(key, kind, title, text, path, signature)
+
+    def _add(
+        self, key: str, kind: str, title: str, text: str, path: str, signature: str
+    ) -> None:
+        tokens = terms(text)
+        found: Dict[str, array] = {}
+        for position, term in enumerate(tokens):
+            found.setdefault(term, array("I")).append(position)
+
+        self._remove(key)
+        cursor = self.db.execute(
+            "INSERT INTO docs (key, kind, title, path, signature, length, body) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (key, kind, title, path, signature, len(tokens), text),
+        )
+        self.db.executemany(
+            "INSERT INTO postings (term, doc, tf, positions) VALUES (?, ?, ?, ?)",
+            [
+                (t, cursor.lastrowid, len(p), p.tobytes())
+                for t, p in sorted(found.items())
+            ],
+        )
+        self._lengths = None
+
+    def remove(self, key: str) -> None:
+        with self.db:
+            self._remove(key)
+
+    def _remove(self, key: str) -> None:
+        row = self.db.execute("SELECT id FROM docs WHERE key = ?", (key,)).fetchone()
+        if row:
+            self.db.execute("DELETE FROM postings WHERE doc = ?", row)
+            self.db.execute("DELETE FROM docs WHERE id = ?", row)
+            self._lengths = None
+
+    def add_note(self, path: Path) -> bool:
+        with self.db:
+            return self._add_note(Path(path))
+
+    def _add_note(self, path: Path) -> bool:
+        try:
+            stat = path.stat()
+            text = path.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            return False
+        self._add(
+            f"{NOTE}:{path.name}",
+            NOTE,
+            note_title(path, text),
+            text,
+            str(path),
+            f"{stat.st_mtime_ns}:{stat.st_size}",
+        )
+        return True
+
+    def refresh(self) -> int:
+        with self.db:
+            return self._refresh_notes() + self._refresh_plans()
+
+    def _refresh_notes(self) -> int:
+        known = self._signatures(NOTE)
+        seen = set()
+        changed = 0
+        if self.notes_dir.is_dir():
+            with os.scandir(self.notes_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(".md") or not entry.is_file():
+                        continue
+                    key = f"{NOTE}:{entry.name}"
+                    seen.add(key)
+                    stat = entry.stat()
+                    if known.get(key) != f"{stat.st_mtime_ns}:{stat.st_size}":
+                        changed += self._add_note(Path(entry.path))
+
+        for key in known.keys() - seen:
+            self._remove(key)
+            changed += 1
+        return changed
+
+    def _refresh_plans(self) -> int:
+        if not self.plans_path:
+            return 0
+        try:
+            stat = self.plans_path.stat()
+            size, inode = stat.st_size, str(stat.st_ino)
+        except OSError:
+            size, inode = 0, ""
+        meta = dict(
+            self.db.execute(
+                "SELECT name, value FROM meta "
+                "WHERE name IN ('plans_offset', 'plans_inode')"
+            )
+        )
+        offset = int(meta.get("plans_offset", "0"))
+        if size == offset and inode == meta.get("plans_inode"):
+            return 0
+
+        # plans.tsv is append-only between compactions; only lines past the
+        # last indexed byte are new. Compaction replaces the file, so a new
+        # inode (or a shorter file) means the offset is stale: start over.
+        if size < offset or inode != meta.get("plans_inode"):
+            for key in self._signatures(PLAN):
+                self._remove(key)
+            offset = 0
+
+        changed = 0
+        if size:
+            offset, changed = self._index_plans(offset)
+        self.db.executemany(
+            "INSERT OR REPLACE INTO meta (name, value) VALUES (?, ?)",
+            [("plans_offset", str(offset)), ("plans_inode", inode)],
+        )
+        return changed
+
+    def _index_plans(self, offset: int) -> Tuple[int, int]:
+        changed = 0
+        with open(self.plans_path, "rb") as f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                offset += len(line)
+                _, sep, payload = line.partition(b"\t")
+                if not sep:
+                    continue
+                try:
+                    plan = CompactPlan.from_json(payload)
+                except ValueError:
+                    continue
+                # Aliases of one plan share a line each; index the plan once.
+                self._add(
+                    f"{PLAN}:{normalize_topic(plan.topic)}",
+                    PLAN,
+                    plan.topic,
+                    plan_text(plan),
+                    str(self.plans_path),
+                    "",
+                )
+                changed += 1
+        return offset, changed
+
+    def search(self, query: str, limit: int = 10) -> List[SearchHit]:
+        phrases = [terms(p) for p in _PHRASE_RE.findall(query)]
+        phrases = [p for p in phrases if len(p) > 1]
+        unique = list(dict.fromkeys(terms(query)))
+        lengths = self._doc_lengths()
+        if not unique or not lengths:
+            return []
+
+        # Scoring reads (doc, tf) from a covering index; position blobs are
+        # only loaded for documents that need a phrase check.
+        postings: Dict[str, Dict[int, int]] = {}
+        for term in unique:
+            rows = self.db.execute(
+                "SELECT doc, tf FROM postings INDEXED BY postings_tf WHERE term = ?",
+                (term,),
+            )
+            postings[term] = dict(rows)
+
+        candidates = set().union(*(p.keys() for p in postings.values()))
+        for phrase in phrases:
+            for term in phrase:
+                candidates &= postings[term].keys()
+            candidates = {doc for doc in candidates if self._has_phrase(doc, phrase)}
+        if not candidates:
+            return []
+
+        count = len(lengths)
+        avg_length = sum(lengths.values()) / count or 1.0
+        scores: Dict[int, float] = {}
+        for docs in postings.values():
+            if not docs:
+                continue
+            idf = math.log(1 + (count - len(docs) + 0.5) / (len(docs) + 0.5))
+            for doc, tf in docs.items():
+                if doc not in candidates:
+                    continue
+                norm = K1 * (1 - B + B * lengths[doc] / avg_length)
+                scores[doc] = scores.get(doc, 0.0) + idf * tf * (K1 + 1) / (tf + norm)
+
+        ranked = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+        return self._hits(ranked, set(unique))
+
+    def _has_phrase(self, doc: int, phrase: List[str]) -> bool:
+        found = []
+        for term in phrase:
+            (blob,) = self.db.execute(
+                "SELECT positions FROM postings WHERE term = ? AND doc = ?", (term, doc)
+            ).fetchone()
+            found.append(positions(blob))
+        return has_phrase(found)
+
+    def _doc_lengths(self) -> Dict[int, int]:
+        if self._lengths is None:
+            self._lengths = dict(self.db.execute("SELECT id, length FROM docs"))
+        return self._lengths
+
+    def _hits(
+        self, ranked: List[Tuple[int, float]], stems: Set[str]
+    ) -> List[SearchHit]:
+        hits = []
+        for doc, score in ranked:
+            key, kind, title, path, body = self.db.execute(
+                "SELECT key, kind, title, path, body FROM docs WHERE id = ?", (doc,)
+            ).fetchone()
+            hits.append(
+                SearchHit(key, kind, title, path, round(score, 4), snippet(body, stems))
+            )
+        return hits
+
+    def close(self) -> None:
+        if self._db is not None:
+            self._db.close()
+            self._db = None
@@ -1,45 +1,104 @@
-from groqmate.core.models import SessionState, SessionStatus, LessonPlan, LessonStep
-from typing import Optional
+from groqmate.core.models import (
+    AnyPlan,
+    CompactPlan,
+    CompactState,
+    CompactStep,
+    SessionStatus,
+    as_compact,
+)
+from groqmate.core.matching import CompiledAnswer, compile_answer
+from typing import Any, Callable, Dict, List, Optional
+
+SessionObserver = Callable[[str, Dict[str, Any]], None]
 
 
 class Session:
     def __init__(self):
-        self.state = SessionState()
+        self.state = CompactState()
+        self._answers: List[CompiledAnswer] = []
+        self._answers_plan: Optional[CompactPlan] = None
+        self._observers: List[SessionObserver] = []
+
+    def subscribe(self, observer: SessionObserver) -> None:
+        self._observers.append(observer)
+
+    def unsubscribe(self, observer: SessionObserver) -> None:
+        if observer in self._observers:
+            self._observers.remove(observer)
+
+    def _emit(self, event: str, **data: Any) -> None:
+        for observer in self._observers:
+            observer(event, data)
+
+    def _compile_answers(self) -> None:
+        plan = self.state.plan
+        self._answers = [compile_answer(step) for step in plan.steps] if plan else []
+        self._answers_plan = plan
+
+    def restore(self, state: CompactState) -> None:
+        self.state = state
+        self._answers = []
+        self._answers_plan = None
 
-    def load_plan(self, plan: LessonPlan) -> None:
-        self.state.plan = plan
+    def load_plan(self, plan: AnyPlan) -> None:
+        self.state.plan = as_compact(plan)
         self.state.current_step = 0
         self.state.completed = []
         self.state.status = SessionStatus.TEACHING
+        self._compile_answers()
+        self._emit("load_plan", plan=self.state.plan)
 
     def advance(self) -> bool:
         if not self.state.plan:
             return False
         if self.state.current_step >= self.state.plan.total_steps - 1:
             self.state.status = SessionStatus.COMPLETE
+            self._emit("advance", step=self.state.current_step, complete=True)
             return False
         self.state.completed.append(self.state.current_step)
         self.state.current_step += 1
+        self._emit("advance", step=self.state.current_step, complete=False)
         return True
 
-    def current_step(self) -> Optional[LessonStep]:
+    def back(self) -> bool:
+        if not self.state.plan or self.state.current_step == 0:
+            return False
+        self.state.current_step -= 1
+        if self.state.current_step in self.state.completed:
+            self.state.completed.remove(self.state.current_step)
+        self.state.status = SessionStatus.TEACHING
+        self._emit("back", step=self.state.current_step)
+        return True
+
+    def current_step(self) -> Optional[CompactStep]:
         if not self.state.plan:
             return None
         if self.state.current_step >= len(self.state.plan.steps):
             return None
         return self.state.plan.steps[self.state.current_step]
 
+    def current_answer(self) -> Optional[CompiledAnswer]:
+        if not self.current_step():
+            return None
+        if self._answers_plan is not self.state.plan:
+            self._compile_answers()
+        return self._answers[self.state.current_step]
+
     def is_complete(self) -> bool:
         return self.state.status == SessionStatus.COMPLETE
 
     def reset(self) -> None:
-        self.state = SessionState()
+        self.state = CompactState()
+        self._compile_answers()
+        self._emit("reset")
 
     def enter_quiz(self) -> None:
         self.state.status = SessionStatus.QUIZ
+        self._emit("enter_quiz", step=self.state.current_step)
 
     def exit_quiz(self) -> None:
         self.state.status = SessionStatus.TEACHING
+        self._emit("exit_quiz", step=self.state.current_step)
 
     def is_in_quiz(self) -> bool:
         return self.state.status == SessionStatus.QUIZ
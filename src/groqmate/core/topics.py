@@ -0,0 +1,211 @@
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from groqmate.core.config import CONFIG_DIR
+from groqmate.core.models import AnyPlan, CompactPlan, as_compact
+import math
+import os
+import re
+
+PLANS_PATH = CONFIG_DIR / "plans.tsv"
+
+STOPWORDS = frozenset(
+    {
+        "a",
+        "about",
+        "an",
+        "and",
+        "basics",
+        "does",
+        "do",
+        "explain",
+        "for",
+        "how",
+        "in",
+        "intro",
+        "introduction",
+        "is",
+        "learn",
+        "me",
+        "of",
+        "on",
+        "please",
+        "teach",
+        "the",
+        "to",
+        "what",
+        "with",
+        "work",
+        "works",
+    }
+)
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def normalize_topic(topic: str) -> str:
+    words = _WORD_RE.findall(topic.casefold())
+    content = [w for w in words if w not in STOPWORDS]
+    return " ".join(content or words)
+
+
+def trigrams(key: str) -> frozenset:
+    padded = f"  {key} "
+    return frozenset(padded[i : i + 3] for i in range(len(padded) - 2))
+
+
+class TopicMatch(NamedTuple):
+    topic: str
+    score: float
+    plan: CompactPlan
+
+
+class TopicIndex:
+    def __init__(self, path: Optional[Path] = None, threshold: float = 0.6):
+        self.path = path
+        self.threshold = threshold
+        self._loaded = path is None
+        self._keys: List[str] = []
+        self._grams: List[frozenset] = []
+        self._plans: List[Optional[CompactPlan]] = []
+        self._offsets: List[Tuple[int, int]] = []
+        self._by_key: Dict[str, int] = {}
+        self._postings: Dict[str, List[int]] = {}
+
+    def __len__(self) -> int:
+        self._ensure_loaded()
+        return len(self._by_key)
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        if not self.path or not self.path.exists():
+            return
+
+        offset = 0
+        rows = 0
+        with open(self.path, "rb") as f:
+            for line in f:
+                key, sep, _ = line.partition(b"\t")
+                if sep:
+                    start = offset + len(key) + 1
+                    self._insert(key.decode(), None, (start, len(line) - len(key) - 1))
+                    rows += 1
+                offset += len(line)
+        if rows > len(self._keys):
+            self._compact()
+
+    def _compact(self) -> None:
+        # Regenerated topics leave their superseded rows behind; rewrite the
+        # file with only the latest row per key.
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with open(self.path, "rb") as src, open(tmp, "wb") as dst:
+            for doc_id, key in enumerate(self._keys):
+                start, length = self._offsets[doc_id]
+                src.seek(start)
+                payload = src.read(length).rstrip(b"\n") + b"\n"
+                row = key.encode() + b"\t"
+                self._offsets[doc_id] = (dst.tell() + len(row), len(payload))
+                dst.write(row + payload)
+        os.replace(tmp, self.path)
+
+    def _insert(
+        self, key: str, plan: Optional[CompactPlan], offset: Tuple[int, int]
+    ) -> None:
+        existing = self._by_key.get(key)
+        if existing is not None:
+            self._plans[existing] = plan
+            self._offsets[existing] = offset
+            return
+
+        doc_id = len(self._keys)
+        grams = trigrams(key)
+        self._keys.append(key)
+        self._grams.append(grams)
+        self._plans.append(plan)
+        self._offsets.append(offset)
+        self._by_key[key] = doc_id
+        for gram in grams:
+            self._postings.setdefault(gram, []).append(doc_id)
+
+    def add(self, plan: AnyPlan, topic: Optional[str] = None) -> None:
+        self._ensure_loaded()
+        plan = as_compact(plan)
+        keys = {normalize_topic(plan.topic)}
+        if topic:
+            keys.add(normalize_topic(topic))
+
+        payload = plan.to_json().encode()
+        for key in keys:
+            if not key:
+                continue
+            existing = self._by_key.get(key)
+            if existing is not None and self._plan_at(existing) == plan:
+                continue
+            offset = (0, 0)
+            if self.path:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.path, "ab") as f:
+                    start = f.tell() + len(key.encode()) + 1
+                    f.write(key.encode() + b"\t" + payload + b"\n")
+                offset = (start, len(payload) + 1)
+            self._insert(key, plan, offset)
+
+    def _plan_at(self, doc_id: int) -> CompactPlan:
+        plan = self._plans[doc_id]
+        if plan is None and self.path:
+            start, length = self._offsets[doc_id]
+            with open(self.path, "rb") as f:
+                f.seek(start)
+                plan = CompactPlan.from_json(f.read(length))
+            self._plans[doc_id] = plan
+        return plan
+
+    def add_key(self, key: str) -> None:
+        self._ensure_loaded()
+        if key:
+            self._insert(key, None, (0, 0))
+
+    def match(self, topic: str) -> Optional[Tuple[str, float]]:
+        self._ensure_loaded()
+        key = normalize_topic(topic)
+        if not key:
+            return None
+
+        exact = self._by_key.get(key)
+        if exact is not None:
+            return key, 1.0
+
+        query = trigrams(key)
+        t = self.threshold
+        min_overlap = max(1, math.ceil(t * len(query) / (2 - t)))
+
+        # Any candidate reaching the threshold shares at least one of the
+        # rarest (|q| - min_overlap + 1) trigrams, so only those are probed.
+        probes = sorted(
+            (g for g in query if g in self._postings),
+            key=lambda g: len(self._postings[g]),
+        )[: len(query) - min_overlap + 1]
+
+        best_id, best_score = -1, 0.0
+        seen = set()
+        for gram in probes:
+            for doc_id in self._postings[gram]:
+                if doc_id in seen:
+                    continue
+                seen.add(doc_id)
+                grams = self._grams[doc_id]
+                score = 2 * len(query & grams) / (len(query) + len(grams))
+                if score > best_score:
+                    best_id, best_score = doc_id, score
+
+        if best_id < 0 or best_score < t:
+            return None
+        return self._keys[best_id], best_score
+
+    def lookup(self, topic: str) -> Optional[TopicMatch]:
+        found = self.match(topic)
+        if not found:
+            return None
+        key, score = found
+        return TopicMatch(topic=key, score=score, plan=self._plan_at(self._by_key[key]))
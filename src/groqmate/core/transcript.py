@@ -0,0 +1,301 @@
+from datetime import datetime
+from pathlib import Path
+from groqmate.core.config import CONFIG_DIR
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+import json
+import queue
+import re
+import struct
+import threading
+import time
+
+TRANSCRIPTS_DIR = CONFIG_DIR / "transcripts"
+
+# One fixed-size entry per message: byte offset of its first record in the
+# JSONL file and the lesson step it belongs to (-1 outside a lesson).
+INDEX_ENTRY = struct.Struct("<Qi")
+
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+_MAX_BATCH = 512
+
+
+class TranscriptMessage(NamedTuple):
+    id: int
+    role: str
+    text: str
+    step: Optional[int]
+    timestamp: float
+    duration: Optional[float] = None
+    ttft: Optional[float] = None
+
+
+def slugify(text: str, sep: str = "-") -> str:
+    return _SLUG_RE.sub(sep, text.lower()).strip(sep)[:40] or "lesson"
+
+
+def new_transcript_path(topic: str, directory: Path = TRANSCRIPTS_DIR) -> Path:
+    slug = slugify(topic)
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    return Path(directory) / f"{stamp}-{slug}.jsonl"
+
+
+def latest_transcript(directory: Path = TRANSCRIPTS_DIR) -> Optional[Path]:
+    paths = sorted(Path(directory).glob("*.jsonl")) if Path(directory).exists() else []
+    return paths[-1] if paths else None
+
+
+def index_path(path: Path) -> Path:
+    return Path(path).with_suffix(".idx")
+
+
+class TranscriptWriter:
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.index_path = index_path(self.path)
+        self.step: Optional[int] = None
+        idx_size = self.index_path.stat().st_size if self.index_path.exists() else 0
+        self._next_id = idx_size // INDEX_ENTRY.size
+        self._streaming: Optional[Tuple[int, float]] = None
+        self._first_token: Optional[float] = None
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread = threading.Thread(
+            target=self._run, name="transcript-writer", daemon=True
+        )
+        self._thread.start()
+
+    def _step(self) -> int:
+        return -1 if self.step is None else self.step
+
+    def message(self, role: str, text: str) -> int:
+        message_id = self._next_id
+        self._next_id += 1
+        self._queue.put(
+            {
+                "k": "msg",
+                "id": message_id,
+                "r": role,
+                "s": self._step(),
+                "t": time.time(),
+                "x": text,
+            }
+        )
+        return message_id
+
+    def start(self, role: str) -> int:
+        self.end()
+        message_id = self._next_id
+        self._next_id += 1
+        self._streaming = (message_id, time.perf_counter())
+        self._first_token = None
+        self._queue.put(
+            {
+                "k": "start",
+                "id": message_id,
+                "r": role,
+                "s": self._step(),
+                "t": time.time(),
+            }
+        )
+        return message_id
+
+    def chunk(self, text: str) -> None:
+        if self._streaming is None or not text:
+            return
+        if self._first_token is None:
+            self._first_token = time.perf_counter()
+        self._queue.put({"k": "chunk", "id": self._streaming[0], "x": text})
+
+    def end(self) -> None:
+        if self._streaming is None:
+            return
+        message_id, started = self._streaming
+        now = time.perf_counter()
+        record: Dict[str, Any] = {
+            "k": "end",
+            "id": message_id,
+            "dur": round(now - started, 3),
+        }
+        if self._first_token is not None:
+            record["ttft"] = round(self._first_token - started, 3)
+        self._queue.put(record)
+        self._streaming = None
+
+    def observe(self, event: str, data: Dict[str, Any]) -> None:
+        if event == "load_plan":
+            self.step = 0
+        elif event == "reset":
+            self.step = None
+        elif "step" in data:
+            self.step = data["step"]
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self) -> None:
+        if not self._thread.is_alive():
+            return
+        self.end()
+        self._queue.put(None)
+        self._thread.join(timeout=5.0)
+
+    def _drain(self, first) -> Tuple[List, bool]:
+        batch = [first]
+        while len(batch) < _MAX_BATCH:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        stop = None in batch
+        return [item for item in batch if item is not None], stop
+
+    def _run(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "ab") as log, open(self.index_path, "ab") as idx:
+            stop = False
+            while not stop:
+                batch, stop = self._drain(self._queue.get())
+                self._write(batch, log, idx)
+
+    def _write(self, batch: List, log, idx) -> None:
+        waiters = []
+        pending_chunk: Optional[Dict[str, Any]] = None
+        lines: List[bytes] = []
+        entries: List[bytes] = []
+        offset = log.tell()
+
+        def emit(record: Dict[str, Any]) -> None:
+            nonlocal offset
+            line = json.dumps(record, ensure_ascii=False).encode() + b"\n"
+            if record["k"] in ("msg", "start"):
+                entries.append(INDEX_ENTRY.pack(offset, record["s"]))
+            lines.append(line)
+            offset += len(line)
+
+        # Consecutive tokens of one streamed message collapse into one record.
+        for item in batch:
+            if isinstance(item, threading.Event):
+                waiters.append(item)
+                continue
+            if item["k"] == "chunk":
+                if pending_chunk and pending_chunk["id"] == item["id"]:
+                    pending_chunk["x"] += item["x"]
+                    continue
+                if pending_chunk:
+                    emit(pending_chunk)
+                pending_chunk = dict(item)
+                continue
+            if pending_chunk:
+                emit(pending_chunk)
+                pending_chunk = None
+            emit(item)
+        if pending_chunk:
+            emit(pending_chunk)
+
+        if lines:
+            log.write(b"".join(lines))
+            log.flush()
+        if entries:
+            idx.write(b"".join(entries))
+            idx.flush()
+        for waiter in waiters:
+            waiter.set()
+
+
+class Transcript:
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.index_path = index_path(self.path)
+        self._entries: Optional[List[Tuple[int, int]]] = None
+
+    def _load_entries(self) -> List[Tuple[int, int]]:
+        if self._entries is not None:
+            return self._entries
+        size = self.path.stat().st_size if self.path.exists() else 0
+        entries: List[Tuple[int, int]] = []
+        if self.index_path.exists():
+            data = self.index_path.read_bytes()
+            usable = len(data) - len(data) % INDEX_ENTRY.size
+            entries = [e for e in INDEX_ENTRY.iter_unpack(data[:usable]) if e[0] < size]
+        else:
+            entries = self.rebuild_index()
+        self._entries = entries
+        return entries
+
+    def rebuild_index(self) -> List[Tuple[int, int]]:
+        entries = []
+        if self.path.exists():
+            with open(self.path, "rb") as f:
+                offset = 0
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        record = {}
+                    if record.get("k") in ("msg", "start"):
+                        entries.append((offset, record.get("s", -1)))
+                    offset += len(line)
+            with open(self.index_path, "wb") as idx:
+                idx.write(b"".join(INDEX_ENTRY.pack(*e) for e in entries))
+        self._entries = entries
+        return entries
+
+    def __len__(self) -> int:
+        return len(self._load_entries())
+
+    def offset_of(self, message_id: int) -> int:
+        return self._load_entries()[message_id][0]
+
+    def first_message_of_step(self, step: int) -> Optional[int]:
+        for message_id, (_, entry_step) in enumerate(self._load_entries()):
+            if entry_step == step:
+                return message_id
+        return None
+
+    def messages(self, start: int = 0) -> List[TranscriptMessage]:
+        entries = self._load_entries()
+        if start >= len(entries):
+            return []
+
+        found: Dict[int, Dict[str, Any]] = {}
+        with open(self.path, "rb") as f:
+            f.seek(entries[max(0, start)][0])
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                message_id = record.get("id")
+                kind = record.get("k")
+                if kind in ("msg", "start"):
+                    found[message_id] = {
+                        "role": record.get("r", "system"),
+                        "text": record.get("x", ""),
+                        "step": record.get("s", -1),
+                        "timestamp": record.get("t", 0.0),
+                    }
+                elif message_id in found:
+                    message = found[message_id]
+                    if kind == "chunk":
+                        message["text"] += record.get("x", "")
+                    elif kind == "end":
+                        message["duration"] = record.get("dur")
+                        message["ttft"] = record.get("ttft")
+
+        return [
+            TranscriptMessage(
+                id=message_id,
+                role=m["role"],
+                text=m["text"],
+                step=None if m["step"] < 0 else m["step"],
+                timestamp=m["timestamp"],
+                duration=m.get("duration"),
+                ttft=m.get("ttft"),
+            )
+            for message_id, m in sorted(found.items())
+            if message_id >= start
+        ]
+
+    def tail(self, count: int) -> List[TranscriptMessage]:
+        return self.messages(max(0, len(self) - count))
@@ -1,11 +1,17 @@
-from litellm import acompletion
-from groqmate.core.models import LessonPlan
+from groqmate.core.models import AnyStep, LessonPlan
+from groqmate.core.matching import CompiledAnswer
+from groqmate.core.grading import BulkGrade, Grader
+from groqmate.core.ledger import UsageLedger, estimate_tokens, read_usage
 from groqmate.core.state import Session
 from groqmate.core.providers import ProviderConfig, Provider
 from groqmate.core.config import Config
 from typing import AsyncIterator, Optional
+import asyncio
+import contextlib
+import inspect
 import json
 import os
+import time
 
 
 SYSTEM_PROMPT = """You are Groqmate, a terse and encouraging learning coach.
@@ -29,14 +35,16 @@ Output ONLY valid JSON in this exact format:
       "title": "<short title, 2-4 words>",
       "concept": "<one paragraph explanation, 2-3 sentences>",
       "quiz_question": "<a single question to test understanding>",
-      "quiz_answer": "<the correct answer, keep it short>"
+      "quiz_answer": "<the correct answer, keep it short>",
+      "accepted_answers": ["<other short phrasings or synonyms of the answer>"]
     }},
     {{
       "index": 1,
       "title": "<next concept title>",
       "concept": "<explanation>",
       "quiz_question": "<question>",
-      "quiz_answer": "<answer>"
+      "quiz_answer": "<answer>",
+      "accepted_answers": ["<synonym>"]
     }}
   ]
 }}
@@ -79,6 +87,9 @@ Format as clean markdown with:
 - Keep it scannable and useful for review"""
 
 
+# Seconds to wait for the grader model before the answer counts as wrong.
+JUDGE_TIMEOUT = 8.0
+
 ENV_KEY_MAPPING = {
     "groq": "GROQ_API_KEY",
     "gemini": "GEMINI_API_KEY",
@@ -90,15 +101,52 @@ ENV_KEY_MAPPING = {
 }
 
 
+def answer_feedback(correct: bool, score: float, answer: CompiledAnswer) -> str:
+    if correct:
+        return "Correct! Type `next` to continue."
+
+    if score > 0:
+        return f"Close! The answer is related to: {answer.answer}"
+
+    return f"Not quite. Hint: Think about {answer.answer[:10]}..."
+
+
+async def acompletion(**kwargs):
+    # litellm takes seconds to import, so it is loaded on the first request
+    # rather than whenever groqmate starts.
+    from litellm import acompletion as completion
+
+    return await completion(**kwargs)
+
+
+async def close_stream(response) -> None:
+    # Closing the response releases the HTTP connection, so a stream that is
+    # stopped early stops generating (and billing) tokens upstream.
+    close = getattr(response, "aclose", None)
+    if close is not None:
+        result = close()
+        if inspect.isawaitable(result):
+            await result
+
+
 class Tutor:
     def __init__(
         self,
         provider_config: Optional[ProviderConfig] = None,
         config: Optional[Config] = None,
+        ledger: Optional[UsageLedger] = None,
     ):
         self.provider_config = provider_config or ProviderConfig()
         self.config = config or Config.load()
         self.model = self.provider_config.get_model_string()
+        self.grader_model = self.provider_config.get_grader_model_string(
+            self.config.settings.grader_model
+        )
+        self.grader = Grader()
+        self.ledger = ledger or UsageLedger()
+        self._stream_usage: Optional[bool] = None
+        self.api_key: Optional[str] = None
+        self.limiter: Optional[asyncio.Semaphore] = None
 
         if not self.provider_config.is_local():
             self._setup_api_key()
@@ -115,12 +163,95 @@ class Tutor:
                 f"or set the {ENV_KEY_MAPPING.get(provider, 'API_KEY')} environment variable."
             )
 
+        self.api_key = api_key
         env_var = ENV_KEY_MAPPING.get(provider)
         if env_var:
             os.environ[env_var] = api_key
 
+    def _credentials(self) -> dict:
+        # Sent with every request so a pooled Tutor keeps using its own key
+        # after another one has overwritten the environment variable.
+        return {"api_key": self.api_key} if self.api_key else {}
+
+    def _slot(self):
+        # Held for the whole request, so Tutors sharing a limiter stay under
+        # one cap on concurrent provider calls.
+        return self.limiter if self.limiter is not None else contextlib.nullcontext()
+
+    def _stream_options(self) -> dict:
+        if self._stream_usage is None:
+            try:
+                from litellm import get_supported_openai_params
+
+                supported = get_supported_openai_params(model=self.model) or []
+            except Exception:
+                supported = []
+            self._stream_usage = "stream_options" in supported
+        return {"stream_options": {"include_usage": True}} if self._stream_usage else {}
+
+    def _record(
+        self,
+        operation: str,
+        model: str,
+        messages: list[dict],
+        usage: Optional[tuple[int, int, int]],
+        started: float,
+        text: str,
+    ) -> None:
+        if usage is None:
+            prompt = sum(estimate_tokens(m["content"]) for m in messages)
+            usage = (prompt, estimate_tokens(text), 0)
+        self.ledger.record(
+            operation,
+            self.provider_config.provider.value,
+            model,
+            *usage,
+            latency=time.perf_counter() - started,
+        )
+
+    async def _complete(self, operation: str, **kwargs) -> str:
+        async with self._slot():
+            started = time.perf_counter()
+            response = await acompletion(**self._credentials(), **kwargs)
+        content = response.choices[0].message.content or ""
+        self._record(
+            operation,
+            kwargs["model"],
+            kwargs["messages"],
+            read_usage(response),
+            started,
+            content,
+        )
+        return content
+
+    async def _stream(self, operation: str, **kwargs) -> AsyncIterator[str]:
+        async with self._slot():
+            started = time.perf_counter()
+            response = await acompletion(
+                stream=True, **self._credentials(), **self._stream_options(), **kwargs
+            )
+            parts: list[str] = []
+            usage = None
+            try:
+                async for chunk in response:
+                    usage = read_usage(chunk) or usage
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        parts.append(chunk.choices[0].delta.content)
+                        yield parts[-1]
+            finally:
+                self._record(
+                    operation,
+                    kwargs["model"],
+                    kwargs["messages"],
+                    usage,
+                    started,
+                    "".join(parts),
+                )
+                await close_stream(response)
+
     async def generate_plan(self, topic: str) -> LessonPlan:
-        response = await acompletion(
+        content = await self._complete(
+            "plan",
             model=self.model,
             messages=[
                 {"role": "system", "content": SYSTEM_PROMPT},
@@ -129,7 +260,6 @@ class Tutor:
             response_format={"type": "json_object"},
             temperature=0.7,
         )
-        content = response.choices[0].message.content
         if not content:
             raise ValueError("Empty response from API")
         data = json.loads(content)
@@ -153,38 +283,44 @@ class Tutor:
             quiz_question=step.quiz_question,
         )
 
-        response = await acompletion(
+        async for token in self._stream(
+            "explain",
             model=self.model,
             messages=[
                 {"role": "system", "content": SYSTEM_PROMPT},
                 {"role": "user", "content": prompt},
             ],
-            stream=True,
             temperature=0.7,
-        )
-
-        async for chunk in response:
-            if chunk.choices and chunk.choices[0].delta.content:
-                yield chunk.choices[0].delta.content
+        ):
+            yield token
 
     async def check_answer(
         self, user_answer: str, session: Session
     ) -> tuple[bool, str]:
         step = session.current_step()
-        if not step:
+        answer = session.current_answer()
+        if not step or not answer:
             return False, "No active lesson."
 
-        expected = step.quiz_answer.strip().lower()
-        actual = user_answer.strip().lower()
-
-        if expected in actual or actual in expected:
-            return True, "Correct! Type `next` to continue."
-
-        similarity = len(set(expected.split()) & set(actual.split()))
-        if similarity >= len(expected.split()) // 2:
-            return False, f"Close! The answer is related to: {step.quiz_answer}"
-
-        return False, f"Not quite. Hint: Think about {step.quiz_answer[:10]}..."
+        judge = self.judge if self.config.settings.llm_grading else None
+        verdict = await self.grader.grade(
+            step.quiz_question, answer, user_answer, judge=judge
+        )
+        return verdict.correct, answer_feedback(verdict.correct, verdict.score, answer)
+
+    async def grade_answers(self, step: AnyStep, answers: list[str]) -> BulkGrade:
+        judge = self.judge if self.config.settings.llm_grading else None
+        return await self.grader.grade_bulk(step, answers, judge=judge)
+
+    async def judge(self, prompt: str) -> str:
+        return await self._complete(
+            "grade",
+            model=self.grader_model,
+            messages=[{"role": "user", "content": prompt}],
+            max_tokens=3,
+            temperature=0,
+            timeout=JUDGE_TIMEOUT,
+        )
 
     async def rephrase_stream(self, session: Session) -> AsyncIterator[str]:
         step = session.current_step()
@@ -200,19 +336,16 @@ class Tutor:
             topic=session.state.plan.topic, concept=step.concept
         )
 
-        response = await acompletion(
+        async for token in self._stream(
+            "rephrase",
             model=self.model,
             messages=[
                 {"role": "system", "content": SYSTEM_PROMPT},
                 {"role": "user", "content": prompt},
             ],
-            stream=True,
             temperature=0.9,
-        )
-
-        async for chunk in response:
-            if chunk.choices and chunk.choices[0].delta.content:
-                yield chunk.choices[0].delta.content
+        ):
+            yield token
 
     async def generate_summary(self, session: Session) -> str:
         if not session.state.plan:
@@ -227,7 +360,8 @@ class Tutor:
 
         prompt = SUMMARY_PROMPT.format(topic=session.state.plan.topic, steps=steps_text)
 
-        response = await acompletion(
+        content = await self._complete(
+            "summary",
             model=self.model,
             messages=[
                 {"role": "system", "content": SYSTEM_PROMPT},
@@ -235,5 +369,4 @@ class Tutor:
             ],
             temperature=0.5,
         )
-
-        return response.choices[0].message.content or "# Error generating summary"
+        return content or "# Error generating summary"
@@ -1,52 +1,57 @@
 import asyncio
-import argparse
-import sys
+import contextlib
+import time
+from itertools import count
 from pathlib import Path
 from textual.app import App, ComposeResult
-from textual.widgets import Header, Static
-from textual.containers import Container
+from textual.widgets import Header, Static, TabbedContent, TabPane
 from textual.binding import Binding
+from textual.timer import Timer
+from textual.worker import Worker, WorkerCancelled, WorkerFailed
 
 from groqmate.core.tutor import Tutor
 from groqmate.core.state import Session
 from groqmate.core.providers import ProviderConfig, Provider, DEFAULTS
-from groqmate.core.config import Config
+from groqmate.core.config import Config, ConfigError, ConfigWatcher, Settings
+from groqmate.core.topics import TopicIndex, PLANS_PATH
+from groqmate.core.ledger import UsageLedger, LEDGER_PATH
+from groqmate.core.journal import SESSION_DIR, SessionJournal
+from groqmate.core.progress import PROGRESS_PATH, ProgressStore, ProgressTracker
+from groqmate.core.review import REVIEW_DIR, ReviewDeck, ReviewSession, format_wait
+from groqmate.core.search import NOTES_DIR, SEARCH_PATH, SearchIndex
+from groqmate.core.transcript import (
+    TRANSCRIPTS_DIR,
+    Transcript,
+    TranscriptWriter,
+    new_transcript_path,
+    slugify,
+)
+from groqmate.core.packs import LessonPack, PackTutor
+from groqmate.core.pool import TutorPool
+from groqmate.core.daemon import SOCKET_PATH, RemoteTutor
 from groqmate.interfaces.cli.widgets import ChatLog, InputBar, CustomFooter
 from groqmate.interfaces.cli.settings_screen import SettingsScreen
+from groqmate.interfaces.cli.tabs import LessonTab, current_tab
+from groqmate.interfaces.cli import executor
+from groqmate.interfaces.cli.perf import (
+    LAG_INTERVAL,
+    LagMonitor,
+    cache_hit_rate,
+    hud_text,
+)
+
+TRANSCRIPT_TAIL = 50
+SEARCH_RESULTS = 8
+CONFIG_POLL_INTERVAL = 1.0
+POOL_SWEEP_INTERVAL = 60.0
+HUD_INTERVAL = 0.5
+STOP_COMMANDS = ("stop", "cancel")
+NEW_TAB_COMMANDS = ("tab", "new tab")
+CLOSE_TAB_COMMANDS = ("close", "close tab")
+ROLE_SENDERS = {"user": "You", "groqmate": "Groqmate", "system": "System"}
 
 CSS_PATH = Path(__file__).parent / "style.tcss"
 
-VALID_PROVIDERS = [
-    "groq",
-    "gemini",
-    "openai",
-    "deepseek",
-    "openrouter",
-    "ollama",
-    "anthropic",
-    "mistral",
-]
-
-
-def show_providers_and_exit():
-    print("Available providers:\n")
-    for provider in Provider:
-        default = DEFAULTS.get(provider, "N/A")
-        local = "(local, no API key needed)" if provider == Provider.OLLAMA else ""
-        print(f"  {provider.value:12} {default:30} {local}")
-    print("\nUsage:")
-    print("  groqmate                 # Use default provider")
-    print("  groqmate gemini          # Use Gemini")
-    print("  groqmate groq/llama-3.1  # Use specific model")
-    sys.exit(1)
-
-
-def parse_provider_arg(arg: str) -> tuple[str, str | None]:
-    if "/" in arg:
-        provider, model = arg.split("/", 1)
-        return provider.lower(), model
-    return arg.lower(), None
-
 
 class GroqmateApp(App):
     CSS_PATH = CSS_PATH
@@ -55,12 +60,28 @@ class GroqmateApp(App):
         Binding("ctrl+q", "quit", "Quit", show=True),
         Binding("ctrl+c", "quit", "Quit", show=False),
         Binding("ctrl+l", "clear", "Clear", show=True),
+        Binding("escape", "stop", "Stop", show=True),
+        Binding("ctrl+t", "new_tab", "New tab", show=True),
+        Binding("ctrl+n", "next_tab", "Next tab", show=False),
+        Binding("f2", "toggle_hud", "Perf HUD", show=False),
         Binding("ctrl+p", "settings", "Settings", show=True),
     ]
 
-    def __init__(self, provider: str | None = None, model: str | None = None):
+    def __init__(
+        self,
+        provider: str | None = None,
+        model: str | None = None,
+        pack: str | None = None,
+    ):
         super().__init__()
-        self.config = Config.load()
+        self.config_error: ConfigError | None = None
+        try:
+            self.config = Config.load()
+        except ConfigError as e:
+            self.config = Config()
+            self.config_error = e
+        self.config_watcher = ConfigWatcher()
+        self.pack_path = pack or self.config.settings.lesson_pack
 
         provider_str = provider or self.config.settings.provider
         model_str = model or self.config.settings.model
@@ -68,47 +89,244 @@ class GroqmateApp(App):
         self.provider_config = ProviderConfig(
             provider=Provider(provider_str), model=model_str
         )
-        self.tutor: Tutor | None = None
-        self.session = Session()
-        self._is_processing = False
+        self.tutor: Tutor | RemoteTutor | PackTutor | None = None
+        self.ledger = UsageLedger(
+            LEDGER_PATH if self.config.settings.usage_ledger else None
+        )
+        self.tutor_pool = TutorPool(
+            self.ledger, max_requests=self.config.settings.max_requests
+        )
+        self.journal = (
+            SessionJournal(SESSION_DIR)
+            if self.config.settings.resume_sessions
+            else None
+        )
+        self.review_deck = (
+            ReviewDeck(REVIEW_DIR) if self.config.settings.review_cards else None
+        )
+        self.search_index = SearchIndex(SEARCH_PATH, NOTES_DIR, PLANS_PATH)
+        self.topic_index = TopicIndex(
+            PLANS_PATH, threshold=self.config.settings.plan_match_threshold
+        )
+        self.progress_store = (
+            ProgressStore(PROGRESS_PATH, on_error=self._on_progress_error)
+            if self.config.settings.track_progress
+            else None
+        )
+        self.lag_monitor = LagMonitor()
+        self._hud_timers: list[Timer] = []
+        self._tab_numbers = count(1)
+        self.tabs: list[LessonTab] = []
+        self.active_tab = self._new_tab()
+
+    def _new_tab(self) -> LessonTab:
+        tab = LessonTab(
+            next(self._tab_numbers),
+            ChatLog(fps=self.config.settings.stream_fps),
+            self.progress_store.track() if self.progress_store else None,
+        )
+        self.tabs.append(tab)
+        return tab
+
+    def _on_progress_error(self, error: Exception) -> None:
+        # Called on the progress writer thread.
+        if self.is_running:
+            self.call_from_thread(
+                self.active_tab.chat.add_message,
+                "System",
+                f"Could not save learning progress: {error}",
+                is_system=True,
+            )
+
+    # Handlers reach per-lesson state through the tab their worker runs in,
+    # so a background tab never writes into the one on screen.
+    @property
+    def tab(self) -> LessonTab:
+        return current_tab.get() or self.active_tab
+
+    @property
+    def session(self) -> Session:
+        return self.tab.session
+
+    @property
+    def progress(self) -> ProgressTracker | None:
+        return self.tab.progress
+
+    @property
+    def review(self) -> ReviewSession | None:
+        return self.tab.review
+
+    @review.setter
+    def review(self, review: ReviewSession | None) -> None:
+        self.tab.review = review
+
+    @property
+    def transcript(self) -> TranscriptWriter | None:
+        return self.tab.transcript
+
+    @transcript.setter
+    def transcript(self, transcript: TranscriptWriter | None) -> None:
+        self.tab.transcript = transcript
+
+    @property
+    def _is_processing(self) -> bool:
+        return self.tab.busy
 
     def on_mount(self) -> None:
+        if self.config_error:
+            self._show_config_error(self.config_error, "Using default settings")
         self._init_tutor()
+        self._resume_session()
+        self.set_interval(CONFIG_POLL_INTERVAL, self._check_config)
+        self.set_interval(POOL_SWEEP_INTERVAL, self.tutor_pool.evict_idle)
+        if self.config.settings.perf_hud:
+            self._show_hud(True)
         self.query_one(InputBar).focus_input()
 
-    def _init_tutor(self) -> None:
+    def on_unmount(self) -> None:
+        if self.journal:
+            self.journal.close()
+        for tab in self.tabs:
+            self._release_tab(tab)
+        if self.progress_store:
+            self.progress_store.close()
+        if self.review_deck:
+            self.review_deck.close()
+        self.search_index.close()
+        executor.shutdown()
+
+    def _release_tab(self, tab: LessonTab) -> None:
+        self._close_transcript(tab)
+        if tab.progress:
+            tab.session.unsubscribe(tab.progress.observe)
+        if self.journal and self.journal.session is tab.session:
+            self.journal.detach()
+
+    def _open_transcript(self, path: Path) -> None:
+        self._close_transcript()
+        self.transcript = TranscriptWriter(path)
+        if self.session.state.plan:
+            self.transcript.step = self.session.state.current_step
+        self.session.subscribe(self.transcript.observe)
+        self.tab.chat.transcript = self.transcript
+
+    def _close_transcript(self, tab: LessonTab | None = None) -> None:
+        tab = tab or self.tab
+        if not tab.transcript:
+            return
+        tab.session.unsubscribe(tab.transcript.observe)
+        tab.transcript.close()
+        tab.transcript = None
+        tab.chat.transcript = None
+
+    def _restore_transcript(self) -> None:
+        path = self.journal.transcript
+        if not path or not path.exists():
+            return
+        chat = self.tab.chat
+        for message in Transcript(path).tail(TRANSCRIPT_TAIL):
+            chat.add_message(
+                ROLE_SENDERS.get(message.role, "System"),
+                message.text,
+                is_user=message.role == "user",
+                is_system=message.role == "system",
+                record=False,
+            )
+        self._open_transcript(path)
+
+    def _resume_session(self) -> None:
+        if not self.journal:
+            return
         try:
-            self.tutor = Tutor(self.provider_config, self.config)
-            self._show_welcome()
+            resumed = self.journal.restore(self.session)
+        except Exception:
+            self.session.reset()
+            resumed = False
+        self.journal.attach(self.session)
+
+        if resumed:
+            if self.progress:
+                self.progress.resume(self.session.state)
+            if self.config.settings.save_transcripts:
+                self._restore_transcript()
+            self._update_header()
+            step = self.session.current_step()
+            where = f"'{step.title}'" if step else "the end"
+            hint = (
+                "Answer the quiz to continue"
+                if self.session.is_in_quiz()
+                else "Type 'next' to continue"
+            )
+            self.tab.chat.add_message(
+                "System",
+                f"Resumed lesson on {self.session.state.plan.topic} "
+                f"({self.session.progress_text()}, {where}). "
+                f"{hint}, or 'back' to revisit the previous step.",
+                is_system=True,
+                record=False,
+            )
+
+    def _init_tutor(self, welcome: bool = True) -> None:
+        try:
+            self.tutor = self.tutor_pool.get(self.provider_config, self.config)
         except ValueError as e:
-            self._show_error(str(e))
+            self.tutor = None
+            if not self.pack_path:
+                self._show_error(str(e))
+                return
+
+        if self.tutor and self.config.settings.use_daemon and SOCKET_PATH.exists():
+            # Requests go to the warm daemon; the pooled Tutor takes over if
+            # it is not answering.
+            self.tutor = RemoteTutor(self.tutor, SOCKET_PATH)
+
+        if self.pack_path:
+            try:
+                pack = LessonPack(Path(self.pack_path).expanduser())
+            except Exception as e:
+                self._show_error(f"Could not open lesson pack: {e}")
+                return
+            self.tutor = PackTutor(pack, fallback=self.tutor)
+
+        if welcome:
+            self._show_welcome()
 
     def compose(self) -> ComposeResult:
         yield Header(show_clock=False)
-        yield Container(
-            ChatLog(),
-        )
+        with TabbedContent(id="tabs", classes="single"):
+            tab = self.active_tab
+            yield TabPane(tab.label, tab.chat, id=tab.id)
         yield InputBar()
         yield CustomFooter(provider=self.provider_config.provider.value)
 
     def _show_welcome(self) -> None:
-        chat = self.query_one(ChatLog)
+        chat = self.tab.chat
         provider_name = self.provider_config.provider.value.upper()
         model_name = self.provider_config.model or DEFAULTS.get(
             self.provider_config.provider, "default"
         )
+        pack_line = f"Lesson pack: {self.pack_path}\n" if self.pack_path else ""
         chat.add_message(
             "System",
             f"Welcome to Groqmate! Your learning coach.\n"
             f"Provider: {provider_name} | Model: {model_name}\n"
+            f"{pack_line}"
             f"Type 'teach me <topic>' to start a lesson.\n"
-            f"Commands: next, wtf, summary, quit\n"
+            f"Commands: next, back, wtf, summary, review, search, quit\n"
             f"Press Ctrl+P for settings.",
             is_system=True,
         )
+        due = self.review_deck.due_count() if self.review_deck else 0
+        if due:
+            chat.add_message(
+                "System",
+                f"{due} card{'s' if due != 1 else ''} due for review. "
+                f"Type 'review' to start.",
+                is_system=True,
+            )
 
     def _show_error(self, message: str) -> None:
-        chat = self.query_one(ChatLog)
+        chat = self.tab.chat
         chat.add_message(
             "System",
             f"Error: {message}\nPress Ctrl+P to configure your API key.",
@@ -116,50 +334,226 @@ class GroqmateApp(App):
         )
 
     def _update_header(self) -> None:
-        progress = self.session.progress_text()
+        progress = self.active_tab.session.progress_text()
         if progress:
             self.title = f"Groqmate [{progress}]"
         else:
             self.title = "Groqmate"
+        self._update_tabs()
+
+    def _update_tabs(self) -> None:
+        if not self.is_running:
+            return
+        tabbed = self.query_one(TabbedContent)
+        for tab in self.tabs:
+            tabbed.get_tab(tab.id).label = tab.label
+        tabbed.set_class(len(self.tabs) == 1, "single")
+
+    def action_toggle_hud(self) -> None:
+        self._show_hud(not self._hud_timers)
+
+    def _show_hud(self, show: bool) -> None:
+        for timer in self._hud_timers:
+            timer.stop()
+        self._hud_timers = []
+        self.lag_monitor.reset()
+        if show:
+            # Lag is only sampled while the HUD is up, so it costs nothing
+            # when hidden.
+            self._hud_timers = [
+                self.set_interval(LAG_INTERVAL, self.lag_monitor.tick),
+                self.set_interval(HUD_INTERVAL, self._update_hud),
+            ]
+            self._update_hud()
+        else:
+            self.query_one(CustomFooter).update_hud(None)
+
+    def _update_hud(self) -> None:
+        self.query_one(CustomFooter).update_hud(
+            hud_text(self.active_tab.chat.stats, self.lag_monitor.lag, cache_hit_rate())
+        )
 
     def action_settings(self) -> None:
         self.push_screen(SettingsScreen(self.config))
 
     def _on_settings_saved(self) -> None:
-        self.config = Config.load()
+        self._apply_config(self.config, "Settings applied")
 
-        self.provider_config = ProviderConfig(
-            provider=Provider(self.config.settings.provider),
-            model=self.config.settings.model,
-        )
+    def _check_config(self) -> None:
+        try:
+            config = self.config_watcher.check()
+        except ConfigError as e:
+            self._show_config_error(e, "Keeping current settings")
+            return
+        # Saves from the settings screen land here too; they match already.
+        if config is not None and config != self.config:
+            self._apply_config(config, "Config file changed, settings reloaded", False)
 
-        self._init_tutor()
+    def _apply_config(self, config: Config, message: str, welcome: bool = True) -> None:
+        try:
+            # The settings screen edits the config in place, unvalidated.
+            Settings.model_validate(config.settings.model_dump())
+            provider_config = ProviderConfig(
+                provider=Provider(config.settings.provider),
+                model=config.settings.model,
+            )
+        except ValueError as e:
+            self._show_config_error(e, "Keeping current settings")
+            return
+
+        if config.settings.perf_hud != self.config.settings.perf_hud:
+            self._show_hud(config.settings.perf_hud)
+        self.config = config
+        self.provider_config = provider_config
+        self.topic_index.threshold = self.config.settings.plan_match_threshold
+        self.tutor_pool.set_max_requests(self.config.settings.max_requests)
+        for tab in self.tabs:
+            tab.chat.fps = self.config.settings.stream_fps
+
+        self._init_tutor(welcome)
 
         footer = self.query_one(CustomFooter)
         footer.update_provider(self.config.settings.provider)
 
-        chat = self.query_one(ChatLog)
+        chat = self.tab.chat
         chat.add_message(
             "System",
-            f"Settings applied. Provider: {self.config.settings.provider.upper()}",
+            f"{message}. Provider: {self.config.settings.provider.upper()}",
             is_system=True,
         )
 
-    async def on_input_bar_submitted(self, message: InputBar.Submitted) -> None:
-        if self._is_processing:
-            return
+    def _show_config_error(self, error: Exception, fallback: str) -> None:
+        self.tab.chat.add_message(
+            "System",
+            f"Error: {error}\n{fallback}; fix the file and it will be reloaded.",
+            is_system=True,
+        )
 
+    async def on_input_bar_submitted(self, message: InputBar.Submitted) -> None:
         user_input = message.value.strip()
         if not user_input:
             return
 
-        chat = self.query_one(ChatLog)
-        chat.add_message("You", user_input, is_user=True)
+        tab = self.active_tab
+        tab.chat.add_message("You", user_input, is_user=True)
 
-        await self._handle_input(user_input)
+        lower_input = user_input.lower()
+        if lower_input in STOP_COMMANDS:
+            self._stop(tab, quiet=False)
+            return
+        if lower_input in ("quit", "exit", "q"):
+            self.exit()
+            return
+        if lower_input in NEW_TAB_COMMANDS:
+            await self.action_new_tab()
+            return
+        if lower_input in CLOSE_TAB_COMMANDS:
+            await self.action_close_tab()
+            return
+
+        # Tutor calls run in a worker per tab, so the input stays live while
+        # a reply streams; anything typed meanwhile waits in that tab's queue.
+        tab.inputs.append(user_input)
+        if tab.busy:
+            tab.chat.add_message(
+                "System",
+                "Queued until the current reply finishes. Type 'stop' to cancel "
+                "it, or press Ctrl+T to start another lesson in a new tab.",
+                is_system=True,
+            )
+            return
+        tab.worker = self.run_worker(
+            self._drain_inputs(tab), name=tab.id, group="tutor", exit_on_error=False
+        )
+        self._update_tabs()
+
+    async def _drain_inputs(self, tab: LessonTab) -> None:
+        current_tab.set(tab)
+        while tab.inputs:
+            try:
+                await self._handle_input(tab.inputs.popleft())
+            except asyncio.CancelledError:
+                if tab.chat.streaming:
+                    tab.chat.append_to_streaming("\n[stopped]")
+                    tab.chat.finalize_streaming()
+                raise
+            except Exception as e:
+                self._show_error(str(e))
+
+    def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
+        if event.worker.group == "tutor":
+            self._update_tabs()
+
+    def action_stop(self) -> None:
+        self._stop(self.active_tab, quiet=True)
+
+    def _stop(self, tab: LessonTab, quiet: bool) -> None:
+        dropped = len(tab.inputs)
+        tab.inputs.clear()
+        running = tab.busy
+        if running:
+            tab.worker.cancel()
+        if quiet and not running and not dropped:
+            return
+        if running:
+            text = "Stopped."
+        elif dropped:
+            text = "Cleared queued commands."
+        else:
+            text = "Nothing to stop."
+        if running and dropped:
+            text += f" Dropped {dropped} queued command(s)."
+        tab.chat.add_message("System", text, is_system=True)
+
+    async def action_new_tab(self) -> None:
+        tab = self._new_tab()
+        tabbed = self.query_one(TabbedContent)
+        await tabbed.add_pane(TabPane(tab.label, tab.chat, id=tab.id))
+        tabbed.active = tab.id
+        self._activate(tab)
+        self._show_welcome()
+
+    def action_next_tab(self) -> None:
+        index = self.tabs.index(self.active_tab)
+        tab = self.tabs[(index + 1) % len(self.tabs)]
+        self.query_one(TabbedContent).active = tab.id
+        self._activate(tab)
+
+    async def action_close_tab(self) -> None:
+        tab = self.active_tab
+        if len(self.tabs) == 1:
+            tab.chat.add_message("System", "This is the only tab.", is_system=True)
+            return
+        tab.inputs.clear()
+        if tab.busy:
+            tab.worker.cancel()
+            with contextlib.suppress(WorkerCancelled, WorkerFailed):
+                await tab.worker.wait()
+        self._release_tab(tab)
+        index = self.tabs.index(tab)
+        self.tabs.remove(tab)
+        tabbed = self.query_one(TabbedContent)
+        await tabbed.remove_pane(tab.id)
+        tab = self.tabs[min(index, len(self.tabs) - 1)]
+        tabbed.active = tab.id
+        self._activate(tab)
+
+    def on_tabbed_content_tab_activated(
+        self, event: TabbedContent.TabActivated
+    ) -> None:
+        for tab in self.tabs:
+            if tab.id == event.pane.id and tab is not self.active_tab:
+                self._activate(tab)
+
+    def _activate(self, tab: LessonTab) -> None:
+        self.active_tab = tab
+        for other in self.tabs:
+            other.chat.set_background(other is not tab)
+        self._update_header()
+        self.query_one(InputBar).focus_input()
 
     async def _handle_input(self, user_input: str) -> None:
-        chat = self.query_one(ChatLog)
+        chat = self.tab.chat
         lower_input = user_input.lower()
 
         if lower_input in ("quit", "exit", "q"):
@@ -175,6 +569,14 @@ class GroqmateApp(App):
             self._show_help()
             return
 
+        if self.review:
+            await self._handle_review_answer(user_input)
+            return
+
+        if lower_input == "review":
+            self._start_review()
+            return
+
         if lower_input == "wtf":
             await self._handle_wtf()
             return
@@ -187,13 +589,21 @@ class GroqmateApp(App):
             await self._handle_next()
             return
 
+        if lower_input == "back":
+            self._handle_back()
+            return
+
         if self.session.is_in_quiz():
             await self._handle_quiz_answer(user_input)
             return
 
         if lower_input.startswith("teach me "):
             topic = user_input[9:].strip()
-            await self._start_lesson(topic)
+            await self._start_lesson(topic, user_input)
+            return
+
+        if lower_input == "search" or lower_input.startswith("search "):
+            await self._handle_search(user_input[7:].strip())
             return
 
         chat.add_message(
@@ -203,37 +613,67 @@ class GroqmateApp(App):
         )
 
     def _show_help(self) -> None:
-        chat = self.query_one(ChatLog)
+        chat = self.tab.chat
         chat.add_message(
             "System",
             "Commands:\n"
             "  teach me <topic>  - Start a new lesson\n"
             "  next              - Move to next step\n"
+            "  back              - Return to the previous step\n"
             "  wtf               - Explain differently\n"
             "  summary           - Generate lesson notes\n"
+            "  review            - Review past quiz questions that are due\n"
+            "  search <query>    - Search saved notes and past lessons\n"
+            "  stop / esc        - Stop the current reply and queued commands\n"
+            "  F2                - Toggle the performance HUD in the footer\n"
+            "  tab / close       - Open a new lesson tab (Ctrl+T) or close this one\n"
             "  clear             - Clear chat\n"
             "  quit              - Exit",
             is_system=True,
         )
 
-    async def _start_lesson(self, topic: str) -> None:
+    async def _start_lesson(self, topic: str, request: str | None = None) -> None:
         if not self.tutor:
             return
 
-        chat = self.query_one(ChatLog)
-        self._is_processing = True
+        chat = self.tab.chat
 
-        msg = chat.add_message("Groqmate", "", is_streaming=True)
+        msg = chat.add_message("Groqmate", "", is_streaming=True, record=False)
         chat.append_to_streaming(f"Generating lesson plan for: {topic}...")
 
         try:
-            plan = await self.tutor.generate_plan(topic)
+            match = None
+            if self.config.settings.reuse_plans:
+                match = await executor.offload(self.topic_index.lookup, topic)
+
+            if match:
+                plan = match.plan
+            else:
+                plan = await self.tutor.generate_plan(topic)
+                await executor.offload(self.topic_index.add, plan, topic)
+
+            # The transcript opens before the plan loads, so it starts with
+            # the request and the journal's snapshot points at it.
+            path = None
+            if self.config.settings.save_transcripts:
+                path = new_transcript_path(topic, TRANSCRIPTS_DIR)
+                self._open_transcript(path)
+                self.transcript.step = None
+                self.transcript.message("user", request or f"teach me {topic}")
+            if self.journal and self.journal.session is self.session:
+                self.journal.transcript = path
             self.session.load_plan(plan)
             self._update_header()
 
             chat.finalize_streaming()
-            msg.remove()
-
+            chat.remove_message(msg)
+
+            if match:
+                chat.add_message(
+                    "System",
+                    f"Reusing saved lesson plan for '{match.topic}'.",
+                    is_system=True,
+                )
             chat.add_message(
                 "System",
                 f"Lesson: {plan.topic} ({plan.total_steps} steps)",
@@ -244,38 +684,40 @@ class GroqmateApp(App):
 
         except Exception as e:
             chat.finalize_streaming()
-            msg.remove()
+            chat.remove_message(msg)
             chat.add_message("System", f"Error: {e}", is_system=True)
 
-        self._is_processing = False
-
     async def _explain_current_step(self) -> None:
         if not self.tutor:
             return
 
-        chat = self.query_one(ChatLog)
+        chat = self.tab.chat
 
         msg = chat.add_message("Groqmate", "", is_streaming=True)
 
         try:
             async for token in self.tutor.explain_step_stream(self.session):
                 chat.append_to_streaming(token)
-                await asyncio.sleep(0)
 
             chat.finalize_streaming()
             self.session.enter_quiz()
 
         except Exception as e:
-            chat.finalize_streaming()
             chat.append_to_streaming(f"\nError: {e}")
+            chat.finalize_streaming()
 
     async def _handle_quiz_answer(self, answer: str) -> None:
         if not self.tutor:
             return
 
-        chat = self.query_one(ChatLog)
+        chat = self.tab.chat
 
+        step = self.session.current_step()
         correct, feedback = await self.tutor.check_answer(answer, self.session)
+        if self.progress:
+            self.progress.attempt(correct)
+        if correct and step and self.review_deck:
+            self.review_deck.add(self.session.state.plan.topic, step)
 
         if correct:
             chat.add_message("Groqmate", feedback, is_user=False)
@@ -284,7 +726,7 @@ class GroqmateApp(App):
             chat.add_message("Groqmate", feedback, is_user=False)
 
     async def _handle_next(self) -> None:
-        chat = self.query_one(ChatLog)
+        chat = self.tab.chat
 
         if not self.session.state.plan:
             chat.add_message(
@@ -320,35 +762,123 @@ class GroqmateApp(App):
                 "Lesson complete! Type 'summary' to get your notes.",
                 is_user=False,
             )
+            if self.tutor and self.tutor.grader.stats.total:
+                chat.add_message(
+                    "System", self.tutor.grader.stats.report(), is_system=True
+                )
+            if self.tutor and self.tutor.ledger.totals.calls:
+                chat.add_message("System", self.tutor.ledger.report(), is_system=True)
+
+    def _handle_back(self) -> None:
+        chat = self.tab.chat
+
+        if not self.session.back():
+            chat.add_message(
+                "System",
+                (
+                    "Already at the first step."
+                    if self.session.state.plan
+                    else "No active lesson. Start with 'teach me <topic>'"
+                ),
+                is_system=True,
+            )
+            return
+
+        self._update_header()
+        step = self.session.current_step()
+        chat.add_message(
+            "Groqmate",
+            f"Back to {step.title}.\n\n{step.concept}\n\nQuiz: {step.quiz_question}",
+            is_user=False,
+        )
+        self.session.enter_quiz()
+
+    def _start_review(self) -> None:
+        chat = self.tab.chat
+
+        if not self.review_deck:
+            chat.add_message(
+                "System", "Review cards are disabled in settings.", is_system=True
+            )
+            return
+
+        self.review = ReviewSession(self.review_deck)
+        chat.add_message(
+            "System",
+            "Review mode. Answer each question, 'skip' to reveal the answer, "
+            "or 'done' to stop.",
+            is_system=True,
+        )
+        self._show_next_card()
+
+    def _show_next_card(self) -> None:
+        card = self.review.next_card()
+        if card is None:
+            self._end_review("No more cards due.")
+            return
+        self.tab.chat.add_message(
+            "Groqmate", f"[{card.topic}] {card.quiz_question}", is_user=False
+        )
+
+    async def _handle_review_answer(self, user_input: str) -> None:
+        if user_input.lower() == "done":
+            self._end_review()
+            return
+
+        card = self.review_deck.card(self.review.current)
+        now = time.time()
+        if user_input.lower() == "skip":
+            self.review.skip(now)
+            feedback = f"The answer is: {card.quiz_answer}. It will come back soon."
+        else:
+            verdict, schedule = await self.review.answer(user_input, now)
+            feedback = (
+                f"Correct! Next review in {format_wait(schedule.due - now)}."
+                if verdict.correct
+                else f"Not quite. The answer is: {card.quiz_answer}. "
+                f"It will come back soon."
+            )
+        self.tab.chat.add_message("Groqmate", feedback, is_user=False)
+        self._show_next_card()
+
+    def _end_review(self, reason: str = "Review finished.") -> None:
+        message = f"{reason} {self.review.report()}"
+        next_due = self.review_deck.next_due_at()
+        if next_due is not None:
+            message += f" Next card due in {format_wait(next_due - time.time())}."
+        self.review = None
+        self.tab.chat.add_message("System", message, is_system=True)
 
     async def _handle_wtf(self) -> None:
         if not self.tutor:
             return
 
-        chat = self.query_one(ChatLog)
+        chat = self.tab.chat
 
         if not self.session.state.plan:
             chat.add_message("System", "No active lesson to rephrase.", is_system=True)
             return
 
+        if self.progress:
+            self.progress.wtf()
+
         msg = chat.add_message("Groqmate", "", is_streaming=True)
 
         try:
             async for token in self.tutor.rephrase_stream(self.session):
                 chat.append_to_streaming(token)
-                await asyncio.sleep(0)
 
             chat.finalize_streaming()
 
         except Exception as e:
-            chat.finalize_streaming()
             chat.append_to_streaming(f"\nError: {e}")
+            chat.finalize_streaming()
 
     async def _handle_summary(self) -> None:
         if not self.tutor:
             return
 
-        chat = self.query_one(ChatLog)
+        chat = self.tab.chat
 
         if not self.session.state.plan:
             chat.add_message("System", "No lesson to summarize.", is_system=True)
@@ -359,83 +889,51 @@ class GroqmateApp(App):
         try:
             summary = await self.tutor.generate_summary(self.session)
 
-            topic_slug = self.session.state.plan.topic.lower().replace(" ", "_")
-            filename = f"{topic_slug}_notes.md"
+            topic_slug = slugify(self.session.state.plan.topic, "_")
+            NOTES_DIR.mkdir(parents=True, exist_ok=True)
+            path = NOTES_DIR / f"{topic_slug}_notes.md"
 
-            with open(filename, "w") as f:
+            with open(path, "w") as f:
                 f.write(summary)
+            await executor.offload(self.search_index.add_note, path)
 
-            chat.add_message("System", f"Summary saved to {filename}", is_system=True)
+            chat.add_message("System", f"Summary saved to {path}", is_system=True)
             chat.add_message("Groqmate", summary, is_user=False)
 
         except Exception as e:
             chat.add_message("System", f"Error: {e}", is_system=True)
 
+    async def _handle_search(self, query: str) -> None:
+        chat = self.tab.chat
+
+        if not query:
+            chat.add_message("System", "Usage: search <query>", is_system=True)
+            return
+
+        def run() -> list:
+            self.search_index.refresh()
+            return self.search_index.search(query, limit=SEARCH_RESULTS)
+
+        try:
+            hits = await executor.offload(run)
+        except Exception as e:
+            chat.add_message("System", f"Search failed: {e}", is_system=True)
+            return
+
+        if not hits:
+            chat.add_message("System", f"No results for '{query}'.", is_system=True)
+            return
+
+        lines = [f"Results for '{query}':"]
+        for n, hit in enumerate(hits, 1):
+            where = hit.path if hit.kind == "note" else "saved lesson"
+            lines.append(f"{n}. {hit.title} ({where})\n   {hit.snippet}")
+        chat.add_message("System", "\n".join(lines), is_system=True)
+
     def action_clear(self) -> None:
-        chat = self.query_one(ChatLog)
+        self._stop(self.active_tab, quiet=True)
+        chat = self.tab.chat
         chat.clear_chat()
         self.session.reset()
         self._update_header()
         self._show_welcome()
-
-
-def run():
-    parser = argparse.ArgumentParser(
-        description="Groqmate - Interactive CLI learning coach",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  groqmate                    # Use default provider
-  groqmate gemini             # Quick switch to Gemini
-  groqmate groq/llama-3.1     # Use specific model
-  groqmate ollama             # Use local Ollama
-
-Supported providers: groq, gemini, openai, deepseek, openrouter, ollama, anthropic, mistral
-        """,
-    )
-    parser.add_argument(
-        "provider",
-        nargs="?",
-        help="Provider or provider/model (e.g., 'gemini' or 'groq/llama-3.1')",
-    )
-    parser.add_argument(
-        "--provider",
-        "-p",
-        dest="provider_flag",
-        choices=VALID_PROVIDERS,
-        help="LLM provider to use (overrides positional arg)",
-    )
-    parser.add_argument(
-        "--model", "-m", help="Specific model to use (overrides provider default)"
-    )
-    parser.add_argument(
-        "--list-providers",
-        "-l",
-        action="store_true",
-        help="List available providers and their default models",
-    )
-
-    args = parser.parse_args()
-
-    if args.list_providers:
-        show_providers_and_exit()
-
-    provider = None
-    model = args.model
-
-    if args.provider_flag:
-        provider = args.provider_flag
-    elif args.provider:
-        provider, model_from_arg = parse_provider_arg(args.provider)
-        if provider not in VALID_PROVIDERS:
-            print(f"Error: '{provider}' is not a valid provider.\n")
-            show_providers_and_exit()
-        if model_from_arg and not args.model:
-            model = model_from_arg
-
-    app = GroqmateApp(provider=provider, model=model)
-    app.run()
-
-
-if __name__ == "__main__":
-    run()
@@ -0,0 +1,279 @@
+import argparse
+import asyncio
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+from groqmate.core.compiler import LessonCompiler, open_sink, read_topics
+from groqmate.core.config import Config, ConfigError
+from groqmate.core.daemon import (
+    IDLE_SHUTDOWN,
+    MAX_REQUESTS,
+    SOCKET_PATH,
+    DaemonError,
+    TutorDaemon,
+    call,
+    ping,
+)
+from groqmate.core.ledger import LEDGER_PATH, ROLLUP_KEYS, UsageLedger
+from groqmate.core.progress import PROGRESS_PATH, ProgressReader
+from groqmate.core.providers import Provider, ProviderConfig
+from groqmate.core.tutor import Tutor
+
+
+def compile_command(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(
+        prog="groqmate compile",
+        description="Pre-generate lessons (plan, step explanations, summary) for a list of topics",
+    )
+    parser.add_argument(
+        "topics", help="File with one topic per line ('-' reads from stdin)"
+    )
+    parser.add_argument(
+        "--output",
+        "-o",
+        default="lessons.jsonl",
+        help="JSONL file or lesson pack (.gmpack) to append to; existing topics are skipped",
+    )
+    parser.add_argument(
+        "--concurrency",
+        "-c",
+        type=int,
+        default=4,
+        help="Maximum number of concurrent provider requests",
+    )
+    parser.add_argument(
+        "--rpm", type=float, help="Maximum provider requests per minute"
+    )
+    parser.add_argument(
+        "--provider", "-p", choices=[p.value for p in Provider], help="LLM provider"
+    )
+    parser.add_argument("--model", "-m", help="Specific model to use")
+    args = parser.parse_args(argv)
+
+    if args.topics == "-":
+        topics = read_topics(sys.stdin)
+    else:
+        try:
+            with open(args.topics, encoding="utf-8") as f:
+                topics = read_topics(f)
+        except OSError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+
+    try:
+        config = Config.load()
+    except ConfigError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    provider_config = ProviderConfig(
+        provider=Provider(args.provider or config.settings.provider),
+        model=args.model or (None if args.provider else config.settings.model),
+    )
+    try:
+        ledger = UsageLedger(LEDGER_PATH if config.settings.usage_ledger else None)
+        tutor = Tutor(provider_config, config, ledger)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    def progress(topic: str, error: Exception | None) -> None:
+        if error:
+            print(f"  failed  {topic}: {error}", file=sys.stderr)
+        else:
+            print(f"  done    {topic}")
+
+    compiler = LessonCompiler(
+        tutor, concurrency=args.concurrency, requests_per_minute=args.rpm
+    )
+    sink = open_sink(Path(args.output))
+    print(f"Compiling {len(topics)} topics with {provider_config.get_model_string()}")
+    try:
+        stats = asyncio.run(compiler.run(topics, sink, on_progress=progress))
+    except KeyboardInterrupt:
+        print("\nInterrupted. Re-run the same command to resume.")
+        return 130
+    finally:
+        sink.close()
+
+    print(stats.report())
+    print(ledger.report())
+    return 1 if stats.failed else 0
+
+
+def usage_command(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(
+        prog="groqmate usage",
+        description="Summarize token usage and estimated cost from the usage ledger",
+    )
+    parser.add_argument(
+        "--by",
+        default="day,provider,operation",
+        help=f"Comma-separated grouping keys ({', '.join(ROLLUP_KEYS)})",
+    )
+    parser.add_argument(
+        "--days", type=int, help="Only include the last N days of usage"
+    )
+    parser.add_argument(
+        "--ledger", default=str(LEDGER_PATH), help="Path to the usage ledger"
+    )
+    args = parser.parse_args(argv)
+
+    keys = [k.strip() for k in args.by.split(",") if k.strip()]
+    since = date.today() - timedelta(days=args.days - 1) if args.days else None
+    try:
+        groups = UsageLedger(Path(args.ledger).expanduser()).rollup(keys, since)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    if not groups:
+        print("No usage recorded yet.")
+        return 0
+
+    header = [*keys, "calls", "prompt", "completion", "cached", "avg s", "cost $"]
+    rows = [
+        [
+            *group,
+            str(r.calls),
+            f"{r.prompt_tokens:,}",
+            f"{r.completion_tokens:,}",
+            f"{r.cached_tokens:,}",
+            f"{r.avg_latency:.2f}",
+            f"{r.cost:.4f}",
+        ]
+        for group, r in groups.items()
+    ]
+    print_table(header, rows, numeric_from=len(keys))
+    return 0
+
+
+def print_table(header: list[str], rows: list[list[str]], numeric_from: int) -> None:
+    widths = [max(len(row[i]) for row in [header, *rows]) for i in range(len(header))]
+    for row in [header, *rows]:
+        cells = [
+            cell.rjust(w) if i >= numeric_from else cell.ljust(w)
+            for i, (cell, w) in enumerate(zip(row, widths))
+        ]
+        print("  ".join(cells).rstrip())
+
+
+def stats_command(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(
+        prog="groqmate stats",
+        description="Show lesson completion, quiz attempts and wtf usage per topic",
+    )
+    parser.add_argument("topic", nargs="?", help="Break one topic down by step")
+    parser.add_argument(
+        "--db", default=str(PROGRESS_PATH), help="Path to the progress database"
+    )
+    args = parser.parse_args(argv)
+
+    reader = ProgressReader(Path(args.db).expanduser())
+    if args.topic:
+        steps = reader.steps(args.topic)
+        if not steps:
+            print(f"No progress recorded for '{args.topic}'.")
+            return 0
+        header = ["step", "title", "completed", "attempts", "per pass", "wtf"]
+        rows = [
+            [
+                str(s.step + 1),
+                s.title,
+                str(s.completed),
+                str(s.attempts),
+                f"{s.attempts_per_pass:.1f}",
+                str(s.wtf),
+            ]
+            for s in steps
+        ]
+        print_table(header, rows, numeric_from=2)
+        return 0
+
+    topics = reader.topics()
+    if not topics:
+        print("No progress recorded yet.")
+        return 0
+    header = ["topic", "lessons", "finished", "rate", "attempts", "accuracy", "wtf"]
+    rows = [
+        [
+            t.topic,
+            str(t.lessons),
+            str(t.finished),
+            f"{t.completion_rate:.0%}",
+            str(t.attempts),
+            f"{t.accuracy:.0%}",
+            str(t.wtf),
+        ]
+        for t in topics
+    ]
+    print_table(header, rows, numeric_from=1)
+    return 0
+
+
+def daemon_command(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(
+        prog="groqmate daemon",
+        description="Keep tutors warm in the background so groqmate starts instantly",
+    )
+    parser.add_argument(
+        "--idle",
+        type=float,
+        default=IDLE_SHUTDOWN,
+        help="Exit after this many seconds without clients",
+    )
+    parser.add_argument(
+        "--max-requests",
+        type=int,
+        default=MAX_REQUESTS,
+        help="Provider requests in flight at once, across all clients",
+    )
+    parser.add_argument(
+        "--socket", default=str(SOCKET_PATH), help="Path of the Unix socket"
+    )
+    parser.add_argument(
+        "--status", action="store_true", help="Report whether a daemon is running"
+    )
+    parser.add_argument("--stop", action="store_true", help="Stop a running daemon")
+    args = parser.parse_args(argv)
+    path = Path(args.socket).expanduser()
+
+    if args.status:
+        status = asyncio.run(ping(path))
+        if not status:
+            print("No daemon running.")
+            return 1
+        print(
+            f"Daemon running (pid {status['pid']}): {status['clients']} clients, "
+            f"{status['served']} requests served"
+        )
+        return 0
+
+    if args.stop:
+        try:
+            asyncio.run(call(path, {"op": "stop"}))
+        except DaemonError:
+            print("No daemon running.")
+            return 1
+        print("Daemon stopped.")
+        return 0
+
+    daemon = TutorDaemon(path, idle_shutdown=args.idle, max_requests=args.max_requests)
+    daemon.warm()
+    print(f"Listening on {path} (exits after {args.idle:.0f}s idle)")
+    try:
+        asyncio.run(daemon.serve())
+    except DaemonError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+SUBCOMMANDS = {
+    "compile": compile_command,
+    "usage": usage_command,
+    "stats": stats_command,
+    "daemon": daemon_command,
+}
@@ -0,0 +1,91 @@
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+from textual.message import Message
+from textual.message_pump import MessagePump
+
+T = TypeVar("T")
+
+# Jobs on app-owned state (indexes, SQLite) run on one thread, in order, so
+# they never race each other. Pure CPU work such as Markdown layout runs in
+# a worker process, so it does not hold the GIL the event loop needs.
+CPU_WORKERS = 1
+# The worker yields the CPU to the UI whenever both want it, which matters
+# most on machines with a single core.
+WORKER_NICE = 10
+
+_threads: ThreadPoolExecutor | None = None
+_processes: ProcessPoolExecutor | None = None
+
+
+def threads() -> ThreadPoolExecutor:
+    global _threads
+    if _threads is None:
+        _threads = ThreadPoolExecutor(max_workers=1, thread_name_prefix="groqmate-cpu")
+    return _threads
+
+
+async def offload(fn: Callable[..., T], *args: Any) -> T:
+    return await asyncio.get_running_loop().run_in_executor(threads(), fn, *args)
+
+
+def _lower_priority() -> None:
+    if hasattr(os, "nice"):
+        os.nice(WORKER_NICE)
+
+
+def start(*warmups: Callable[[], Any]) -> list[Future]:
+    # Must run before the TUI takes over the terminal: spawning a process
+    # from inside Textual fails on the redirected standard streams.
+    global _processes
+    if _processes is not None:
+        return []
+    _processes = ProcessPoolExecutor(
+        max_workers=CPU_WORKERS,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_lower_priority,
+    )
+    return [_processes.submit(warmup) for warmup in warmups]
+
+
+def started() -> bool:
+    return _processes is not None
+
+
+def submit(
+    target: MessagePump,
+    reply: Callable[[T | None], Message],
+    fn: Callable[..., T],
+    *args: Any,
+) -> Future | None:
+    # The result comes back as a message on target's queue, so it is handled
+    # on the event loop like any other event. A failed job replies with None
+    # and the caller does the work inline instead.
+    def done(future: Future) -> None:
+        if future.cancelled():
+            return
+        result = None if future.exception() else future.result()
+        target.post_message(reply(result))
+
+    try:
+        if _processes is None:
+            raise RuntimeError("process pool not started")
+        future = _processes.submit(fn, *args)
+    except (RuntimeError, OSError, ValueError):
+        target.post_message(reply(None))
+        return None
+    future.add_done_callback(done)
+    return future
+
+
+def shutdown() -> None:
+    global _threads, _processes
+    if _threads is not None:
+        _threads.shutdown(wait=False, cancel_futures=True)
+        _threads = None
+    if _processes is not None:
+        _processes.shutdown(wait=False, cancel_futures=True)
+        _processes = None
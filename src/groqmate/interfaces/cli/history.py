@@ -0,0 +1,87 @@
+import json
+import tempfile
+from array import array
+from collections import deque
+from typing import IO, NamedTuple
+
+import pydantic_core
+
+HISTORY_IN_MEMORY = 1000
+
+
+class ChatRecord(NamedTuple):
+    sender: str
+    content: str
+    is_user: bool = False
+    is_system: bool = False
+
+
+class ChatHistory:
+    def __init__(self, memory_limit: int | None = HISTORY_IN_MEMORY):
+        self.memory_limit = memory_limit
+        self._recent: deque[ChatRecord] = deque()
+        self._offsets = array("Q")
+        self._spill: IO[bytes] | None = None
+
+    def __len__(self) -> int:
+        return len(self._offsets) + len(self._recent)
+
+    @property
+    def spilled(self) -> int:
+        return len(self._offsets)
+
+    def append(self, record: ChatRecord) -> int:
+        self._recent.append(record)
+        if self.memory_limit is not None:
+            while len(self._recent) > self.memory_limit:
+                self._spill_oldest()
+        return len(self) - 1
+
+    def _spill_oldest(self) -> None:
+        # Older records move to an anonymous temp file, one JSON line each,
+        # addressed through an in-memory offset table.
+        if self._spill is None:
+            self._spill = tempfile.TemporaryFile(prefix="groqmate-chat-")
+        record = self._recent.popleft()
+        self._spill.seek(0, 2)
+        self._offsets.append(self._spill.tell())
+        self._spill.write(json.dumps(list(record), ensure_ascii=False).encode())
+        self._spill.write(b"\n")
+
+    def __getitem__(self, index: int) -> ChatRecord:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        if index >= self.spilled:
+            return self._recent[index - self.spilled]
+        self._spill.seek(self._offsets[index])
+        return ChatRecord(*pydantic_core.from_json(self._spill.readline()))
+
+    def slice(self, start: int, end: int) -> list[ChatRecord]:
+        start, end = max(0, start), min(end, len(self))
+        return [self[i] for i in range(start, end)]
+
+    def __setitem__(self, index: int, record: ChatRecord) -> None:
+        if index < 0:
+            index += len(self)
+        if index < self.spilled:
+            raise IndexError("spilled records are read-only")
+        self._recent[index - self.spilled] = record
+
+    def __delitem__(self, index: int) -> None:
+        if index < 0:
+            index += len(self)
+        if index < self.spilled:
+            raise IndexError("spilled records are read-only")
+        del self._recent[index - self.spilled]
+
+    def clear(self) -> None:
+        self._recent.clear()
+        self._offsets = array("Q")
+        self.close()
+
+    def close(self) -> None:
+        if self._spill is not None:
+            self._spill.close()
+            self._spill = None
@@ -0,0 +1,121 @@
+import argparse
+import sys
+
+from groqmate.core.providers import DEFAULTS, Provider
+
+# Kept in step with commands.SUBCOMMANDS, which is only imported when one
+# of them runs.
+SUBCOMMAND_NAMES = ("compile", "usage", "stats", "daemon")
+
+VALID_PROVIDERS = [
+    "groq",
+    "gemini",
+    "openai",
+    "deepseek",
+    "openrouter",
+    "ollama",
+    "anthropic",
+    "mistral",
+]
+
+
+def show_providers_and_exit():
+    print("Available providers:\n")
+    for provider in Provider:
+        default = DEFAULTS.get(provider, "N/A")
+        local = "(local, no API key needed)" if provider == Provider.OLLAMA else ""
+        print(f"  {provider.value:12} {default:30} {local}")
+    print("\nUsage:")
+    print("  groqmate                 # Use default provider")
+    print("  groqmate gemini          # Use Gemini")
+    print("  groqmate groq/llama-3.1  # Use specific model")
+    sys.exit(1)
+
+
+def parse_provider_arg(arg: str) -> tuple[str, str | None]:
+    if "/" in arg:
+        provider, model = arg.split("/", 1)
+        return provider.lower(), model
+    return arg.lower(), None
+
+
+def run(argv: list[str] | None = None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] in SUBCOMMAND_NAMES:
+        from groqmate.interfaces.cli.commands import SUBCOMMANDS
+
+        sys.exit(SUBCOMMANDS[argv[0]](argv[1:]))
+
+    parser = argparse.ArgumentParser(
+        description="Groqmate - Interactive CLI learning coach",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  groqmate                    # Use default provider
+  groqmate gemini             # Quick switch to Gemini
+  groqmate groq/llama-3.1     # Use specific model
+  groqmate ollama             # Use local Ollama
+  groqmate compile topics.txt # Pre-generate lessons for a list of topics
+  groqmate usage --by model   # Token and cost rollups from the usage ledger
+  groqmate stats recursion    # Completion, quiz attempts and wtf use per step
+  groqmate daemon             # Keep tutors warm so later launches start instantly
+
+Supported providers: groq, gemini, openai, deepseek, openrouter, ollama, anthropic, mistral
+        """,
+    )
+    parser.add_argument(
+        "provider",
+        nargs="?",
+        help="Provider or provider/model (e.g., 'gemini' or 'groq/llama-3.1')",
+    )
+    parser.add_argument(
+        "--provider",
+        "-p",
+        dest="provider_flag",
+        choices=VALID_PROVIDERS,
+        help="LLM provider to use (overrides positional arg)",
+    )
+    parser.add_argument(
+        "--model", "-m", help="Specific model to use (overrides provider default)"
+    )
+    parser.add_argument(
+        "--pack",
+        help="Serve lessons from an offline lesson pack, falling back to the provider",
+    )
+    parser.add_argument(
+        "--list-providers",
+        "-l",
+        action="store_true",
+        help="List available providers and their default models",
+    )
+
+    args = parser.parse_args(argv)
+
+    if args.list_providers:
+        show_providers_and_exit()
+
+    provider = None
+    model = args.model
+
+    if args.provider_flag:
+        provider = args.provider_flag
+    elif args.provider:
+        provider, model_from_arg = parse_provider_arg(args.provider)
+        if provider not in VALID_PROVIDERS:
+            print(f"Error: '{provider}' is not a valid provider.\n")
+            show_providers_and_exit()
+        if model_from_arg and not args.model:
+            model = model_from_arg
+
+    # Textual and Rich are only loaded once we know the TUI is starting, so
+    # --help and --list-providers return straight away.
+    from groqmate.interfaces.cli import executor, markdown
+    from groqmate.interfaces.cli.app import GroqmateApp
+
+    executor.start(markdown.warm)
+    app = GroqmateApp(provider=provider, model=model, pack=args.pack)
+    app.run()
+
+
+if __name__ == "__main__":
+    run()
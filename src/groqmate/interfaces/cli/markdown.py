@@ -0,0 +1,120 @@
+from functools import lru_cache
+
+from markdown_it import MarkdownIt
+from rich.console import Console
+from rich.markdown import Markdown
+from rich.segment import Segment
+from rich.text import Text
+
+CODE_THEME = "monokai"
+FENCES = ("```", "~~~")
+
+_PARSER = MarkdownIt().enable("strikethrough").enable("table")
+_CONSOLE = Console(force_terminal=True, color_system="truecolor", legacy_windows=False)
+
+
+class ChatMarkdown(Markdown):
+    # Markdown.__init__ builds a new MarkdownIt parser on every call, which
+    # costs more than parsing a block; all blocks share _PARSER instead.
+    def __init__(self, markup: str):
+        self.markup = markup
+        self.parsed = _PARSER.parse(markup)
+        self.code_theme = CODE_THEME
+        self.justify = None
+        self.style = "none"
+        self.hyperlinks = True
+        self.inline_code_lexer = None
+        self.inline_code_theme = CODE_THEME
+        # Keep every newline the model wrote, so ASCII diagrams and
+        # line-per-point answers render the way they did as plain text.
+        for token in self.parsed:
+            for child in token.children or ():
+                if child.type == "softbreak":
+                    child.type = "hardbreak"
+
+
+def _trim(segments: list[Segment]) -> list[Segment]:
+    # Drop right padding, but keep padding that carries a background, such
+    # as the body of a highlighted code block.
+    segments = [s for s in segments if not s.control]
+    while segments and not (segments[-1].style and segments[-1].style.bgcolor):
+        text = segments[-1].text.rstrip()
+        if text:
+            segments[-1] = Segment(text, segments[-1].style)
+            break
+        segments.pop()
+    return segments
+
+
+def render_lines(markup: str, width: int) -> tuple[Text, ...]:
+    options = _CONSOLE.options.update_width(width)
+    lines = []
+    for segments in _CONSOLE.render_lines(ChatMarkdown(markup), options, pad=False):
+        line = Text()
+        for segment in _trim(segments):
+            line.append(segment.text, segment.style)
+        lines.append(line)
+    while lines and not lines[-1].plain.strip():
+        lines.pop()
+    while lines and not lines[0].plain.strip():
+        lines.pop(0)
+    return tuple(lines)
+
+
+@lru_cache(maxsize=1024)
+def render_block(block: str, width: int) -> tuple[Text, ...]:
+    return render_lines(block, width)
+
+
+def layout_blocks(blocks: list[str], width: int) -> list[tuple[Text, ...]]:
+    return [render_block(block, width) for block in blocks]
+
+
+def warm() -> None:
+    # Pygments compiles a lexer's rules on first use, which takes longer
+    # than laying out a whole reply.
+    render_lines("```python\npass\n```", 80)
+
+
+class MarkdownBlocks:
+    def __init__(self):
+        self.blocks: list[str] = []
+        self._lines: list[str] = []
+        self._partial: list[str] = []
+        self._fence: str | None = None
+
+    def feed(self, text: str) -> None:
+        *complete, rest = text.split("\n")
+        for line in complete:
+            self._partial.append(line)
+            self._feed_line("".join(self._partial))
+            self._partial = []
+        if rest:
+            self._partial.append(rest)
+
+    def _feed_line(self, line: str) -> None:
+        stripped = line.strip()
+        if self._fence:
+            self._lines.append(line)
+            if stripped.startswith(self._fence) and not stripped.strip(self._fence[0]):
+                self._fence = None
+                self._close()
+        elif stripped[:3] in FENCES:
+            self._close()
+            self._fence = stripped[:3]
+            self._lines.append(line)
+        elif not stripped:
+            self._close()
+        else:
+            self._lines.append(line)
+
+    def _close(self) -> None:
+        if self._lines:
+            self.blocks.append("\n".join(self._lines))
+            self._lines = []
+
+    @property
+    def open_block(self) -> str:
+        if len(self._partial) > 1:
+            self._partial[:] = ["".join(self._partial)]
+        return "\n".join(self._lines + self._partial)
@@ -0,0 +1,102 @@
+import time
+from collections import deque
+
+from groqmate.interfaces.cli.markdown import render_block
+
+LAG_INTERVAL = 0.1
+LAG_WINDOW = 20
+
+
+class StreamStats:
+    def __init__(self):
+        self.started: float | None = None
+        self.first: float | None = None
+        self.ended: float | None = None
+        self.tokens = 0
+        self.frames = 0
+
+    def start(self, now: float | None = None) -> None:
+        self.started = time.perf_counter() if now is None else now
+        self.first = self.ended = None
+        self.tokens = self.frames = 0
+
+    def token(self, now: float | None = None) -> None:
+        if self.started is None:
+            return
+        if self.first is None:
+            self.first = time.perf_counter() if now is None else now
+        self.tokens += 1
+
+    def frame(self) -> None:
+        if self.started is not None:
+            self.frames += 1
+
+    def end(self, now: float | None = None) -> None:
+        if self.started is not None and self.ended is None:
+            self.ended = time.perf_counter() if now is None else now
+
+    def _until(self, now: float | None) -> float:
+        if self.ended is not None:
+            return self.ended
+        return time.perf_counter() if now is None else now
+
+    def ttft(self) -> float | None:
+        if self.started is None or self.first is None:
+            return None
+        return self.first - self.started
+
+    def tokens_per_sec(self, now: float | None = None) -> float | None:
+        if self.first is None:
+            return None
+        elapsed = self._until(now) - self.first
+        return (self.tokens - 1) / elapsed if elapsed > 0 and self.tokens > 1 else None
+
+    def fps(self, now: float | None = None) -> float | None:
+        if self.first is None:
+            return None
+        elapsed = self._until(now) - self.first
+        return self.frames / elapsed if elapsed > 0 else None
+
+
+class LagMonitor:
+    def __init__(self, interval: float = LAG_INTERVAL, window: int = LAG_WINDOW):
+        self.interval = interval
+        self.samples: deque[float] = deque(maxlen=window)
+        self._last: float | None = None
+
+    def tick(self, now: float | None = None) -> None:
+        # A timer that fires late by N ms means the loop was busy for N ms.
+        now = time.perf_counter() if now is None else now
+        if self._last is not None:
+            self.samples.append(max(0.0, now - self._last - self.interval))
+        self._last = now
+
+    def reset(self) -> None:
+        self.samples.clear()
+        self._last = None
+
+    @property
+    def lag(self) -> float | None:
+        return max(self.samples) if self.samples else None
+
+
+def cache_hit_rate() -> float | None:
+    info = render_block.cache_info()
+    total = info.hits + info.misses
+    return info.hits / total if total else None
+
+
+def _show(value: float | None, unit: str, scale: float = 1.0) -> str:
+    return "-" if value is None else f"{value * scale:.0f}{unit}"
+
+
+def hud_text(stats: StreamStats, lag: float | None, hit_rate: float | None) -> str:
+    return " │ ".join(
+        [
+            f"TTFT {_show(stats.ttft(), 'ms', 1e3)}",
+            f"{_show(stats.tokens_per_sec(), '')} tok/s",
+            f"{_show(stats.fps(), '')} fps",
+            f"lag {_show(lag, 'ms', 1e3)}",
+            f"cache {_show(hit_rate, '%', 100)}",
+        ]
+    )
@@ -174,9 +174,9 @@ class SettingsScreen(ModalScreen):
 
         return rows
 
-    def on_button_pressed(self, event: Button.Pressed) -> None:
+    async def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "save-btn":
-            self._save_settings()
+            await self._save_settings()
         elif event.button.id == "cancel-btn":
             self.app.pop_screen()
 
@@ -209,8 +209,8 @@ class SettingsScreen(ModalScreen):
             key_input = self.query_one(f"#key-{provider}", Input)
             key_input.password = provider not in self.show_keys
 
-    def _save_settings(self) -> None:
-        self.config.save()
+    async def _save_settings(self) -> None:
+        await self.config.save_async()
         self.app.pop_screen()
         if hasattr(self.app, "_on_settings_saved"):
             self.app._on_settings_saved()
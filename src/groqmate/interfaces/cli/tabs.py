@@ -0,0 +1,45 @@
+from collections import deque
+from contextvars import ContextVar
+
+from textual.worker import Worker
+
+from groqmate.core.progress import ProgressTracker
+from groqmate.core.review import ReviewSession
+from groqmate.core.state import Session
+from groqmate.core.transcript import TranscriptWriter
+from groqmate.interfaces.cli.widgets import ChatLog
+
+MAX_LABEL = 24
+
+# The tab whose worker is running; outside a worker this is unset and the
+# app falls back to the active tab.
+current_tab: ContextVar["LessonTab | None"] = ContextVar("current_tab", default=None)
+
+
+class LessonTab:
+    def __init__(
+        self, number: int, chat: ChatLog, progress: ProgressTracker | None = None
+    ):
+        self.number = number
+        self.id = f"lesson-{number}"
+        self.chat = chat
+        self.session = Session()
+        self.progress = progress
+        if progress:
+            self.session.subscribe(progress.observe)
+        self.inputs: deque[str] = deque()
+        self.worker: Worker | None = None
+        self.review: ReviewSession | None = None
+        self.transcript: TranscriptWriter | None = None
+
+    @property
+    def busy(self) -> bool:
+        return self.worker is not None and not self.worker.is_finished
+
+    @property
+    def label(self) -> str:
+        plan = self.session.state.plan
+        title = plan.topic if plan else "New lesson"
+        if len(title) > MAX_LABEL:
+            title = title[: MAX_LABEL - 1] + "…"
+        return f"{self.number} {title}" + (" •" if self.busy else "")
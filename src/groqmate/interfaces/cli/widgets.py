@@ -1,9 +1,35 @@
 from textual.widgets import Static, Input
 from textual.containers import Container, Horizontal, ScrollableContainer
+from textual import events
 from textual.message import Message
 from textual.reactive import reactive
+from textual.strip import Strip
+from textual.timer import Timer
 from rich.text import Text
-from rich.markdown import Markdown
+from groqmate.interfaces.cli.history import ChatHistory, ChatRecord
+from groqmate.interfaces.cli.executor import started, submit
+from groqmate.interfaces.cli.markdown import (
+    MarkdownBlocks,
+    layout_blocks,
+    render_block,
+    render_lines,
+)
+from groqmate.interfaces.cli.perf import StreamStats
+
+STREAM_FPS = 30
+LIVE_MESSAGES = 100
+HISTORY_PAGE = 25
+INDENT = "          "
+DEFAULT_WIDTH = 80
+MIN_MARKDOWN_WIDTH = 20
+OFFLOAD_CHARS = 1000
+FOOTER_KEYS = (
+    ("Ctrl+P", "Settings"),
+    ("Ctrl+T", "New tab"),
+    ("Esc", "Stop"),
+    ("F2", "Perf"),
+    ("Ctrl+Q", "Quit"),
+)
 
 
 class ChatMessage(Static):
@@ -27,12 +53,18 @@ class ChatMessage(Static):
     }
     """
 
-    message_content: reactive[str] = reactive("")
     is_streaming: reactive[bool] = reactive(False)
 
     class StreamComplete(Message):
         pass
 
+    class LaidOut(Message):
+        def __init__(self, width: int, start: int, lines: list | None):
+            super().__init__()
+            self.width = width
+            self.start = start
+            self.lines = lines
+
     def __init__(
         self,
         sender: str,
@@ -46,45 +78,210 @@ class ChatMessage(Static):
         self.is_user = is_user
         self.is_system = is_system
         self.is_streaming = is_streaming
-        self.message_content = content
+        self.markdown = not is_user and not is_system
+        self._offload = True
+        self._reset(content)
+
+    @property
+    def message_content(self) -> str:
+        if len(self._chunks) > 1:
+            self._chunks[:] = ["".join(self._chunks)]
+        return self._chunks[0] if self._chunks else ""
+
+    @message_content.setter
+    def message_content(self, content: str) -> None:
+        self._reset(content)
+        self.refresh(layout=True)
+
+    def _reset(self, content: str) -> None:
+        # Finished lines are laid out once into _done; only the line still
+        # being streamed (_tail) is rebuilt on each render. Markdown replies
+        # do the same per block: completed blocks are rendered once per width.
+        self._chunks: list[str] = []
+        self._tail: list[str] = []
+        self._done = self._prefix()
+        self._blocks = MarkdownBlocks() if self.markdown else None
+        self._rendered: tuple[int, int, list[Text]] | None = None
+        self._layout: tuple[int, int] | None = None
+        self._lines: tuple[tuple, list[Text], list[Text]] | None = None
+        self._version = 0
+        self._add(content)
+
+    def _prefix(self) -> Text:
+        if self.is_user:
+            prefix, style = "You: ", "bold white"
+        elif self.is_system:
+            prefix, style = "System: ", "italic yellow"
+        else:
+            prefix, style = "Groqmate: ", "bold green"
+        return Text().append(prefix, style=style)
+
+    def _add(self, token: str) -> None:
+        if not token:
+            return
+        self._chunks.append(token)
+        if self._blocks is not None:
+            self._blocks.feed(token)
+            self._version += 1
+            return
+        *finished, last = token.split("\n")
+        for line in finished:
+            self._tail.append(line)
+            self._done.append("".join(self._tail))
+            self._done.append("\n")
+            if not self.is_system:
+                self._done.append(INDENT, style="dim")
+            self._tail = []
+        if last:
+            self._tail.append(last)
 
     def append_content(self, token: str) -> None:
-        self.message_content += token
-        self.refresh()
+        self._add(token)
+        self.refresh(layout=True)
 
     def finalize(self) -> None:
         self.is_streaming = False
         self.refresh()
 
-    def render(self) -> Text:
-        lines = self.message_content.split("\n")
-        result = Text()
-
-        prefix = ""
-        if self.is_user:
-            prefix = "You: "
-            style = "bold white"
-        elif self.is_system:
-            prefix = "System: "
-            style = "italic yellow"
-        else:
-            prefix = "Groqmate: "
-            style = "bold green"
-
-        result.append(prefix, style=style)
-
-        for i, line in enumerate(lines):
-            if i > 0:
-                result.append("\n")
-                if not self.is_system:
-                    result.append("          ", style="dim")
-            result.append(line)
+    def on_resize(self) -> None:
+        # Markdown is laid out for the current width, so a new width means
+        # new line breaks and a new height.
+        if self._blocks is not None:
+            self.refresh(layout=True)
 
+    def render(self) -> Text:
+        if self._blocks is not None:
+            # Only used outside the line API (e.g. copying a selection).
+            done, tail = self._markdown_lines(self.content_size.width)
+            return Text("\n").join([*done[:-1], *tail])
+
+        if len(self._tail) > 1:
+            self._tail[:] = ["".join(self._tail)]
+        result = self._done.copy()
+        if self._tail:
+            result.append(self._tail[0])
         if self.is_streaming:
             result.append(" ▏", style="bold green blink")
-
         return result
 
+    # Markdown replies use the line API: lines are already laid out for the
+    # width, so only the rows on screen are turned into strips, and a long
+    # reply costs a refresh no more than a short one. The lines are the
+    # cached finished blocks (done) with their last line replaced by the
+    # open block (tail); they are indexed in place, never joined.
+    def get_content_height(self, container, viewport, width: int) -> int:
+        if self._blocks is None:
+            return super().get_content_height(container, viewport, width)
+        done, tail = self._markdown_lines(width)
+        return len(done) - 1 + len(tail)
+
+    def render_line(self, y: int) -> Strip:
+        if self._blocks is None:
+            return super().render_line(y)
+        width = self.content_size.width
+        line = self._markdown_line(y, width)
+        if line is None:
+            return Strip.blank(width, self.rich_style)
+        strip = Strip(line.render(self.app.console), line.cell_len)
+        return strip.crop_extend(0, width, None).apply_style(self.rich_style)
+
+    def _markdown_line(self, y: int, width: int) -> Text | None:
+        done, tail = self._markdown_lines(width)
+        if y < len(done) - 1:
+            return done[y]
+        y -= len(done) - 1
+        return tail[y] if y < len(tail) else None
+
+    def _markdown_lines(self, width: int) -> tuple[list[Text], list[Text]]:
+        width = max(MIN_MARKDOWN_WIDTH, (width or DEFAULT_WIDTH) - len(INDENT))
+        key = (self._version, width, self.is_streaming)
+        if self._lines is None or self._lines[0] != key:
+            done, tail = self._render_markdown(width)
+            if self.is_streaming:
+                tail[-1].append(" ▏", style="bold green blink")
+            self._lines = (key, done, tail)
+        return self._lines[1], self._lines[2]
+
+    def _render_markdown(self, width: int) -> tuple[list[Text], list[Text]]:
+        blocks = self._blocks.blocks
+        if self._rendered is None or self._rendered[0] != width:
+            self._rendered = (width, 0, [self._prefix()])
+        _, count, done = self._rendered
+        pending = blocks[count:]
+        if (
+            self._offload
+            and started()
+            and self.is_mounted
+            and len(pending) > 1
+            and sum(map(len, pending)) >= OFFLOAD_CHARS
+        ):
+            # A large batch (a summary, a tab catching up) is laid out in the
+            # worker process; the raw text stands in until the lines come back.
+            if self._layout != (width, count):
+                self._layout = (width, count)
+                submit(
+                    self,
+                    lambda lines: self.LaidOut(width, count, lines),
+                    layout_blocks,
+                    pending,
+                    width,
+                )
+            begun = self._started(done)
+            tail = [done[-1].copy()]
+            open_block = self._blocks.open_block
+            for block in [*pending, open_block] if open_block.strip() else pending:
+                lines = tuple(map(Text, block.split("\n")))
+                self._append_lines(tail, lines, begun)
+                begun = True
+            return done, tail
+
+        for block in pending:
+            self._append_lines(done, render_block(block, width))
+        self._rendered = (width, len(blocks), done)
+
+        tail = [done[-1].copy()]
+        open_block = self._blocks.open_block
+        if open_block.strip():
+            # A finished message's last block no longer changes, so it can
+            # come from the cache like the others.
+            render = render_lines if self.is_streaming else render_block
+            self._append_lines(tail, render(open_block, width), self._started(done))
+        return done, tail
+
+    def on_chat_message_laid_out(self, message: LaidOut) -> None:
+        message.stop()
+        if self._layout == (message.width, message.start):
+            self._layout = None
+        if message.lines is None:
+            # Layout failed in the worker; render inline from now on.
+            self._offload = False
+        elif self._rendered and self._rendered[:2] == (message.width, message.start):
+            done = self._rendered[2]
+            for lines in message.lines:
+                self._append_lines(done, lines)
+            self._rendered = (message.width, message.start + len(message.lines), done)
+        self._version += 1
+        self.refresh(layout=True)
+
+    def _started(self, text: list[Text]) -> bool:
+        return len(text) > 1 or len(text[0]) > len(self._prefix())
+
+    def _append_lines(
+        self, text: list[Text], lines: tuple[Text, ...], started: bool | None = None
+    ) -> None:
+        # Blocks are separated by a blank line; the first line of the
+        # message follows the sender prefix.
+        if started is None:
+            started = self._started(text)
+        if started and lines:
+            text.append(Text())
+        for line in lines:
+            if started:
+                text.append(Text(INDENT, style="dim").append_text(line))
+            else:
+                text[-1].append_text(line)
+            started = True
+
 
 class ChatLog(ScrollableContainer):
     DEFAULT_CSS = """
@@ -92,11 +289,51 @@ class ChatLog(ScrollableContainer):
         height: 1fr;
         padding: 1 0;
     }
+
+    ChatLog > .history-marker {
+        color: $text-muted;
+        text-align: center;
+        display: none;
+    }
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        fps: float = STREAM_FPS,
+        live_limit: int = LIVE_MESSAGES,
+        history: ChatHistory | None = None,
+    ):
         super().__init__()
+        self.fps = fps
+        self.live_limit = live_limit
+        self.history = history if history is not None else ChatHistory()
+        # Only messages in history[_start:_start + len(_live)] exist as
+        # widgets; the rest are plain records, materialized on scroll.
+        self._live: list[ChatMessage] = []
+        self._start = 0
+        self._paging = False
+        self._marker = Static(classes="history-marker")
         self._streaming_message = None
+        self._streaming_index: int | None = None
+        self._pending: list[str] = []
+        self._flush_timer: Timer | None = None
+        self.background = False
+        self.stats = StreamStats()
+        self.transcript = None
+
+    def compose(self):
+        yield self._marker
+
+    def on_unmount(self) -> None:
+        self.history.close()
+
+    @property
+    def streaming(self) -> bool:
+        return self._streaming_message is not None
+
+    @property
+    def _end(self) -> int:
+        return self._start + len(self._live)
 
     def add_message(
         self,
@@ -105,7 +342,11 @@ class ChatLog(ScrollableContainer):
         is_user: bool = False,
         is_system: bool = False,
         is_streaming: bool = False,
+        record: bool = True,
     ) -> ChatMessage:
+        if self._end < len(self.history):
+            self._show_tail()
+        index = self.history.append(ChatRecord(sender, content, is_user, is_system))
         message = ChatMessage(
             sender=sender,
             content=content,
@@ -113,27 +354,197 @@ class ChatLog(ScrollableContainer):
             is_system=is_system,
             is_streaming=is_streaming,
         )
+        self._live.append(message)
         self.mount(message)
+        self._trim_front()
         self.scroll_end(animate=False)
 
         if is_streaming:
             self._streaming_message = message
+            self._streaming_index = index
+            self.stats.start()
+
+        if self.transcript and record:
+            role = "user" if is_user else "system" if is_system else "groqmate"
+            if is_streaming:
+                self.transcript.start(role)
+                self.transcript.chunk(content)
+            else:
+                self.transcript.message(role, content)
 
         return message
 
+    def remove_message(self, message: ChatMessage) -> None:
+        if message is self._streaming_message:
+            self._pending.clear()
+            self._streaming_message = None
+            self._streaming_index = None
+        if message in self._live:
+            position = self._live.index(message)
+            index = self._start + position
+            del self.history[index]
+            del self._live[position]
+            if self._streaming_index is not None and self._streaming_index > index:
+                self._streaming_index -= 1
+        message.remove()
+
+    def _materialize(self, record: ChatRecord) -> ChatMessage:
+        return ChatMessage(
+            sender=record.sender,
+            content=record.content,
+            is_user=record.is_user,
+            is_system=record.is_system,
+        )
+
+    def _update_marker(self) -> None:
+        self._marker.display = self._start > 0
+        self._marker.update(
+            f"{self._start} earlier message{'s' if self._start != 1 else ''}"
+            f" (scroll up to load)"
+        )
+
+    def _trim_front(self) -> None:
+        excess = len(self._live) - self.live_limit
+        if excess > 0:
+            dropped = self._live[:excess]
+            del self._live[:excess]
+            self._start += excess
+            self.remove_children(dropped)
+        self._update_marker()
+
+    def _trim_back(self) -> None:
+        keep = max(self.live_limit, 1)
+        if self._streaming_message in self._live:
+            keep = max(keep, self._live.index(self._streaming_message) + 1)
+        if len(self._live) > keep:
+            dropped = self._live[keep:]
+            del self._live[keep:]
+            self.remove_children(dropped)
+
+    def _show_tail(self) -> None:
+        self.remove_children(self._live)
+        self._start = max(0, len(self.history) - self.live_limit + 1)
+        self._live = [
+            self._materialize(r)
+            for r in self.history.slice(self._start, len(self.history))
+        ]
+        if self._live:
+            self.mount(*self._live)
+        self._update_marker()
+
+    def watch_scroll_y(self, old_value: float, new_value: float) -> None:
+        super().watch_scroll_y(old_value, new_value)
+        self._page_at_edge(new_value - old_value)
+
+    def on_mouse_scroll_up(self, event: events.MouseScrollUp) -> None:
+        # Already at an edge, a wheel turn leaves scroll_y unchanged.
+        self._page_at_edge(-1)
+
+    def on_mouse_scroll_down(self, event: events.MouseScrollDown) -> None:
+        self._page_at_edge(1)
+
+    def _page_at_edge(self, direction: float) -> None:
+        if self._paging:
+            return
+        if direction < 0 and self.scroll_y <= 0 and self._start > 0:
+            self._load_earlier()
+        elif (
+            direction > 0
+            and self.scroll_y >= self.max_scroll_y
+            and self._end < len(self.history)
+        ):
+            self._load_later()
+
+    def _load_earlier(self) -> None:
+        anchor = self._live[0] if self._live else None
+        begin = max(0, self._start - HISTORY_PAGE)
+        loaded = [self._materialize(r) for r in self.history.slice(begin, self._start)]
+        self._live[:0] = loaded
+        self._start = begin
+        self.mount(*loaded, after=self._marker)
+        self._trim_back()
+        self._update_marker()
+        if anchor:
+            self._settle(anchor, top=True)
+
+    def _load_later(self) -> None:
+        anchor = self._live[-1] if self._live else None
+        end = self._end
+        loaded = [
+            self._materialize(r) for r in self.history.slice(end, end + HISTORY_PAGE)
+        ]
+        self._live.extend(loaded)
+        self.mount(*loaded)
+        self._trim_front()
+        if anchor:
+            self._settle(anchor, top=False)
+
+    def _settle(self, anchor: ChatMessage, top: bool) -> None:
+        # Keep the message the reader was looking at in place once the new
+        # page is laid out, without that scroll paging in yet more history.
+        self._paging = True
+
+        def restore() -> None:
+            self.scroll_to_widget(anchor, animate=False, top=top, immediate=True)
+            self.call_after_refresh(setattr, self, "_paging", False)
+
+        self.call_after_refresh(restore)
+
     def append_to_streaming(self, token: str) -> None:
-        if self._streaming_message:
-            self._streaming_message.append_content(token)
+        if not self._streaming_message:
+            return
+        # Tokens are held until the next frame, so a fast provider costs one
+        # refresh and one scroll per frame rather than per token.
+        self._pending.append(token)
+        self.stats.token()
+        if self._flush_timer is None and not self.background:
+            self._flush_timer = self.set_timer(
+                1 / self.fps if self.fps > 0 else 0, self._flush_pending
+            )
+        if self.transcript:
+            self.transcript.chunk(token)
+
+    def _flush_pending(self) -> None:
+        if self._flush_timer is not None:
+            self._flush_timer.stop()
+            self._flush_timer = None
+        if self._pending and self._streaming_message:
+            self._streaming_message.append_content("".join(self._pending))
             self.scroll_end(animate=False)
+            self.stats.frame()
+        self._pending.clear()
+
+    def set_background(self, background: bool) -> None:
+        # A chat in a hidden tab keeps collecting tokens but skips the
+        # per-frame flush; it catches up in one go when shown again.
+        self.background = background
+        if not background and self._pending:
+            self._flush_pending()
 
     def finalize_streaming(self) -> None:
         if self._streaming_message:
+            self._flush_pending()
             self._streaming_message.finalize()
+            self.stats.end()
+            index = self._streaming_index
+            if index is not None and index >= self.history.spilled:
+                self.history[index] = self.history[index]._replace(
+                    content=self._streaming_message.message_content
+                )
             self._streaming_message = None
+            self._streaming_index = None
+            if self.transcript:
+                self.transcript.end()
 
     def clear_chat(self) -> None:
-        for child in list(self.children):
-            child.remove()
+        self.remove_children(self._live)
+        self._live = []
+        self._start = 0
+        self._pending.clear()
+        self._streaming_message = None
+        self._streaming_index = None
+        self.history.clear()
+        self._update_marker()
 
 
 class InputBar(Container):
@@ -212,12 +623,28 @@ class CustomFooter(Container):
     def __init__(self, provider: str = "groq"):
         super().__init__()
         self.provider = provider
+        self.hud: str | None = None
 
     def compose(self):
-        yield Static(
-            f"[bold #ff6b35]groqmate[/] [#333333]│[/] [#666666][#00ff88]Ctrl+P[/] Settings [#333333]│[/] [#00ff88]Ctrl+L[/] Clear [#333333]│[/] [#00ff88]Ctrl+Q[/] Quit[/]",
-            id="footer-content",
+        yield Static(self._content(), id="footer-content")
+
+    def _content(self) -> str:
+        sep = " [#333333]│[/] "
+        text = f"[bold #ff6b35]groqmate[/]{sep}[#666666]{self.provider}[/]{sep}"
+        if self.hud is not None:
+            return text + f"[#00ff88]{self.hud}[/]"
+        return text + sep.join(
+            f"[#00ff88]{key}[/] [#666666]{label}[/]" for key, label in FOOTER_KEYS
         )
 
+    def _refresh_content(self) -> None:
+        if self.is_mounted:
+            self.query_one("#footer-content", Static).update(self._content())
+
     def update_provider(self, provider: str) -> None:
         self.provider = provider
+        self._refresh_content()
+
+    def update_hud(self, hud: str | None) -> None:
+        self.hud = hud
+        self._refresh_content()
@@ -1,9 +1,28 @@
+import sys
 import pytest
+from pathlib import Path
+from groqmate.core import config
 from groqmate.core.models import LessonPlan, LessonStep, SessionState, SessionStatus
 from groqmate.core.state import Session
 from groqmate.core.providers import ProviderConfig, Provider
 
 
+@pytest.fixture(autouse=True)
+def home(tmp_path, monkeypatch):
+    # Keep every test out of the real ~/.groqmate: HOME and each path
+    # constant under CONFIG_DIR point into the test's tmp_path instead.
+    home = tmp_path / "home"
+    monkeypatch.setenv("HOME", str(home))
+    real, fake = config.CONFIG_DIR, home / ".groqmate"
+    for name, module in list(sys.modules.items()):
+        if not name.startswith(("groqmate.", "tests.")):
+            continue
+        for attr, value in list(vars(module).items()):
+            if isinstance(value, Path) and value.is_relative_to(real):
+                monkeypatch.setattr(module, attr, fake / value.relative_to(real))
+    return home
+
+
 @pytest.fixture
 def sample_step():
     return LessonStep(
@@ -1,11 +1,16 @@
+import asyncio
 import pytest
-import sys
-from unittest.mock import patch, MagicMock
-from pathlib import Path
-from groqmate.interfaces.cli.app import GroqmateApp, run, CSS_PATH
+from unittest.mock import AsyncMock, MagicMock
+from groqmate.interfaces.cli.app import GroqmateApp, CSS_PATH
+from groqmate.core.config import Config
 from groqmate.core.providers import Provider
+from groqmate.core.daemon import RemoteTutor
+from groqmate.core.tutor import Tutor
 from groqmate.core.state import Session
 from groqmate.core.models import LessonPlan
+from groqmate.core.journal import SessionJournal
+from groqmate.core.topics import TopicIndex
+from groqmate.core.transcript import Transcript
 
 
 class TestGroqmateApp:
@@ -84,86 +89,6 @@ class TestAppMethods:
         assert app.session.state.current_step == 0
 
 
-class TestRunFunction:
-    def test_run_creates_app_with_default_provider(self):
-        with patch("argparse.ArgumentParser.parse_args") as mock_args:
-            mock_args.return_value = MagicMock(
-                provider=None, provider_flag=None, model=None, list_providers=False
-            )
-            with patch.object(GroqmateApp, "run"):
-                run()
-
-    def test_run_with_positional_provider(self):
-        with patch("argparse.ArgumentParser.parse_args") as mock_args:
-            mock_args.return_value = MagicMock(
-                provider="gemini", provider_flag=None, model=None, list_providers=False
-            )
-            with patch.object(GroqmateApp, "run"):
-                run()
-
-    def test_run_with_provider_flag(self):
-        with patch("argparse.ArgumentParser.parse_args") as mock_args:
-            mock_args.return_value = MagicMock(
-                provider=None, provider_flag="openai", model=None, list_providers=False
-            )
-            with patch.object(GroqmateApp, "run"):
-                run()
-
-    def test_run_with_custom_model(self):
-        with patch("argparse.ArgumentParser.parse_args") as mock_args:
-            mock_args.return_value = MagicMock(
-                provider=None,
-                provider_flag=None,
-                model="custom-model",
-                list_providers=False,
-            )
-            with patch.object(GroqmateApp, "run"):
-                run()
-
-    def test_run_with_provider_model_syntax(self):
-        with patch("argparse.ArgumentParser.parse_args") as mock_args:
-            mock_args.return_value = MagicMock(
-                provider="groq/llama-3.1-8b",
-                provider_flag=None,
-                model=None,
-                list_providers=False,
-            )
-            with patch.object(GroqmateApp, "run"):
-                run()
-
-    def test_list_providers_exits(self):
-        with patch("argparse.ArgumentParser.parse_args") as mock_args:
-            mock_args.return_value = MagicMock(
-                provider=None, provider_flag=None, model=None, list_providers=True
-            )
-            # show_providers_and_exit calls sys.exit, which would terminate pytest
-            # So we just verify the args are correctly parsed
-            args = mock_args.return_value
-            assert args.list_providers is True
-
-    def test_run_with_all_providers(self):
-        providers = [
-            "groq",
-            "gemini",
-            "openai",
-            "deepseek",
-            "openrouter",
-            "ollama",
-            "anthropic",
-            "mistral",
-        ]
-        for provider in providers:
-            with patch("argparse.ArgumentParser.parse_args") as mock_args:
-                mock_args.return_value = MagicMock(
-                    provider=provider,
-                    provider_flag=None,
-                    model=None,
-                    list_providers=False,
-                )
-                with patch.object(GroqmateApp, "run"):
-                    run()
-
-
 class TestAppAttributes:
     def test_css_path_exists(self):
         assert CSS_PATH.exists()
@@ -178,3 +103,247 @@ class TestAppAttributes:
     def test_provider_config_has_provider(self):
         app = GroqmateApp(provider="openai")
         assert app.provider_config.provider == Provider.OPENAI
+
+
+class TestAppPaths:
+    def test_state_stays_under_test_home(self, home, sample_plan):
+        app = GroqmateApp()
+        app.session.load_plan(sample_plan)
+        assert app.progress_store.flush()
+        app.progress_store.close()
+        assert (home / ".groqmate" / "progress.db").exists()
+        assert app.search_index.path.is_relative_to(home)
+        assert app.journal.directory.is_relative_to(home)
+
+
+class TestTabProgress:
+    def test_tabs_share_one_progress_store(self):
+        app = GroqmateApp()
+        second = app._new_tab()
+        assert app.active_tab.progress is not second.progress
+        assert app.active_tab.progress.store is second.progress.store
+        assert second.progress.store is app.progress_store
+
+    def test_closing_a_tab_keeps_the_store_open(self, sample_plan):
+        app = GroqmateApp()
+        second = app._new_tab()
+        second.session.load_plan(sample_plan)
+        app._release_tab(second)
+        app.session.load_plan(sample_plan)
+        assert app.progress_store.flush()
+        app.progress_store.close()
+
+
+class TestDaemonClient:
+    def init_tutor(self, monkeypatch, socket, use_daemon=True):
+        monkeypatch.setenv("GROQ_API_KEY", "test_key")
+        monkeypatch.setattr("groqmate.interfaces.cli.app.SOCKET_PATH", socket)
+        app = GroqmateApp(provider="groq")
+        app.config.settings.use_daemon = use_daemon
+        app._init_tutor(welcome=False)
+        return app
+
+    def test_uses_running_daemon(self, monkeypatch, tmp_path):
+        socket = tmp_path / "daemon.sock"
+        socket.touch()
+        app = self.init_tutor(monkeypatch, socket)
+        assert isinstance(app.tutor, RemoteTutor)
+        assert app.tutor.fallback is app.tutor_pool.get(app.provider_config, app.config)
+
+    def test_in_process_without_daemon(self, monkeypatch, tmp_path):
+        app = self.init_tutor(monkeypatch, tmp_path / "daemon.sock")
+        assert isinstance(app.tutor, Tutor)
+
+    def test_daemon_can_be_turned_off(self, monkeypatch, tmp_path):
+        socket = tmp_path / "daemon.sock"
+        socket.touch()
+        app = self.init_tutor(monkeypatch, socket, use_daemon=False)
+        assert isinstance(app.tutor, Tutor)
+
+
+class TestLessonTranscript:
+    def make_app(self, tmp_path):
+        app = GroqmateApp()
+        app.tab.chat = MagicMock()
+        app.journal = SessionJournal(tmp_path / "session")
+        app.journal.attach(app.session)
+        app.topic_index = TopicIndex()
+        app._explain_current_step = AsyncMock()
+        return app
+
+    async def start_lesson(self, tmp_path, monkeypatch, sample_plan):
+        path = tmp_path / "lesson.jsonl"
+        monkeypatch.setattr(
+            "groqmate.interfaces.cli.app.new_transcript_path",
+            lambda topic, directory: path,
+        )
+        app = self.make_app(tmp_path)
+        app.tutor = MagicMock(generate_plan=AsyncMock(return_value=sample_plan))
+        await app._handle_input("Teach me recursion")
+        app.transcript.close()
+        app.journal.close()
+        return app, path
+
+    @pytest.mark.asyncio
+    async def test_transcript_starts_with_request(
+        self, tmp_path, monkeypatch, sample_plan
+    ):
+        app, path = await self.start_lesson(tmp_path, monkeypatch, sample_plan)
+        first = Transcript(path).messages()[0]
+        assert (first.role, first.text, first.step) == (
+            "user",
+            "Teach me recursion",
+            None,
+        )
+        assert app.journal.transcript == path
+
+    @pytest.mark.asyncio
+    async def test_resume_replays_the_lessons_transcript(
+        self, tmp_path, monkeypatch, sample_plan
+    ):
+        _, path = await self.start_lesson(tmp_path, monkeypatch, sample_plan)
+        app = self.make_app(tmp_path)
+        app.journal.detach()
+        app._resume_session()
+        app.transcript.close()
+        replayed = [c.args[1] for c in app.tab.chat.add_message.call_args_list]
+        assert "Teach me recursion" in replayed
+        assert app.transcript.path == path
+
+
+class TestConfigReload:
+    def test_bad_provider_keeps_current_settings(self):
+        app = GroqmateApp()
+        app.tab.chat = MagicMock()
+        before = app.provider_config
+        config = Config()
+        config.settings.provider = "gorq"  # as edited in place, unvalidated
+        app.config_watcher = MagicMock(check=MagicMock(return_value=config))
+
+        app._check_config()
+
+        assert app.provider_config is before
+        assert app.config.settings.provider == "groq"
+        message = app.tab.chat.add_message.call_args.args[1]
+        assert "gorq" in message
+        assert "Keeping current settings" in message
+
+
+class TestSummaryNotes:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("topic", ["../../escape", "TCP/IP basics", ".."])
+    async def test_notes_stay_in_notes_dir(
+        self, tmp_path, monkeypatch, sample_plan, topic
+    ):
+        notes = tmp_path / "notes"
+        monkeypatch.setattr("groqmate.interfaces.cli.app.NOTES_DIR", notes)
+        app = GroqmateApp()
+        app.tab.chat = MagicMock()
+        app.search_index = MagicMock()
+        app.tutor = MagicMock(generate_summary=AsyncMock(return_value="# Notes"))
+        app.session.load_plan(sample_plan.model_copy(update={"topic": topic}))
+
+        await app._handle_summary()
+
+        (path,) = notes.iterdir()
+        assert path.read_text() == "# Notes"
+        assert path.name.endswith("_notes.md")
+
+
+class TestWorkerQueue:
+    def make_app(self):
+        app = GroqmateApp()
+        chat = MagicMock()
+        app.tab.chat = chat
+        app.run_worker = MagicMock(return_value=MagicMock(is_finished=False))
+        return app, chat
+
+    async def submit(self, app, value):
+        await app.on_input_bar_submitted(MagicMock(value=value))
+
+    @pytest.mark.asyncio
+    async def test_submit_starts_worker(self):
+        app, chat = self.make_app()
+        await self.submit(app, "teach me recursion")
+        app.run_worker.assert_called_once()
+        assert app._is_processing is True
+        assert list(app.tab.inputs) == ["teach me recursion"]
+        app.run_worker.call_args[0][0].close()
+
+    @pytest.mark.asyncio
+    async def test_submit_while_busy_queues(self):
+        app, chat = self.make_app()
+        app.tab.worker = MagicMock(is_finished=False)
+        await self.submit(app, "next")
+        app.run_worker.assert_not_called()
+        assert list(app.tab.inputs) == ["next"]
+        assert "Queued" in chat.add_message.call_args[0][1]
+
+    @pytest.mark.asyncio
+    async def test_stop_cancels_worker_and_queue(self):
+        app, chat = self.make_app()
+        worker = MagicMock(is_finished=False)
+        app.tab.worker = worker
+        app.tab.inputs.extend(["next", "wtf"])
+        await self.submit(app, "stop")
+        worker.cancel.assert_called_once()
+        assert not app.tab.inputs
+        assert "Dropped 2" in chat.add_message.call_args[0][1]
+
+    def test_escape_when_idle_is_silent(self):
+        app, chat = self.make_app()
+        app.action_stop()
+        chat.add_message.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_drain_runs_inputs_in_order(self):
+        app, chat = self.make_app()
+        seen = []
+
+        async def handle(user_input):
+            seen.append(user_input)
+            if user_input == "first":
+                app.tab.inputs.append("second")
+
+        app._handle_input = handle
+        app.tab.inputs.append("first")
+        await app._drain_inputs(app.tab)
+        assert seen == ["first", "second"]
+
+    @pytest.mark.asyncio
+    async def test_drain_marks_stopped_stream(self):
+        app, chat = self.make_app()
+        chat.streaming = True
+        app._handle_input = AsyncMock(side_effect=asyncio.CancelledError)
+        app.tab.inputs.append("wtf")
+        with pytest.raises(asyncio.CancelledError):
+            await app._drain_inputs(app.tab)
+        chat.append_to_streaming.assert_called_once_with("\n[stopped]")
+        chat.finalize_streaming.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_drain_survives_errors(self):
+        app, chat = self.make_app()
+        app._handle_input = AsyncMock(side_effect=[RuntimeError("boom"), None])
+        app.tab.inputs.extend(["one", "two"])
+        await app._drain_inputs(app.tab)
+        assert app._handle_input.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_drain_routes_handlers_to_its_tab(self, sample_plan):
+        app, chat = self.make_app()
+        background = app._new_tab()
+        background.chat = MagicMock()
+        seen = []
+
+        async def handle(user_input):
+            seen.append(app.tab)
+            app.session.load_plan(sample_plan)
+
+        app._handle_input = handle
+        background.inputs.append("teach me recursion")
+        await asyncio.create_task(app._drain_inputs(background))
+        assert seen == [background]
+        assert background.session.state.plan is not None
+        assert app.active_tab.session.state.plan is None
+        assert app.tab is app.active_tab
@@ -0,0 +1,202 @@
+import asyncio
+import json
+import pytest
+from unittest.mock import patch
+from groqmate.core.compiler import (
+    CompileStats,
+    JsonlSink,
+    LessonCompiler,
+    PackSink,
+    RateLimiter,
+    estimate_tokens,
+    open_sink,
+    read_topics,
+)
+from groqmate.core.packs import LessonPack
+from groqmate.interfaces.cli.commands import compile_command
+
+
+class FakeTutor:
+    def __init__(self, sample_plan, fail_on=(), rate_limit_once=False):
+        self.sample_plan = sample_plan
+        self.fail_on = set(fail_on)
+        self.rate_limit_once = rate_limit_once
+        self.active = 0
+        self.peak = 0
+        self.calls = 0
+
+    async def _enter(self):
+        self.calls += 1
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.001)
+        self.active -= 1
+
+    async def generate_plan(self, topic):
+        await self._enter()
+        if self.rate_limit_once:
+            self.rate_limit_once = False
+            error = Exception("slow down")
+            error.status_code = 429
+            raise error
+        if topic in self.fail_on:
+            raise ValueError("boom")
+        return self.sample_plan.model_copy(update={"topic": topic})
+
+    async def explain_step_stream(self, session):
+        await self._enter()
+        yield f"Step {session.current_step().index}"
+
+    async def generate_summary(self, session):
+        await self._enter()
+        return f"# {session.state.plan.topic}"
+
+
+class TestHelpers:
+    def test_read_topics_skips_comments_and_duplicates(self):
+        lines = ["Recursion\n", "# comment\n", "\n", "teach me recursion\n", "Graphs"]
+        assert read_topics(lines) == ["Recursion", "Graphs"]
+
+    def test_estimate_tokens(self):
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("abcd" * 10) == 10
+
+    def test_open_sink_by_suffix(self, tmp_path):
+        assert isinstance(open_sink(tmp_path / "out.jsonl"), JsonlSink)
+        sink = open_sink(tmp_path / "out.gmpack")
+        assert isinstance(sink, PackSink)
+        sink.close()
+
+    def test_stats_report(self):
+        stats = CompileStats(compiled=6, tokens=1200, elapsed=60.0)
+        assert stats.lessons_per_minute == 6.0
+        assert stats.tokens_per_second == 20.0
+        assert "6.0 lessons/min" in stats.report()
+
+
+class TestRateLimiter:
+    @pytest.mark.asyncio
+    async def test_unlimited_does_not_wait(self):
+        limiter = RateLimiter()
+        await asyncio.wait_for(limiter.acquire(), 0.1)
+
+    @pytest.mark.asyncio
+    async def test_spaces_requests(self):
+        limiter = RateLimiter(requests_per_minute=1200)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await asyncio.gather(*(limiter.acquire() for _ in range(3)))
+        assert loop.time() - start >= 0.09
+
+
+class TestLessonCompiler:
+    @pytest.mark.asyncio
+    async def test_compiles_plan_explanations_and_summary(self, sample_plan):
+        compiler = LessonCompiler(FakeTutor(sample_plan))
+        lesson = await compiler.compile_topic("Graphs")
+        assert lesson.plan.topic == "Graphs"
+        assert lesson.explanations == [f"Step {i}" for i in range(5)]
+        assert lesson.summary == "# Graphs"
+
+    @pytest.mark.asyncio
+    async def test_respects_concurrency_limit(self, tmp_path, sample_plan):
+        tutor = FakeTutor(sample_plan)
+        compiler = LessonCompiler(tutor, concurrency=2)
+        topics = [f"topic {i}" for i in range(6)]
+        stats = await compiler.run(topics, JsonlSink(tmp_path / "out.jsonl"))
+        assert stats.compiled == 6
+        assert tutor.peak <= 2
+
+    @pytest.mark.asyncio
+    async def test_writes_jsonl_and_resumes(self, tmp_path, sample_plan):
+        path = tmp_path / "out.jsonl"
+        compiler = LessonCompiler(FakeTutor(sample_plan))
+        await compiler.run(["Graphs"], JsonlSink(path))
+
+        tutor = FakeTutor(sample_plan)
+        stats = await LessonCompiler(tutor).run(["graphs", "Trees"], JsonlSink(path))
+        assert stats.skipped == 1
+        assert stats.compiled == 1
+
+        topics = [json.loads(line)["topic"] for line in path.read_text().splitlines()]
+        assert topics == ["Graphs", "Trees"]
+
+    @pytest.mark.asyncio
+    async def test_ignores_truncated_jsonl_line(self, tmp_path, sample_plan):
+        path = tmp_path / "out.jsonl"
+        path.write_text('{"topic": "Gra')
+        assert JsonlSink(path).done_topics() == set()
+
+    @pytest.mark.asyncio
+    async def test_appends_after_torn_line(self, tmp_path, sample_plan):
+        path = tmp_path / "out.jsonl"
+        path.write_text('{"topic": "Gra')
+        sink = JsonlSink(path)
+        await LessonCompiler(FakeTutor(sample_plan)).run(["Trees", "Heaps"], sink)
+
+        lines = path.read_text().splitlines()
+        assert lines[0] == '{"topic": "Gra'
+        assert sorted(json.loads(line)["topic"] for line in lines[1:]) == [
+            "Heaps",
+            "Trees",
+        ]
+        assert JsonlSink(path).done_topics() == {"trees", "heaps"}
+
+    @pytest.mark.asyncio
+    async def test_failures_are_recorded(self, tmp_path, sample_plan):
+        compiler = LessonCompiler(FakeTutor(sample_plan, fail_on={"Bad"}))
+        stats = await compiler.run(["Bad", "Good"], JsonlSink(tmp_path / "out.jsonl"))
+        assert stats.failed == 1
+        assert stats.compiled == 1
+        assert "boom" in stats.errors["Bad"]
+
+    @pytest.mark.asyncio
+    async def test_retries_rate_limited_calls(self, sample_plan):
+        tutor = FakeTutor(sample_plan, rate_limit_once=True)
+        compiler = LessonCompiler(tutor, backoff=0.001)
+        lesson = await compiler.compile_topic("Graphs")
+        assert lesson.plan.topic == "Graphs"
+
+    @pytest.mark.asyncio
+    async def test_writes_lesson_pack(self, tmp_path, sample_plan):
+        path = tmp_path / "out.gmpack"
+        sink = PackSink(path)
+        await LessonCompiler(FakeTutor(sample_plan)).run(["Graphs"], sink)
+        sink.close()
+
+        pack = LessonPack(path)
+        plan = pack.find_plan("graphs")
+        assert pack.explanation(plan, plan.steps[1]) == "Step 1"
+        assert pack.summary(plan) == "# Graphs"
+
+
+class TestCompileCommand:
+    def test_compiles_topics_file(self, tmp_path, sample_plan, monkeypatch, capsys):
+        monkeypatch.setenv("GROQ_API_KEY", "test_key")
+        topics = tmp_path / "topics.txt"
+        topics.write_text("Graphs\nTrees\n")
+        output = tmp_path / "out.jsonl"
+
+        with patch(
+            "groqmate.interfaces.cli.commands.Tutor",
+            return_value=FakeTutor(sample_plan),
+        ):
+            code = compile_command([str(topics), "-o", str(output), "-p", "groq"])
+
+        assert code == 0
+        assert len(output.read_text().splitlines()) == 2
+        assert "lessons/min" in capsys.readouterr().out
+
+    def test_missing_api_key_fails(self, tmp_path, monkeypatch, capsys):
+        monkeypatch.delenv("GROQ_API_KEY", raising=False)
+        monkeypatch.setattr(
+            "groqmate.core.config.CONFIG_PATH", tmp_path / "missing.toml"
+        )
+        topics = tmp_path / "topics.txt"
+        topics.write_text("Graphs\n")
+        assert compile_command([str(topics), "-p", "groq"]) == 1
+        assert "No API key" in capsys.readouterr().err
+
+    def test_missing_topics_file_fails(self, tmp_path, capsys):
+        assert compile_command([str(tmp_path / "missing.txt")]) == 1
+        assert "Error:" in capsys.readouterr().err
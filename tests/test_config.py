@@ -0,0 +1,137 @@
+import asyncio
+import os
+import pytest
+from groqmate.core.config import Config, ConfigError, ConfigWatcher
+
+
+@pytest.fixture
+def path(tmp_path):
+    return tmp_path / "config.toml"
+
+
+def touch_later(path, text):
+    # Bump mtime explicitly so coarse filesystem clocks still see a change.
+    mtime = os.stat(path).st_mtime_ns if path.exists() else 0
+    path.write_text(text)
+    os.utime(path, ns=(mtime + 10**9, mtime + 10**9))
+
+
+class TestConfigLoad:
+    def test_missing_file_gives_defaults(self, path):
+        assert Config.load(path) == Config()
+
+    def test_round_trip(self, path):
+        config = Config()
+        config.settings.provider = "openai"
+        config.set_api_key("openai", "sk-test")
+        config.save(path)
+
+        loaded = Config.load(path)
+        assert loaded.settings.provider == "openai"
+        assert loaded.get_api_key("openai") == "sk-test"
+
+    def test_cached_until_file_changes(self, path, monkeypatch):
+        touch_later(path, '[settings]\nprovider = "gemini"\n')
+        assert Config.load(path).settings.provider == "gemini"
+
+        calls = []
+        import tomllib
+
+        monkeypatch.setattr(tomllib, "load", lambda f: calls.append(f) or {})
+        assert Config.load(path).settings.provider == "gemini"
+        assert calls == []
+
+        touch_later(path, '[settings]\nprovider = "openai"\n')
+        Config.load(path)
+        assert len(calls) == 1
+
+    def test_returns_independent_copies(self, path):
+        Config().save(path)
+        first = Config.load(path)
+        first.settings.provider = "openai"
+        assert Config.load(path).settings.provider == "groq"
+
+    def test_parse_error_is_reported(self, path):
+        path.write_text("[settings\nprovider = ")
+        with pytest.raises(ConfigError) as info:
+            Config.load(path)
+        assert str(path) in str(info.value)
+
+    def test_invalid_value_is_reported(self, path):
+        path.write_text('[settings]\nplan_match_threshold = "high"\n')
+        with pytest.raises(ConfigError, match="plan_match_threshold"):
+            Config.load(path)
+
+    @pytest.mark.parametrize(
+        "line",
+        [
+            'provider = "gorq"',
+            "plan_match_threshold = 7",
+            "stream_fps = 0",
+            "max_requests = -1",
+        ],
+    )
+    def test_out_of_range_settings_are_reported(self, path, line):
+        path.write_text(f"[settings]\n{line}\n")
+        with pytest.raises(ConfigError, match=line.split()[0]):
+            Config.load(path)
+
+    def test_provider_stays_a_plain_string(self, path):
+        path.write_text('[settings]\nprovider = "gemini"\n')
+        assert type(Config.load(path).settings.provider) is str
+        assert type(Config().settings.provider) is str
+
+
+class TestConfigSave:
+    def test_save_is_atomic_and_private(self, path):
+        Config().save(path)
+        assert oct(path.stat().st_mode & 0o777) == "0o600"
+        assert [p.name for p in path.parent.iterdir()] == ["config.toml"]
+
+    def test_failed_save_keeps_old_file(self, path, monkeypatch):
+        Config().save(path)
+        before = path.read_bytes()
+
+        def boom(data, f):
+            f.write(b"[settings")
+            raise OSError("disk full")
+
+        monkeypatch.setattr("groqmate.core.config.tomli_w.dump", boom)
+        with pytest.raises(OSError):
+            Config().save(path)
+        assert path.read_bytes() == before
+        assert [p.name for p in path.parent.iterdir()] == ["config.toml"]
+
+    def test_save_async(self, path):
+        config = Config()
+        config.settings.model = "llama-3.1-8b-instant"
+        asyncio.run(config.save_async(path))
+        assert Config.load(path).settings.model == "llama-3.1-8b-instant"
+
+
+class TestConfigWatcher:
+    def test_no_change(self, path):
+        Config().save(path)
+        assert ConfigWatcher(path).check() is None
+
+    def test_picks_up_edit(self, path):
+        Config().save(path)
+        watcher = ConfigWatcher(path)
+        touch_later(path, '[settings]\nprovider = "openai"\n')
+        assert watcher.check().settings.provider == "openai"
+        assert watcher.check() is None
+
+    def test_created_and_deleted(self, path):
+        watcher = ConfigWatcher(path)
+        touch_later(path, '[settings]\nprovider = "gemini"\n')
+        assert watcher.check().settings.provider == "gemini"
+        path.unlink()
+        assert watcher.check() == Config()
+
+    def test_reports_broken_file_once(self, path):
+        Config().save(path)
+        watcher = ConfigWatcher(path)
+        touch_later(path, "[settings")
+        with pytest.raises(ConfigError):
+            watcher.check()
+        assert watcher.check() is None
@@ -0,0 +1,309 @@
+import asyncio
+import shutil
+import tempfile
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from groqmate.core.config import ApiKeys, Config
+from groqmate.core.daemon import (
+    DaemonError,
+    DaemonUnavailable,
+    RemoteTutor,
+    TutorDaemon,
+    call,
+    encode,
+    ping,
+)
+from groqmate.core.tutor import Tutor
+from groqmate.interfaces.cli.commands import daemon_command
+
+
+@pytest.fixture
+def socket_dir():
+    # Unix socket paths are limited to about 100 bytes, too short for tmp_path.
+    path = Path(tempfile.mkdtemp(prefix="gm-", dir="/tmp"))
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
+
+
+@pytest.fixture
+def socket_path(socket_dir):
+    return socket_dir / "daemon.sock"
+
+
+@pytest.fixture
+async def daemon(socket_path, socket_dir, monkeypatch):
+    monkeypatch.setenv("GROQ_API_KEY", "test_key")
+    daemon = TutorDaemon(socket_path, config_path=socket_dir / "config.toml")
+    task = asyncio.create_task(daemon.serve())
+    while not socket_path.exists():
+        await asyncio.sleep(0.01)
+    yield daemon
+    daemon.stop()
+    await task
+
+
+@pytest.fixture
+def remote(socket_path, provider_config_groq, monkeypatch):
+    monkeypatch.setenv("GROQ_API_KEY", "test_key")
+    return RemoteTutor(Tutor(provider_config_groq, Config()), socket_path)
+
+
+def streaming(chunks):
+    async def stream(*args, **kwargs):
+        for chunk in chunks:
+            yield chunk
+
+    return stream
+
+
+class TestTutorDaemon:
+    @pytest.mark.asyncio
+    async def test_ping_reports_status(self, daemon, socket_path):
+        status = await ping(socket_path)
+        assert status["clients"] == 1
+        assert status["served"] == 0
+
+    @pytest.mark.asyncio
+    async def test_ping_without_daemon(self, socket_path):
+        assert await ping(socket_path) is None
+
+    @pytest.mark.asyncio
+    async def test_socket_is_owner_only(self, daemon, socket_path):
+        assert socket_path.stat().st_mode & 0o077 == 0
+
+    @pytest.mark.asyncio
+    async def test_refuses_second_daemon(self, daemon, socket_path):
+        with pytest.raises(DaemonError, match="already listening"):
+            await TutorDaemon(socket_path).serve()
+
+    @pytest.mark.asyncio
+    async def test_stop_request(self, socket_path):
+        daemon = TutorDaemon(socket_path)
+        task = asyncio.create_task(daemon.serve())
+        while not socket_path.exists():
+            await asyncio.sleep(0.01)
+        assert await call(socket_path, {"op": "stop"}) is True
+        await asyncio.wait_for(task, 1)
+        assert not socket_path.exists()
+
+    @pytest.mark.asyncio
+    async def test_exits_when_idle(self, socket_path):
+        daemon = TutorDaemon(socket_path, idle_shutdown=0.05)
+        await asyncio.wait_for(daemon.serve(), 1)
+        assert not socket_path.exists()
+
+    @pytest.mark.asyncio
+    async def test_unknown_request_is_an_error(self, daemon, socket_path):
+        with pytest.raises(DaemonError, match="Unknown request"):
+            await call(socket_path, {"op": "dance", "provider": "groq", "state": {}})
+
+    @pytest.mark.asyncio
+    async def test_tutor_errors_reach_the_client(
+        self, daemon, socket_path, monkeypatch
+    ):
+        monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+        request = {"op": "plan", "provider": "openai", "topic": "x"}
+        with pytest.raises(DaemonError, match="No API key for OPENAI"):
+            await call(socket_path, request)
+
+
+class TestRemoteTutor:
+    @pytest.mark.asyncio
+    async def test_plan_through_daemon(self, daemon, remote, mock_litellm_response):
+        with patch(
+            "groqmate.core.tutor.acompletion",
+            new_callable=AsyncMock,
+            return_value=mock_litellm_response,
+        ):
+            plan = await remote.generate_plan("Recursion")
+        assert plan.topic == "Test"
+        assert remote.remote is True
+        assert remote.ledger.totals.calls == 1
+        assert daemon.served == 1
+
+    @pytest.mark.asyncio
+    async def test_streams_tokens(self, daemon, remote, session, mock_streaming_chunks):
+        with patch(
+            "groqmate.core.tutor.acompletion",
+            side_effect=streaming(mock_streaming_chunks),
+        ):
+            tokens = [t async for t in remote.explain_step_stream(session)]
+        assert tokens == ["Hello", " ", "World"]
+        assert remote.ledger.operations["explain"].calls == 1
+
+    @pytest.mark.asyncio
+    async def test_serves_concurrent_clients(
+        self, daemon, remote, session, mock_streaming_chunks
+    ):
+        async def explain():
+            return "".join([t async for t in remote.rephrase_stream(session)])
+
+        with patch(
+            "groqmate.core.tutor.acompletion",
+            side_effect=streaming(mock_streaming_chunks),
+        ):
+            replies = await asyncio.gather(*(explain() for _ in range(8)))
+        assert replies == ["Hello World"] * 8
+        assert daemon.served == 8
+
+    @pytest.mark.asyncio
+    async def test_hangup_closes_provider_stream(
+        self, daemon, remote, session, mock_streaming_chunks
+    ):
+        class Response:
+            def __init__(self):
+                self.aclose = AsyncMock()
+                self.sent = False
+
+            def __aiter__(self):
+                return self
+
+            async def __anext__(self):
+                if not self.sent:
+                    self.sent = True
+                    return mock_streaming_chunks[0]
+                await asyncio.sleep(60)
+
+        response = Response()
+        with patch("groqmate.core.tutor.acompletion", return_value=response):
+            stream = remote.explain_step_stream(session)
+            assert await anext(stream) == "Hello"
+            await stream.aclose()
+            while not response.aclose.await_count:
+                await asyncio.sleep(0.01)
+        assert daemon.active == 0
+
+    @pytest.mark.asyncio
+    async def test_falls_back_in_process(self, remote, session, mock_streaming_chunks):
+        with patch(
+            "groqmate.core.tutor.acompletion",
+            side_effect=streaming(mock_streaming_chunks),
+        ) as mock:
+            tokens = [t async for t in remote.explain_step_stream(session)]
+            assert tokens == ["Hello", " ", "World"]
+            assert remote.remote is False
+            mock.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_grades_locally(self, remote, session):
+        correct, _ = await remote.check_answer("base case", session)
+        assert correct is True
+        assert remote.grader.stats.total == 1
+        assert remote.remote is True
+
+
+@pytest.fixture
+async def dropping_daemon(socket_path):
+    # Stands in for a daemon that dies mid-request: it sends the given
+    # replies and then hangs up.
+    sent = []
+
+    async def handle(reader, writer):
+        await reader.readline()
+        for reply in sent:
+            writer.write(encode(reply))
+        await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_unix_server(handle, path=str(socket_path))
+    yield sent
+    server.close()
+    await server.wait_closed()
+
+
+class TestRemoteFallback:
+    @pytest.mark.asyncio
+    async def test_uses_the_clients_api_key(
+        self,
+        daemon,
+        socket_path,
+        provider_config_groq,
+        mock_litellm_response,
+        monkeypatch,
+    ):
+        config = Config(api_keys=ApiKeys(groq="client_key"))
+        remote = RemoteTutor(Tutor(provider_config_groq, config), socket_path)
+        monkeypatch.delenv("GROQ_API_KEY", raising=False)
+        with patch(
+            "groqmate.core.tutor.acompletion",
+            new_callable=AsyncMock,
+            return_value=mock_litellm_response,
+        ) as mock:
+            await remote.generate_plan("Recursion")
+        assert mock.call_args[1]["api_key"] == "client_key"
+        assert daemon.served == 1
+
+    @pytest.mark.asyncio
+    async def test_provider_setup_error_falls_back(
+        self, daemon, remote, mock_litellm_response, monkeypatch
+    ):
+        monkeypatch.setattr(
+            daemon.pool, "get", MagicMock(side_effect=ValueError("No API key"))
+        )
+        with patch(
+            "groqmate.core.tutor.acompletion",
+            new_callable=AsyncMock,
+            return_value=mock_litellm_response,
+        ) as mock:
+            plan = await remote.generate_plan("Recursion")
+        assert plan.topic == "Test"
+        assert remote.remote is False
+        mock.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_daemon_dying_mid_request_falls_back(
+        self, dropping_daemon, remote, mock_litellm_response
+    ):
+        with patch(
+            "groqmate.core.tutor.acompletion",
+            new_callable=AsyncMock,
+            return_value=mock_litellm_response,
+        ):
+            plan = await remote.generate_plan("Recursion")
+        assert plan.topic == "Test"
+        assert remote.remote is False
+
+    @pytest.mark.asyncio
+    async def test_partial_stream_is_not_restarted(
+        self, dropping_daemon, remote, session
+    ):
+        dropping_daemon.append({"token": "Hello"})
+        tokens = []
+        with patch("groqmate.core.tutor.acompletion") as mock:
+            with pytest.raises(DaemonUnavailable):
+                async for token in remote.explain_step_stream(session):
+                    tokens.append(token)
+        assert tokens == ["Hello"]
+        mock.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_honours_the_clients_request_cap(
+        self, daemon, remote, mock_litellm_response
+    ):
+        remote.fallback.limiter = asyncio.Semaphore(1)
+        in_flight = peak = 0
+
+        async def complete(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.02)
+            in_flight -= 1
+            return mock_litellm_response
+
+        with patch("groqmate.core.tutor.acompletion", side_effect=complete):
+            await asyncio.gather(*(remote.generate_plan("x") for _ in range(4)))
+        assert peak == 1
+        assert daemon.served == 4
+
+
+class TestDaemonCommand:
+    def test_status_without_daemon(self, socket_path, capsys):
+        assert daemon_command(["--status", "--socket", str(socket_path)]) == 1
+        assert "No daemon running" in capsys.readouterr().out
+
+    def test_stop_without_daemon(self, socket_path, capsys):
+        assert daemon_command(["--stop", "--socket", str(socket_path)]) == 1
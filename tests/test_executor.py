@@ -0,0 +1,79 @@
+import pytest
+from textual.app import App
+from textual.message import Message
+
+from groqmate.interfaces.cli import executor
+
+
+class Reply(Message):
+    def __init__(self, result):
+        super().__init__()
+        self.result = result
+
+
+class ReplyApp(App):
+    def __init__(self):
+        super().__init__()
+        self.results = []
+
+    def on_reply(self, message: Reply) -> None:
+        self.results.append(message.result)
+
+
+@pytest.fixture
+def pool():
+    yield
+    executor.shutdown()
+
+
+class TestOffload:
+    @pytest.mark.asyncio
+    async def test_runs_off_the_event_loop(self, pool):
+        import threading
+
+        name = await executor.offload(lambda: threading.current_thread().name)
+        assert name.startswith("groqmate-cpu")
+
+    @pytest.mark.asyncio
+    async def test_jobs_run_in_order(self, pool):
+        seen = []
+        for n in range(5):
+            await executor.offload(seen.append, n)
+        assert seen == [0, 1, 2, 3, 4]
+
+
+class TestSubmit:
+    @pytest.mark.asyncio
+    async def test_without_pool_replies_none(self, pool):
+        app = ReplyApp()
+        async with app.run_test() as pilot:
+            assert executor.submit(app, Reply, len, "abc") is None
+            await pilot.pause()
+            assert app.results == [None]
+
+    @pytest.mark.asyncio
+    async def test_result_arrives_as_message(self, pool):
+        for future in executor.start(int):
+            future.result()
+        assert executor.started()
+        app = ReplyApp()
+        async with app.run_test() as pilot:
+            executor.submit(app, Reply, len, "abc").result()
+            await pilot.pause()
+            assert app.results == [3]
+
+    @pytest.mark.asyncio
+    async def test_failed_job_replies_none(self, pool):
+        executor.start()
+        app = ReplyApp()
+        async with app.run_test() as pilot:
+            future = executor.submit(app, Reply, int, "not a number")
+            with pytest.raises(ValueError):
+                future.result()
+            await pilot.pause()
+            assert app.results == [None]
+
+    def test_shutdown_stops_pool(self, pool):
+        executor.start()
+        executor.shutdown()
+        assert not executor.started()
@@ -0,0 +1,298 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from groqmate.core.grading import (
+    Grader,
+    GradingStats,
+    Tier,
+    parse_judgement,
+    score_unique,
+)
+from groqmate.core.matching import CompiledAnswer, compile_answer, tokenize
+from groqmate.core.tutor import JUDGE_TIMEOUT, Tutor
+
+QUESTION = "What is the key component that stops recursion?"
+
+
+def judge_returning(text):
+    return AsyncMock(return_value=text)
+
+
+class TestParseJudgement:
+    def test_correct(self):
+        assert parse_judgement(" correct.") is True
+
+    def test_incorrect(self):
+        assert parse_judgement("INCORRECT") is False
+
+    def test_unparseable(self):
+        assert parse_judgement("maybe") is None
+
+
+class TestGradingStats:
+    def test_empty_report(self):
+        stats = GradingStats()
+        assert stats.total == 0
+        assert stats.fraction(Tier.LLM) == 0.0
+
+    def test_report_fractions(self):
+        stats = GradingStats()
+        for tier in (Tier.LOCAL_ACCEPT, Tier.LOCAL_REJECT, Tier.CACHE, Tier.LLM):
+            stats.record(tier)
+        assert stats.fraction(Tier.LOCAL_ACCEPT, Tier.LOCAL_REJECT) == 0.5
+        assert "50% local, 25% cached, 25% LLM" in stats.report()
+
+
+class TestGrader:
+    @pytest.mark.asyncio
+    async def test_clear_accept_is_local(self):
+        grader = Grader()
+        judge = judge_returning("INCORRECT")
+        verdict = await grader.grade(
+            QUESTION, CompiledAnswer("base case"), "base case", judge
+        )
+        assert verdict.correct is True
+        assert verdict.tier == Tier.LOCAL_ACCEPT
+        judge.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_short_unrelated_answer_rejected_locally(self):
+        grader = Grader()
+        judge = judge_returning("CORRECT")
+        verdict = await grader.grade(
+            QUESTION, CompiledAnswer("base case"), "queue", judge
+        )
+        assert verdict.correct is False
+        assert verdict.tier == Tier.LOCAL_REJECT
+        judge.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_ambiguous_answer_goes_to_judge(self):
+        grader = Grader()
+        judge = judge_returning("CORRECT")
+        verdict = await grader.grade(
+            QUESTION,
+            CompiledAnswer("base case"),
+            "a condition where the function stops calling itself",
+            judge,
+        )
+        assert verdict.correct is True
+        assert verdict.tier == Tier.LLM
+        prompt = judge.call_args[0][0]
+        assert "stops calling itself" in prompt
+        assert "base case" in prompt
+
+    @pytest.mark.asyncio
+    async def test_verdicts_are_cached_by_normalized_answer(self):
+        grader = Grader()
+        judge = judge_returning("INCORRECT")
+        answer = CompiledAnswer("base case")
+        await grader.grade(QUESTION, answer, "when the loop never ends", judge)
+        verdict = await grader.grade(
+            QUESTION, answer, "When the loop NEVER ends!", judge
+        )
+        assert verdict.tier == Tier.CACHE
+        assert verdict.correct is False
+        judge.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_cache_is_bounded(self):
+        grader = Grader(cache_size=2)
+        judge = judge_returning("INCORRECT")
+        answer = CompiledAnswer("base case")
+        for text in ("first long answer", "second long answer", "third long answer"):
+            await grader.grade(QUESTION, answer, text, judge)
+        assert len(grader._cache) == 2
+
+    @pytest.mark.asyncio
+    async def test_without_judge_ambiguous_is_local_reject(self):
+        grader = Grader()
+        verdict = await grader.grade(
+            QUESTION, CompiledAnswer("base case"), "the stopping condition of it all"
+        )
+        assert verdict.correct is False
+        assert verdict.tier == Tier.LOCAL_REJECT
+
+    @pytest.mark.asyncio
+    async def test_judge_failure_falls_back_and_is_not_cached(self):
+        grader = Grader()
+        judge = AsyncMock(side_effect=RuntimeError("timeout"))
+        answer = CompiledAnswer("base case")
+        verdict = await grader.grade(
+            QUESTION, answer, "the stopping condition here", judge
+        )
+        assert verdict.correct is False
+        assert verdict.tier == Tier.JUDGE_FAILED
+        assert grader._cache == {}
+        assert grader.stats.fraction(Tier.LOCAL_REJECT) == 0.0
+        assert "1 judge call(s) failed" in grader.stats.report()
+
+    @pytest.mark.asyncio
+    async def test_stats_track_tiers(self):
+        grader = Grader()
+        judge = judge_returning("CORRECT")
+        answer = CompiledAnswer("base case")
+        await grader.grade(QUESTION, answer, "base case", judge)
+        await grader.grade(QUESTION, answer, "the stopping condition here", judge)
+        await grader.grade(QUESTION, answer, "the stopping condition here", judge)
+        assert grader.stats.counts == {Tier.LOCAL_ACCEPT: 1, Tier.LLM: 1, Tier.CACHE: 1}
+
+
+class TestTutorGrading:
+    @pytest.mark.asyncio
+    async def test_judge_uses_grader_model_with_token_cap(
+        self, session, provider_config_groq, monkeypatch
+    ):
+        monkeypatch.setenv("GROQ_API_KEY", "test_key")
+        response = MagicMock()
+        response.choices = [MagicMock()]
+        response.choices[0].message.content = "CORRECT"
+
+        with patch(
+            "groqmate.core.tutor.acompletion",
+            new_callable=AsyncMock,
+            return_value=response,
+        ) as mock:
+            tutor = Tutor(provider_config_groq)
+            correct, feedback = await tutor.check_answer(
+                "the condition that ends the calls", session
+            )
+
+        assert correct is True
+        assert "Correct" in feedback
+        kwargs = mock.call_args[1]
+        assert kwargs["model"] == "groq/llama-3.1-8b-instant"
+        assert kwargs["max_tokens"] <= 5
+        assert kwargs["temperature"] == 0
+        assert kwargs["timeout"] == JUDGE_TIMEOUT
+
+    @pytest.mark.asyncio
+    async def test_llm_grading_can_be_disabled(
+        self, session, provider_config_groq, monkeypatch
+    ):
+        monkeypatch.setenv("GROQ_API_KEY", "test_key")
+        with patch("groqmate.core.tutor.acompletion", new_callable=AsyncMock) as mock:
+            tutor = Tutor(provider_config_groq)
+            tutor.config.settings.llm_grading = False
+            correct, _ = await tutor.check_answer(
+                "the condition that ends the calls", session
+            )
+
+        assert correct is False
+        mock.assert_not_called()
+
+
+class TestScoreUnique:
+    def test_matches_single_answer_scoring(self):
+        answer = CompiledAnswer("input gets smaller", ["shrinking input"])
+        texts = ["the input gets smaller", "smaller", "inputs shrinking", "nope", ""]
+        unique = [tokenize(t) for t in texts]
+        assert score_unique(answer, unique) == pytest.approx(
+            [answer.score(t) for t in texts]
+        )
+
+    def test_pure_python_fallback_matches_numpy(self, monkeypatch):
+        answer = CompiledAnswer("stack overflow", ["too much recursion"])
+        unique = [
+            tokenize(t) for t in ("stak overflow", "recursion", "overflow", "heap")
+        ]
+        vectorized = score_unique(answer, unique)
+        monkeypatch.setattr("groqmate.core.grading._numpy", lambda: None)
+        assert score_unique(answer, unique) == pytest.approx(vectorized)
+
+    def test_joined_form_scores_full(self):
+        answer = CompiledAnswer("base case")
+        assert score_unique(answer, [tokenize("basecase")]) == [1.0]
+
+    @pytest.mark.parametrize("vectorized", [True, False])
+    def test_operator_and_negation_conflicts(self, vectorized, monkeypatch):
+        if not vectorized:
+            monkeypatch.setattr("groqmate.core.grading._numpy", lambda: None)
+        unique = [tokenize(t) for t in ("n+1", "n-1", "1")]
+        assert score_unique(CompiledAnswer("n-1"), unique) == [0.0, 1.0, 0.0]
+        unique = [tokenize(t) for t in ("asynchronous", "synchronus")]
+        assert score_unique(CompiledAnswer("synchronous"), unique) == [0.0, 1.0]
+
+
+class TestGradeBulk:
+    @pytest.mark.asyncio
+    async def test_verdicts_align_with_answers(self, sample_step):
+        grader = Grader()
+        answers = ["base case", "Base-Case", "loop", "base", "queue"]
+        result = await grader.grade_bulk(sample_step, answers)
+        assert [v.correct for v in result.verdicts] == [True, True, False, False, False]
+
+    @pytest.mark.asyncio
+    async def test_local_accept_needs_every_token(self, sample_step):
+        grader = Grader()
+        judge = judge_returning("INCORRECT")
+        result = await grader.grade_bulk(sample_step, ["base", "base case"], judge)
+        assert result.verdicts[0].tier == Tier.LLM
+        assert result.verdicts[1].tier == Tier.LOCAL_ACCEPT
+
+    @pytest.mark.asyncio
+    async def test_clusters_identical_wrong_answers(self, sample_step):
+        grader = Grader()
+        answers = ["loop", "Loop!", "queue", "base case", "the loop"]
+        result = await grader.grade_bulk(sample_step, answers)
+        assert result.clusters[0].normalized == "loop"
+        assert result.clusters[0].count == 3
+        assert result.clusters[0].indices == [0, 1, 4]
+        assert result.clusters[1].answer == "queue"
+
+    @pytest.mark.asyncio
+    async def test_judge_called_once_per_distinct_ambiguous_answer(self, sample_step):
+        grader = Grader()
+        judge = judge_returning("INCORRECT")
+        answers = ["when the function stops calling"] * 30 + ["it keeps going forever"]
+        result = await grader.grade_bulk(sample_step, answers, judge)
+        assert judge.await_count == 2
+        assert result.verdicts[0].tier == Tier.LLM
+        assert result.verdicts[1].tier == Tier.CACHE
+        assert grader.stats.total == 31
+
+    @pytest.mark.asyncio
+    async def test_uses_cache_from_single_grading(self, sample_step):
+        grader = Grader()
+        judge = judge_returning("CORRECT")
+        answer = compile_answer(sample_step)
+        await grader.grade(
+            sample_step.quiz_question, answer, "the stopping condition here", judge
+        )
+        result = await grader.grade_bulk(
+            sample_step, ["The stopping condition, here"], judge
+        )
+        assert result.verdicts[0].tier == Tier.CACHE
+        judge.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_judge_calls_are_bounded(self, sample_step):
+        in_flight = peak = 0
+
+        async def judge(prompt):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return "INCORRECT"
+
+        answers = [f"it stops when call number {n} returns" for n in range(40)]
+        result = await Grader().grade_bulk(sample_step, answers, judge, concurrency=3)
+        assert peak == 3
+        assert all(v.tier == Tier.LLM for v in result.verdicts)
+
+    @pytest.mark.asyncio
+    async def test_empty_batch(self, sample_step):
+        result = await Grader().grade_bulk(sample_step, [])
+        assert result.verdicts == []
+        assert result.clusters == []
+
+    @pytest.mark.asyncio
+    async def test_tutor_grade_answers(
+        self, sample_step, provider_config_groq, monkeypatch
+    ):
+        monkeypatch.setenv("GROQ_API_KEY", "test_key")
+        tutor = Tutor(provider_config_groq)
+        result = await tutor.grade_answers(sample_step, ["base case", "queue"])
+        assert [v.correct for v in result.verdicts] == [True, False]
@@ -0,0 +1,76 @@
+import pytest
+from groqmate.interfaces.cli.history import ChatHistory, ChatRecord
+
+
+def fill(history, count):
+    for i in range(count):
+        history.append(ChatRecord("You", f"message {i}", is_user=True))
+
+
+class TestChatHistory:
+    def test_append_and_index(self):
+        history = ChatHistory()
+        assert history.append(ChatRecord("System", "hi", is_system=True)) == 0
+        assert history[0] == ChatRecord("System", "hi", False, True)
+        assert history[-1] == history[0]
+        assert len(history) == 1
+
+    def test_spills_oldest_beyond_memory_limit(self):
+        history = ChatHistory(memory_limit=3)
+        fill(history, 10)
+        assert len(history) == 10
+        assert history.spilled == 7
+        assert [r.content for r in history.slice(0, 10)] == [
+            f"message {i}" for i in range(10)
+        ]
+        assert history[2].is_user is True
+        history.close()
+
+    def test_no_limit_never_spills(self):
+        history = ChatHistory(memory_limit=None)
+        fill(history, 50)
+        assert history.spilled == 0
+
+    def test_unicode_survives_spill(self):
+        history = ChatHistory(memory_limit=1)
+        history.append(ChatRecord("Groqmate", "∑ √π\nline two"))
+        history.append(ChatRecord("You", "ok"))
+        assert history[0].content == "∑ √π\nline two"
+        history.close()
+
+    def test_update_and_delete_recent(self):
+        history = ChatHistory(memory_limit=2)
+        fill(history, 4)
+        history[3] = history[3]._replace(content="edited")
+        assert history[3].content == "edited"
+        del history[2]
+        assert [r.content for r in history.slice(0, 3)] == [
+            "message 0",
+            "message 1",
+            "edited",
+        ]
+
+    def test_spilled_records_are_read_only(self):
+        history = ChatHistory(memory_limit=1)
+        fill(history, 3)
+        with pytest.raises(IndexError):
+            history[0] = ChatRecord("You", "nope")
+        with pytest.raises(IndexError):
+            del history[0]
+
+    def test_out_of_range(self):
+        with pytest.raises(IndexError):
+            ChatHistory()[0]
+
+    def test_slice_clamps(self):
+        history = ChatHistory()
+        fill(history, 3)
+        assert len(history.slice(-5, 10)) == 3
+
+    def test_clear(self):
+        history = ChatHistory(memory_limit=1)
+        fill(history, 5)
+        history.clear()
+        assert len(history) == 0
+        fill(history, 2)
+        assert history[0].content == "message 0"
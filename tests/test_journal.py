@@ -0,0 +1,130 @@
+import pytest
+from groqmate.core.journal import SessionJournal
+from groqmate.core.models import SessionStatus
+from groqmate.core.state import Session
+
+
+@pytest.fixture
+def journal(tmp_path):
+    return SessionJournal(tmp_path / "session")
+
+
+def reopen(tmp_path):
+    restored = Session()
+    resumed = SessionJournal(tmp_path / "session").restore(restored)
+    return resumed, restored
+
+
+class TestSessionJournal:
+    def test_nothing_to_restore(self, journal):
+        assert journal.restore(Session()) is False
+
+    def test_restores_plan_and_progress(self, tmp_path, journal, sample_plan):
+        session = Session()
+        journal.attach(session)
+        session.load_plan(sample_plan)
+        session.advance()
+        session.advance()
+        session.enter_quiz()
+
+        resumed, restored = reopen(tmp_path)
+        assert resumed is True
+        assert restored.state.plan.topic == "Recursion"
+        assert restored.state.current_step == 2
+        assert restored.state.completed == [0, 1]
+        assert restored.is_in_quiz()
+        assert restored.current_answer().answer == "input gets smaller"
+
+    def test_log_holds_only_small_events(self, journal, sample_plan):
+        session = Session()
+        journal.attach(session)
+        session.load_plan(sample_plan)
+        session.enter_quiz()
+        session.exit_quiz()
+        session.advance()
+        assert journal.log_path.read_text().split() == [
+            "enter_quiz",
+            "exit_quiz",
+            "advance",
+        ]
+
+    def test_periodic_snapshot_truncates_log(self, tmp_path, sample_plan):
+        journal = SessionJournal(tmp_path / "session", snapshot_every=2)
+        session = Session()
+        journal.attach(session)
+        session.load_plan(sample_plan)
+        session.advance()
+        session.advance()
+        assert not journal.log_path.exists()
+
+        _, restored = reopen(tmp_path)
+        assert restored.state.current_step == 2
+
+    def test_back_is_replayed(self, tmp_path, journal, sample_plan):
+        session = Session()
+        journal.attach(session)
+        session.load_plan(sample_plan)
+        session.advance()
+        session.back()
+
+        _, restored = reopen(tmp_path)
+        assert restored.state.current_step == 0
+        assert restored.state.completed == []
+
+    def test_reset_clears_resume(self, tmp_path, journal, sample_plan):
+        session = Session()
+        journal.attach(session)
+        session.load_plan(sample_plan)
+        session.reset()
+
+        resumed, restored = reopen(tmp_path)
+        assert resumed is False
+        assert restored.state.plan is None
+
+    def test_corrupt_snapshot_is_ignored(self, journal):
+        journal.directory.mkdir(parents=True)
+        journal.snapshot_path.write_text('{"plan": {"topic": ')
+        assert journal.restore(Session()) is False
+
+    def test_torn_log_line_is_skipped(self, tmp_path, journal, sample_plan):
+        session = Session()
+        journal.attach(session)
+        session.load_plan(sample_plan)
+        session.advance()
+        with open(journal.log_path, "a") as f:
+            f.write("adv")
+
+        _, restored = reopen(tmp_path)
+        assert restored.state.current_step == 1
+
+    def test_close_snapshots_and_detaches(self, tmp_path, journal, sample_plan):
+        session = Session()
+        journal.attach(session)
+        session.load_plan(sample_plan)
+        session.advance()
+        journal.close()
+        session.advance()
+
+        assert not journal.log_path.exists()
+        _, restored = reopen(tmp_path)
+        assert restored.state.current_step == 1
+        assert restored.state.status == SessionStatus.TEACHING
+
+    def test_remembers_transcript_path(self, tmp_path, journal, sample_plan):
+        session = Session()
+        journal.attach(session)
+        journal.transcript = tmp_path / "lesson.jsonl"
+        session.load_plan(sample_plan)
+
+        resumed = SessionJournal(tmp_path / "session")
+        assert resumed.restore(Session()) is True
+        assert resumed.transcript == tmp_path / "lesson.jsonl"
+
+    def test_snapshot_without_transcript(self, tmp_path, journal, sample_plan):
+        session = Session()
+        journal.attach(session)
+        session.load_plan(sample_plan)
+
+        resumed = SessionJournal(tmp_path / "session")
+        resumed.restore(Session())
+        assert resumed.transcript is None
@@ -0,0 +1,229 @@
+import pytest
+from datetime import date, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+import time
+from groqmate.core.ledger import UsageLedger, UsageRecord, read_usage, rollup
+from groqmate.core.tutor import Tutor
+from groqmate.interfaces.cli.commands import usage_command
+
+
+def make_record(**overrides):
+    fields = dict(
+        timestamp=1_700_000_000.0,
+        session="abc123",
+        operation="explain",
+        provider="groq",
+        model="groq/llama-3.3-70b-versatile",
+        prompt_tokens=100,
+        completion_tokens=50,
+        cached_tokens=20,
+        latency=0.25,
+        cost=0.0001,
+    )
+    fields.update(overrides)
+    return UsageRecord(**fields)
+
+
+def usage(prompt, completion, cached=None):
+    details = SimpleNamespace(cached_tokens=cached) if cached is not None else None
+    return SimpleNamespace(
+        prompt_tokens=prompt,
+        completion_tokens=completion,
+        prompt_tokens_details=details,
+    )
+
+
+class TestReadUsage:
+    def test_object_usage(self):
+        response = SimpleNamespace(usage=usage(120, 30, 64))
+        assert read_usage(response) == (120, 30, 64)
+
+    def test_dict_usage(self):
+        response = {"usage": {"prompt_tokens": 10, "completion_tokens": 5}}
+        assert read_usage(response) == (10, 5, 0)
+
+    def test_anthropic_cache_reads(self):
+        response = {
+            "usage": {
+                "prompt_tokens": 10,
+                "completion_tokens": 5,
+                "cache_read_input_tokens": 8,
+            }
+        }
+        assert read_usage(response) == (10, 5, 8)
+
+    def test_missing_usage(self):
+        assert read_usage(SimpleNamespace(choices=[])) is None
+        assert read_usage(SimpleNamespace(usage=usage(None, None))) is None
+
+
+class TestUsageRecord:
+    def test_line_round_trip(self):
+        record = make_record()
+        assert UsageRecord.from_line(record.to_line() + "\n") == record
+
+    def test_line_is_compact(self):
+        assert len(make_record().to_line()) < 100
+
+
+class TestUsageLedger:
+    def test_record_appends_and_tracks_totals(self, tmp_path):
+        ledger = UsageLedger(tmp_path / "usage.tsv", session="s1")
+        ledger.record("plan", "groq", "groq/m", 300, 400, cost=0.002)
+        ledger.record("explain", "groq", "groq/m", 100, 80, 50, cost=0.001)
+
+        assert ledger.totals.calls == 2
+        assert ledger.totals.total_tokens == 880
+        assert ledger.operations["explain"].cached_tokens == 50
+        assert len((tmp_path / "usage.tsv").read_text().splitlines()) == 2
+        assert [r.operation for r in ledger.records()] == ["plan", "explain"]
+
+    def test_in_memory_ledger_writes_nothing(self):
+        ledger = UsageLedger()
+        ledger.record("plan", "groq", "groq/m", 1, 1, cost=0.0)
+        assert ledger.totals.calls == 1
+        assert list(ledger.records()) == []
+
+    def test_unknown_model_costs_nothing(self):
+        record = UsageLedger().record("plan", "ollama", "ollama/unknown-model", 10, 10)
+        assert record.cost == 0.0
+
+    def test_skips_malformed_lines(self, tmp_path):
+        path = tmp_path / "usage.tsv"
+        path.write_text("garbage\n" + make_record().to_line() + "\npartial\t")
+        assert len(list(UsageLedger(path).records())) == 1
+
+    def test_report_names_dominant_operation(self):
+        ledger = UsageLedger()
+        ledger.record("plan", "groq", "groq/m", 100, 0, cost=0.01)
+        ledger.record("explain", "groq", "groq/m", 250, 50, cost=0.02)
+        report = ledger.report()
+        assert "400" in report
+        assert "$0.0300" in report
+        assert "explain 75%" in report
+
+
+class TestRollup:
+    def test_groups_by_keys(self):
+        records = [
+            make_record(operation="plan"),
+            make_record(operation="explain"),
+            make_record(operation="explain", provider="gemini"),
+        ]
+        groups = rollup(records, by=["provider", "operation"])
+        assert list(groups) == [
+            ("gemini", "explain"),
+            ("groq", "explain"),
+            ("groq", "plan"),
+        ]
+        assert groups[("groq", "plan")].calls == 1
+
+    def test_unknown_key(self):
+        with pytest.raises(ValueError, match="Unknown rollup key"):
+            rollup([], by=["weather"])
+
+    def test_since_filters_old_days(self, tmp_path):
+        path = tmp_path / "usage.tsv"
+        old = make_record(timestamp=1_000_000_000.0)
+        path.write_text(old.to_line() + "\n")
+        ledger = UsageLedger(path)
+        ledger.record("plan", "groq", "groq/m", 1, 1, cost=0.0)
+        groups = ledger.rollup(by=["operation"], since=date.today())
+        assert groups[("plan",)].calls == 1
+        assert len(groups) == 1
+
+
+class TestTutorLedger:
+    @pytest.mark.asyncio
+    async def test_records_plan_usage(
+        self, provider_config_groq, mock_litellm_response, monkeypatch
+    ):
+        monkeypatch.setenv("GROQ_API_KEY", "test_key")
+        mock_litellm_response.usage = usage(500, 200, 128)
+        ledger = UsageLedger()
+        with patch(
+            "groqmate.core.tutor.acompletion",
+            new_callable=AsyncMock,
+            return_value=mock_litellm_response,
+        ):
+            tutor = Tutor(provider_config_groq, ledger=ledger)
+            await tutor.generate_plan("Recursion")
+
+        plan = ledger.operations["plan"]
+        assert (plan.prompt_tokens, plan.completion_tokens, plan.cached_tokens) == (
+            500,
+            200,
+            128,
+        )
+
+    @pytest.mark.asyncio
+    async def test_stream_requests_and_reads_final_usage(
+        self, session, provider_config_groq, mock_streaming_chunks, monkeypatch
+    ):
+        monkeypatch.setenv("GROQ_API_KEY", "test_key")
+        final = SimpleNamespace(choices=[], usage=usage(90, 3))
+
+        async def stream(*args, **kwargs):
+            for chunk in [*mock_streaming_chunks, final]:
+                yield chunk
+
+        ledger = UsageLedger()
+        with patch("groqmate.core.tutor.acompletion", return_value=stream()) as mock:
+            tutor = Tutor(provider_config_groq, ledger=ledger)
+            text = "".join([t async for t in tutor.explain_step_stream(session)])
+
+        assert text == "Hello World"
+        assert mock.call_args[1]["stream_options"] == {"include_usage": True}
+        assert ledger.operations["explain"].prompt_tokens == 90
+        assert ledger.operations["explain"].completion_tokens == 3
+
+    @pytest.mark.asyncio
+    async def test_stream_without_usage_is_estimated(
+        self, session, provider_config_groq, mock_streaming_chunks, monkeypatch
+    ):
+        monkeypatch.setenv("GROQ_API_KEY", "test_key")
+
+        async def stream(*args, **kwargs):
+            for chunk in mock_streaming_chunks:
+                yield chunk
+
+        ledger = UsageLedger()
+        with patch("groqmate.core.tutor.acompletion", return_value=stream()):
+            tutor = Tutor(provider_config_groq, ledger=ledger)
+            async for _ in tutor.rephrase_stream(session):
+                pass
+
+        rephrase = ledger.operations["rephrase"]
+        assert rephrase.prompt_tokens > 0
+        assert rephrase.completion_tokens == 2
+
+
+class TestUsageCommand:
+    def test_prints_rollup_table(self, tmp_path, capsys):
+        path = tmp_path / "usage.tsv"
+        ledger = UsageLedger(path)
+        ledger.record("plan", "groq", "groq/m", 1200, 300, cost=0.5)
+        ledger.record("explain", "groq", "groq/m", 100, 50, cost=0.25)
+
+        assert usage_command(["--ledger", str(path), "--by", "operation"]) == 0
+        out = capsys.readouterr().out.splitlines()
+        assert out[0].split()[:2] == ["operation", "calls"]
+        assert out[2].split()[:3] == ["plan", "1", "1,200"]
+
+    def test_empty_ledger(self, tmp_path, capsys):
+        assert usage_command(["--ledger", str(tmp_path / "none.tsv")]) == 0
+        assert "No usage" in capsys.readouterr().out
+
+    def test_bad_key(self, tmp_path, capsys):
+        path = tmp_path / "usage.tsv"
+        assert usage_command(["--ledger", str(path), "--by", "nope"]) == 2
+        assert "Unknown rollup key" in capsys.readouterr().err
+
+    def test_days_window(self, tmp_path, capsys):
+        path = tmp_path / "usage.tsv"
+        stale = date.today() - timedelta(days=10)
+        old = make_record(timestamp=time.mktime(stale.timetuple()))
+        path.write_text(old.to_line() + "\n")
+        assert usage_command(["--ledger", str(path), "--days", "7"]) == 0
+        assert "No usage" in capsys.readouterr().out
@@ -0,0 +1,145 @@
+import subprocess
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from groqmate.interfaces.cli.app import GroqmateApp
+from groqmate.interfaces.cli.commands import SUBCOMMANDS
+from groqmate.interfaces.cli.main import SUBCOMMAND_NAMES, run
+
+
+@pytest.fixture(autouse=True)
+def no_worker_process():
+    with patch("groqmate.interfaces.cli.executor.start") as start:
+        yield start
+
+
+class TestRunFunction:
+    def test_run_creates_app_with_default_provider(self):
+        with patch("argparse.ArgumentParser.parse_args") as mock_args:
+            mock_args.return_value = MagicMock(
+                provider=None, provider_flag=None, model=None, list_providers=False
+            )
+            with patch.object(GroqmateApp, "run"):
+                run()
+
+    def test_run_with_positional_provider(self):
+        with patch("argparse.ArgumentParser.parse_args") as mock_args:
+            mock_args.return_value = MagicMock(
+                provider="gemini", provider_flag=None, model=None, list_providers=False
+            )
+            with patch.object(GroqmateApp, "run"):
+                run()
+
+    def test_run_with_provider_flag(self):
+        with patch("argparse.ArgumentParser.parse_args") as mock_args:
+            mock_args.return_value = MagicMock(
+                provider=None, provider_flag="openai", model=None, list_providers=False
+            )
+            with patch.object(GroqmateApp, "run"):
+                run()
+
+    def test_run_with_custom_model(self):
+        with patch("argparse.ArgumentParser.parse_args") as mock_args:
+            mock_args.return_value = MagicMock(
+                provider=None,
+                provider_flag=None,
+                model="custom-model",
+                list_providers=False,
+            )
+            with patch.object(GroqmateApp, "run"):
+                run()
+
+    def test_run_with_provider_model_syntax(self):
+        with patch("argparse.ArgumentParser.parse_args") as mock_args:
+            mock_args.return_value = MagicMock(
+                provider="groq/llama-3.1-8b",
+                provider_flag=None,
+                model=None,
+                list_providers=False,
+            )
+            with patch.object(GroqmateApp, "run"):
+                run()
+
+    def test_run_dispatches_subcommand(self):
+        with patch.dict(
+            "groqmate.interfaces.cli.commands.SUBCOMMANDS",
+            {"compile": MagicMock(return_value=0)},
+        ) as commands:
+            with pytest.raises(SystemExit) as exc:
+                run(["compile", "topics.txt"])
+            assert exc.value.code == 0
+            commands["compile"].assert_called_once_with(["topics.txt"])
+
+    def test_list_providers_exits(self):
+        with patch("argparse.ArgumentParser.parse_args") as mock_args:
+            mock_args.return_value = MagicMock(
+                provider=None, provider_flag=None, model=None, list_providers=True
+            )
+            # show_providers_and_exit calls sys.exit, which would terminate pytest
+            # So we just verify the args are correctly parsed
+            args = mock_args.return_value
+            assert args.list_providers is True
+
+    def test_run_with_all_providers(self):
+        providers = [
+            "groq",
+            "gemini",
+            "openai",
+            "deepseek",
+            "openrouter",
+            "ollama",
+            "anthropic",
+            "mistral",
+        ]
+        for provider in providers:
+            with patch("argparse.ArgumentParser.parse_args") as mock_args:
+                mock_args.return_value = MagicMock(
+                    provider=provider,
+                    provider_flag=None,
+                    model=None,
+                    list_providers=False,
+                )
+                with patch.object(GroqmateApp, "run"):
+                    run()
+
+    def test_run_starts_worker_process(self, no_worker_process):
+        with patch.object(GroqmateApp, "run"):
+            run([])
+        no_worker_process.assert_called_once()
+
+    def test_subcommand_names_match_commands(self):
+        assert set(SUBCOMMAND_NAMES) == set(SUBCOMMANDS)
+
+
+HEAVY_MODULES = ("litellm", "textual", "rich")
+
+
+def imported_by(code):
+    # A fresh interpreter, since this one already has everything loaded.
+    script = f"import sys; {code}; print(' '.join(sys.modules))"
+    out = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    return {name.split(".")[0] for name in out.stdout.split()}
+
+
+class TestColdStart:
+    def test_cli_entry_point_skips_heavy_imports(self):
+        loaded = imported_by("import groqmate.interfaces.cli.main")
+        assert loaded.isdisjoint(HEAVY_MODULES)
+
+    def test_tutor_loads_litellm_lazily(self):
+        assert "litellm" not in imported_by("import groqmate.core.tutor")
+
+    def test_grading_loads_numpy_lazily(self):
+        assert "numpy" not in imported_by("import groqmate.core.tutor")
+
+    def test_list_providers_skips_heavy_imports(self):
+        script = (
+            "from groqmate.interfaces.cli.main import run\n"
+            "try:\n    run(['--list-providers'])\nexcept SystemExit:\n    pass"
+        )
+        loaded = imported_by(f"exec({script!r})")
+        assert loaded.isdisjoint(HEAVY_MODULES)
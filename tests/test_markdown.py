@@ -0,0 +1,186 @@
+import pytest
+from textual.app import App
+
+from groqmate.interfaces.cli import widgets
+from groqmate.interfaces.cli.markdown import (
+    MarkdownBlocks,
+    layout_blocks,
+    render_block,
+    render_lines,
+)
+from groqmate.interfaces.cli.widgets import ChatLog, ChatMessage
+
+EXPLANATION = """**Recursion** is a function calling *itself*.
+
+Think of it like this:
++---+
+| 1 |--> smaller
++---+
+
+```python
+def fact(n):
+
+    return 1 if n == 0 else n * fact(n - 1)
+```
+- base case
+- recursive step
+
+Quiz: What stops the recursion?"""
+
+
+def feed(text, size):
+    blocks = MarkdownBlocks()
+    for i in range(0, len(text), size):
+        blocks.feed(text[i : i + size])
+    return blocks
+
+
+class TestMarkdownBlocks:
+    def test_splits_on_blank_lines(self):
+        blocks = feed("one\ntwo\n\nthree\n\n", 100)
+        assert blocks.blocks == ["one\ntwo", "three"]
+        assert blocks.open_block == ""
+
+    def test_fence_is_one_block_across_blank_lines(self):
+        blocks = feed(EXPLANATION, 100)
+        fence = [b for b in blocks.blocks if b.startswith("```")]
+        assert len(fence) == 1
+        assert "\n\n" in fence[0]
+        assert fence[0].endswith("```")
+
+    def test_fence_closes_block_without_blank_line(self):
+        blocks = feed(EXPLANATION, 100)
+        assert blocks.blocks[-1] == "- base case\n- recursive step"
+        assert blocks.open_block == "Quiz: What stops the recursion?"
+
+    def test_token_size_does_not_matter(self):
+        whole = feed(EXPLANATION, len(EXPLANATION))
+        for size in (1, 3, 7):
+            streamed = feed(EXPLANATION, size)
+            assert streamed.blocks == whole.blocks
+            assert streamed.open_block == whole.open_block
+
+    def test_unclosed_fence_stays_open(self):
+        blocks = feed("```\ncode\n\nmore", 100)
+        assert blocks.blocks == []
+        assert blocks.open_block == "```\ncode\n\nmore"
+
+
+class TestRenderMarkdown:
+    def test_keeps_line_breaks(self):
+        lines = [l.plain for l in render_lines("+---+\n| 1 |\n+---+", 40)]
+        assert lines == ["+---+", "| 1 |", "+---+"]
+
+    def test_inline_styles(self):
+        (line,) = render_lines("**bold** and `code`", 40)
+        assert line.plain == "bold and code"
+        assert any("bold" in str(span.style) for span in line.spans)
+
+    def test_code_block_is_highlighted(self):
+        lines = render_lines("```python\nx = 1\n```", 40)
+        assert any(span.style.bgcolor for line in lines for span in line.spans)
+
+    def test_no_trailing_padding_outside_code(self):
+        (line,) = render_lines("short", 40)
+        assert line.plain == "short"
+
+    def test_blocks_are_cached_per_width(self):
+        render_block.cache_clear()
+        first = render_block("cached paragraph", 40)
+        assert render_block("cached paragraph", 40) is first
+        assert render_block("cached paragraph", 30) is not first
+        assert render_block.cache_info().hits == 1
+
+    def test_blocks_share_one_parser(self, monkeypatch):
+        def no_new_parsers(*args, **kwargs):
+            raise AssertionError("built a MarkdownIt parser")
+
+        monkeypatch.setattr("rich.markdown.MarkdownIt", no_new_parsers)
+        (line,) = render_lines("*shared* parser", 40)
+        assert line.plain == "shared parser"
+
+    def test_layout_blocks_matches_render_block(self):
+        blocks = ["# Title", "some *text*", "- a\n- b"]
+        assert layout_blocks(blocks, 40) == [render_block(b, 40) for b in blocks]
+
+
+class TestMarkdownMessage:
+    def test_streamed_matches_whole(self):
+        whole = ChatMessage("Groqmate", EXPLANATION).render()
+        streamed = ChatMessage("Groqmate")
+        for i in range(0, len(EXPLANATION), 4):
+            streamed.append_content(EXPLANATION[i : i + 4])
+            streamed.render()
+        rendered = streamed.render()
+        assert rendered.plain == whole.plain
+        assert rendered.spans == whole.spans
+
+    def test_renders_markdown_for_tutor_only(self):
+        assert "**" not in ChatMessage("Groqmate", "**hi**").render().plain
+        assert "**hi**" in ChatMessage("You", "**hi**", is_user=True).render().plain
+        system = ChatMessage("System", "**hi**", is_system=True)
+        assert "**hi**" in system.render().plain
+
+    def test_blocks_separated_and_indented(self):
+        plain = ChatMessage("Groqmate", "first\n\nsecond").render().plain
+        assert plain == "Groqmate: first\n\n          second"
+
+    def test_height_is_line_count(self):
+        msg = ChatMessage("Groqmate", EXPLANATION)
+        height = msg.get_content_height(None, None, 60)
+        assert msg.render().plain.count("\n") == height - 1
+
+    def test_lines_are_indexed_without_joining(self):
+        msg = ChatMessage("Groqmate", is_streaming=True)
+        msg.append_content(EXPLANATION)
+        height = msg.get_content_height(None, None, 80)
+        lines = [msg._markdown_line(y, 80).plain for y in range(height)]
+        assert "\n".join(lines) == msg.render().plain
+        assert msg._markdown_line(height, 80) is None
+
+        done, _ = msg._markdown_lines(80)
+        msg.append_content(" more")
+        assert msg._markdown_lines(80)[0] is done
+
+
+class ChatApp(App):
+    def compose(self):
+        yield ChatLog()
+
+
+class TestOffloadedLayout:
+    @pytest.fixture
+    def offload(self, monkeypatch):
+        jobs = []
+        monkeypatch.setattr(widgets, "started", lambda: True)
+        monkeypatch.setattr(widgets, "submit", lambda *job: jobs.append(job))
+        return jobs
+
+    @pytest.mark.asyncio
+    async def test_large_reply_shows_raw_text_until_laid_out(self, offload):
+        app = ChatApp()
+        async with app.run_test() as pilot:
+            content = "\n\n".join(f"**part {n}** " + "x" * 60 for n in range(20))
+            msg = app.query_one(ChatLog).add_message("Groqmate", content)
+            await pilot.pause()
+            assert "**part 0**" in msg.render().plain
+
+            target, reply, fn, blocks, width = offload[-1]
+            target.post_message(reply(fn(blocks, width)))
+            await pilot.pause()
+            width = msg.content_size.width
+            inline = ChatMessage("Groqmate", content)._markdown_lines(width)
+            assert msg._markdown_lines(width) == inline
+
+    @pytest.mark.asyncio
+    async def test_failed_layout_falls_back_inline(self, offload):
+        app = ChatApp()
+        async with app.run_test() as pilot:
+            content = "\n\n".join(f"**part {n}** " + "x" * 60 for n in range(20))
+            msg = app.query_one(ChatLog).add_message("Groqmate", content)
+            await pilot.pause()
+            target, reply, *_ = offload[-1]
+            target.post_message(reply(None))
+            await pilot.pause()
+            assert "**" not in msg.render().plain
+            assert msg._offload is False
@@ -0,0 +1,137 @@
+from groqmate.core.matching import (
+    CompiledAnswer,
+    compile_answer,
+    normalize,
+    stem,
+    within_distance,
+)
+from groqmate.core.models import LessonStep
+
+
+class TestNormalize:
+    def test_hyphens_split_words(self):
+        assert normalize("base-case") == normalize("base case")
+        assert normalize("x-axis") == normalize("x axis")
+
+    def test_minus_signs_are_tokens(self):
+        assert normalize("n-1") == ("n", "-", "1")
+        assert normalize("-1") == ("-", "1")
+        assert normalize("i-j") == ("i", "-", "j")
+
+    def test_drops_stopwords_and_punctuation(self):
+        assert normalize("The base case!") == normalize("base case")
+
+    def test_strips_accents(self):
+        assert normalize("café") == normalize("cafe")
+
+    def test_number_words(self):
+        assert normalize("three") == normalize("3")
+        assert normalize("2.0") == normalize("2")
+
+    def test_math_symbols(self):
+        assert normalize("x ≤ 5") == normalize("x <= 5")
+        assert normalize("π") == normalize("pi")
+
+    def test_big_o_names(self):
+        assert normalize("O(n)") == normalize("linear")
+        assert normalize("O(n log n)") == normalize("linearithmic")
+        assert normalize("O(n²)") == normalize("quadratic")
+        assert normalize("o( 1 )") == normalize("constant")
+
+
+class TestStem:
+    def test_plural(self):
+        assert stem("loops") == stem("loop")
+        assert stem("cases") == stem("case")
+
+    def test_verb_forms(self):
+        assert stem("running") == stem("run")
+        assert stem("stopped") == stem("stop")
+
+    def test_short_words_untouched(self):
+        assert stem("is") == "is"
+
+
+class TestWithinDistance:
+    def test_exact(self):
+        assert within_distance("stack", "stack", 0)
+
+    def test_one_edit(self):
+        assert within_distance("stack", "stak", 1)
+        assert not within_distance("stack", "stak", 0)
+
+    def test_length_gap_short_circuits(self):
+        assert not within_distance("a", "abcdef", 2)
+
+
+class TestCompiledAnswer:
+    def test_exact_answer(self):
+        assert CompiledAnswer("base case").check("base case").correct
+
+    def test_hyphenated_and_joined_forms(self):
+        answer = CompiledAnswer("base case")
+        assert answer.check("base-case").correct
+        assert answer.check("basecase").correct
+
+    def test_rejects_substring_nonsense(self):
+        answer = CompiledAnswer("base case")
+        assert not answer.check("e").correct
+        assert not answer.check("se ca").correct
+
+    def test_partial_answer_is_not_accepted(self):
+        answer = CompiledAnswer("base case")
+        assert not answer.check("base").correct
+        assert not answer.check("case").correct
+        assert answer.check("case").score == 0.5
+
+    def test_typo_tolerated(self):
+        assert CompiledAnswer("stack overflow").check("stak overflow").correct
+
+    def test_short_words_need_exact_match(self):
+        assert not CompiledAnswer("heap").check("help").correct
+
+    def test_complexity_equivalence(self):
+        assert CompiledAnswer("O(n)").check("linear").correct
+        assert CompiledAnswer("linear time").check("O(n) time").correct
+
+    def test_minus_is_kept(self):
+        assert CompiledAnswer("n-1").check("n - 1").correct
+        assert not CompiledAnswer("n-1").check("n+1").correct
+        assert not CompiledAnswer("-1").check("1").correct
+
+    def test_none_is_not_zero(self):
+        assert not CompiledAnswer("return None").check("return 0").correct
+
+    def test_negated_word_is_not_a_typo(self):
+        result = CompiledAnswer("synchronous").check("asynchronous")
+        assert result.correct is False
+        assert result.score == 0.0
+        assert not CompiledAnswer("mutable").check("immutable").correct
+
+    def test_operators_must_match(self):
+        assert not CompiledAnswer("x > 0").check("x < 0").correct
+        assert not CompiledAnswer("i <= n").check("i < n").correct
+        assert CompiledAnswer("i <= n").check("i ≤ n").correct
+
+    def test_synonyms(self):
+        answer = CompiledAnswer("stack", ["call stack", "LIFO"])
+        assert answer.check("lifo").correct
+
+    def test_wrong_answer_scores_zero(self):
+        result = CompiledAnswer("stack").check("queue")
+        assert result.correct is False
+        assert result.score == 0.0
+
+    def test_empty_answer(self):
+        assert CompiledAnswer("stack").check("   ").score == 0.0
+
+    def test_compile_answer_uses_accepted_answers(self):
+        step = LessonStep(
+            index=0,
+            title="T",
+            concept="C",
+            quiz_question="Q?",
+            quiz_answer="infinite loop",
+            accepted_answers=["never terminates"],
+        )
+        assert compile_answer(step).check("it never terminates").correct
@@ -1,5 +1,14 @@
 import pytest
-from groqmate.core.models import SessionStatus, LessonStep, LessonPlan, SessionState
+from groqmate.core.models import (
+    SessionStatus,
+    LessonStep,
+    LessonPlan,
+    SessionState,
+    CompactPlan,
+    CompactState,
+    CompactStep,
+    as_compact,
+)
 from pydantic import ValidationError
 
 
@@ -104,3 +113,92 @@ class TestSessionStatus:
     def test_status_can_be_used_in_dict(self):
         d = {SessionStatus.IDLE: "waiting", SessionStatus.TEACHING: "active"}
         assert d[SessionStatus.IDLE] == "waiting"
+
+
+class TestCompactPlan:
+    def test_from_model_round_trip(self, sample_plan):
+        compact = CompactPlan.from_model(sample_plan)
+        assert compact.total_steps == 5
+        assert compact.steps[0].quiz_answer == "base case"
+        assert compact.to_model() == sample_plan
+
+    def test_json_matches_pydantic(self, sample_plan):
+        compact = CompactPlan.from_model(sample_plan)
+        assert compact.to_json() == sample_plan.model_dump_json()
+        assert CompactPlan.from_json(sample_plan.model_dump_json()) == compact
+
+    def test_accepted_answers_are_tuples(self):
+        step = LessonStep(
+            index=0,
+            title="T",
+            concept="C",
+            quiz_question="Q?",
+            quiz_answer="a",
+            accepted_answers=["b", "c"],
+        )
+        assert CompactStep.from_model(step).accepted_answers == ("b", "c")
+
+    def test_missing_accepted_answers_default_empty(self):
+        plan = CompactPlan.from_json(
+            '{"topic": "T", "steps": [{"index": 0, "title": "T", "concept": "C",'
+            ' "quiz_question": "Q?", "quiz_answer": "a"}]}'
+        )
+        assert plan.steps[0].accepted_answers == ()
+
+    def test_malformed_json_raises_value_error(self):
+        with pytest.raises(ValueError, match="Malformed"):
+            CompactPlan.from_json('{"steps": []}')
+
+    def test_validate_json_rejects_type_mismatch(self):
+        with pytest.raises(ValueError, match="Malformed lesson plan"):
+            CompactPlan.validate_json(
+                '{"topic": "T", "steps": [{"index": "first", "title": "T",'
+                ' "concept": "C", "quiz_question": "Q?", "quiz_answer": "a"}]}'
+            )
+
+    def test_validate_json_matches_from_json(self, sample_plan):
+        payload = sample_plan.model_dump_json()
+        assert CompactPlan.validate_json(payload) == CompactPlan.from_json(payload)
+
+    def test_from_dict_builds_compact_steps(self, sample_plan):
+        plan = CompactPlan.from_dict(sample_plan.model_dump())
+        assert isinstance(plan.steps[0], CompactStep)
+        assert plan == CompactPlan.from_model(sample_plan)
+
+    def test_as_compact_is_identity_for_compact(self, sample_plan):
+        compact = as_compact(sample_plan)
+        assert as_compact(compact) is compact
+
+    def test_is_immutable_and_hashable(self, sample_plan):
+        compact = CompactPlan.from_model(sample_plan)
+        with pytest.raises(AttributeError):
+            compact.topic = "Other"
+        assert hash(compact) == hash(CompactPlan.from_model(sample_plan))
+
+
+class TestCompactState:
+    def test_has_no_instance_dict(self):
+        assert not hasattr(CompactState(), "__dict__")
+
+    def test_model_round_trip(self, sample_plan):
+        state = SessionState(
+            plan=sample_plan,
+            current_step=2,
+            completed=[0, 1],
+            status=SessionStatus.QUIZ,
+        )
+        compact = CompactState.from_model(state)
+        assert compact.plan.topic == "Recursion"
+        assert compact.to_model() == state
+
+    def test_dict_round_trip(self, sample_plan):
+        state = CompactState(CompactPlan.from_model(sample_plan), 1, [0])
+        assert CompactState.from_dict(state.to_dict()) == state
+
+    def test_validate_round_trip(self, sample_plan):
+        state = CompactState(CompactPlan.from_model(sample_plan), 1, [0])
+        assert CompactState.validate(state.to_dict()) == state
+
+    def test_validate_rejects_malformed_state(self):
+        with pytest.raises(ValueError, match="Malformed session state"):
+            CompactState.validate({"current_step": "two", "status": "dancing"})
@@ -0,0 +1,154 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from groqmate.core.packs import LessonPack, LessonPackWriter, PackTutor
+from groqmate.core.models import LessonPlan
+from groqmate.core.state import Session
+
+
+@pytest.fixture
+def pack_path(tmp_path, sample_plan):
+    path = tmp_path / "lessons.gmpack"
+    with LessonPackWriter(path) as writer:
+        writer.add_lesson(
+            sample_plan,
+            explanations={0: "Recursion is a function calling itself.\nQuiz: ?"},
+            analogies={0: ["Like nested dolls.", "Like two mirrors."]},
+            summary="# Recursion\n\n- base case",
+            topic="teach me recursion in python",
+        )
+    return path
+
+
+@pytest.fixture
+def pack(pack_path):
+    pack = LessonPack(pack_path)
+    yield pack
+    pack.close()
+
+
+async def collect(stream):
+    return "".join([token async for token in stream])
+
+
+class TestLessonPackWriter:
+    def test_topics_lists_aliases(self, pack_path):
+        with LessonPackWriter(pack_path) as writer:
+            assert writer.topics() == {"recursion", "recursion python"}
+
+    def test_readding_lesson_replaces_texts(self, pack_path, sample_plan):
+        with LessonPackWriter(pack_path) as writer:
+            writer.add_lesson(sample_plan, explanations={0: "Updated."})
+
+        pack = LessonPack(pack_path)
+        assert pack.explanation(sample_plan, sample_plan.steps[0]) == "Updated."
+        assert pack.analogy(sample_plan, sample_plan.steps[0]) is None
+        pack.close()
+
+
+class TestLessonPack:
+    def test_missing_pack_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            LessonPack(tmp_path / "missing.gmpack")
+
+    def test_len_counts_plans(self, pack):
+        assert len(pack) == 1
+
+    def test_find_plan_fuzzy(self, pack):
+        plan = pack.find_plan("teach me recursion!")
+        assert plan is not None
+        assert plan.total_steps == 5
+
+    def test_find_plan_miss(self, pack):
+        assert pack.find_plan("binary search") is None
+
+    def test_explanation_requires_matching_step(self, pack, sample_plan):
+        other = sample_plan.model_copy(deep=True)
+        other.steps[0].title = "Something else"
+        assert pack.explanation(other, other.steps[0]) is None
+
+    def test_analogies_rotate(self, pack, sample_plan):
+        step = sample_plan.steps[0]
+        assert pack.analogy(sample_plan, step) == "Like nested dolls."
+        assert pack.analogy(sample_plan, step) == "Like two mirrors."
+        assert pack.analogy(sample_plan, step) == "Like nested dolls."
+
+    def test_pack_is_read_only(self, pack):
+        with pytest.raises(Exception):
+            pack._db.execute("DELETE FROM plans")
+
+
+class TestPackTutor:
+    @pytest.mark.asyncio
+    async def test_serves_plan_without_fallback(self, pack):
+        tutor = PackTutor(pack)
+        plan = await tutor.generate_plan("recursion")
+        assert plan.topic == "Recursion"
+
+    @pytest.mark.asyncio
+    async def test_plan_miss_without_fallback_raises(self, pack):
+        tutor = PackTutor(pack)
+        with pytest.raises(ValueError, match="not in the lesson pack"):
+            await tutor.generate_plan("binary search")
+
+    @pytest.mark.asyncio
+    async def test_plan_miss_uses_fallback(self, pack):
+        fallback = MagicMock()
+        fallback.generate_plan = AsyncMock(return_value=LessonPlan(topic="Search"))
+        tutor = PackTutor(pack, fallback=fallback)
+        plan = await tutor.generate_plan("binary search")
+        assert plan.topic == "Search"
+        fallback.generate_plan.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_streams_cached_explanation(self, pack, session):
+        tutor = PackTutor(pack)
+        text = await collect(tutor.explain_step_stream(session))
+        assert text == "Recursion is a function calling itself.\nQuiz: ?"
+
+    @pytest.mark.asyncio
+    async def test_explanation_miss_builds_offline_text(self, pack, session):
+        session.advance()
+        tutor = PackTutor(pack)
+        text = await collect(tutor.explain_step_stream(session))
+        assert "The condition that stops recursion." in text
+        assert "Quiz: What happens without a base case?" in text
+
+    @pytest.mark.asyncio
+    async def test_explanation_miss_uses_fallback(self, pack, session):
+        async def live(session):
+            yield "live"
+
+        fallback = MagicMock()
+        fallback.explain_step_stream = live
+        session.advance()
+        tutor = PackTutor(pack, fallback=fallback)
+        assert await collect(tutor.explain_step_stream(session)) == "live"
+
+    @pytest.mark.asyncio
+    async def test_rephrase_from_pack(self, pack, session):
+        tutor = PackTutor(pack)
+        assert await collect(tutor.rephrase_stream(session)) == "Like nested dolls."
+
+    @pytest.mark.asyncio
+    async def test_summary_from_pack(self, pack, session):
+        tutor = PackTutor(pack)
+        assert await tutor.generate_summary(session) == "# Recursion\n\n- base case"
+
+    @pytest.mark.asyncio
+    async def test_summary_offline_from_plan(self, tmp_path, sample_plan):
+        path = tmp_path / "bare.gmpack"
+        with LessonPackWriter(path) as writer:
+            writer.add_lesson(sample_plan)
+        session = Session()
+        session.load_plan(sample_plan)
+
+        tutor = PackTutor(LessonPack(path))
+        summary = await tutor.generate_summary(session)
+        assert summary.startswith("# Recursion")
+        assert "## 2. Base Case" in summary
+
+    @pytest.mark.asyncio
+    async def test_check_answer_offline(self, pack, session):
+        tutor = PackTutor(pack)
+        correct, _ = await tutor.check_answer("base case", session)
+        assert correct is True
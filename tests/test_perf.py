@@ -0,0 +1,90 @@
+from groqmate.interfaces.cli.perf import (
+    LagMonitor,
+    StreamStats,
+    cache_hit_rate,
+    hud_text,
+)
+from groqmate.interfaces.cli.markdown import render_block
+
+
+class TestStreamStats:
+    def test_empty_stats(self):
+        stats = StreamStats()
+        assert stats.ttft() is None
+        assert stats.tokens_per_sec() is None
+        assert stats.fps() is None
+
+    def test_measures_last_stream(self):
+        stats = StreamStats()
+        stats.start(now=10.0)
+        stats.token(now=10.5)
+        for _ in range(10):
+            stats.token(now=11.0)
+            stats.frame()
+        stats.end(now=12.5)
+        assert stats.ttft() == 0.5
+        assert stats.tokens_per_sec() == 10 / 2.0
+        assert stats.fps() == 10 / 2.0
+
+    def test_start_resets(self):
+        stats = StreamStats()
+        stats.start(now=0.0)
+        stats.token(now=1.0)
+        stats.end(now=2.0)
+        stats.start(now=5.0)
+        assert stats.ttft() is None
+        assert stats.tokens == 0
+
+    def test_ignores_tokens_before_start(self):
+        stats = StreamStats()
+        stats.token(now=1.0)
+        stats.frame()
+        assert stats.tokens == 0
+        assert stats.frames == 0
+
+
+class TestLagMonitor:
+    def test_reports_late_ticks(self):
+        monitor = LagMonitor(interval=0.1, window=4)
+        assert monitor.lag is None
+        monitor.tick(now=0.0)
+        monitor.tick(now=0.1)
+        monitor.tick(now=0.45)
+        assert round(monitor.lag, 3) == 0.25
+
+    def test_window_forgets_old_stalls(self):
+        monitor = LagMonitor(interval=0.1, window=2)
+        for now in (0.0, 1.0, 1.1, 1.2):
+            monitor.tick(now=now)
+        assert round(monitor.lag, 3) == 0.0
+
+    def test_reset(self):
+        monitor = LagMonitor()
+        monitor.tick(now=0.0)
+        monitor.tick(now=1.0)
+        monitor.reset()
+        assert monitor.lag is None
+
+
+class TestHud:
+    def test_cache_hit_rate(self):
+        render_block.cache_clear()
+        assert cache_hit_rate() is None
+        render_block("hit me", 40)
+        render_block("hit me", 40)
+        assert cache_hit_rate() == 0.5
+
+    def test_hud_text(self):
+        stats = StreamStats()
+        stats.start(now=0.0)
+        stats.token(now=0.25)
+        text = hud_text(stats, 0.012, 0.9)
+        assert "TTFT 250ms" in text
+        assert "- tok/s" in text
+        assert "lag 12ms" in text
+        assert "cache 90%" in text
+
+    def test_hud_text_without_data(self):
+        text = hud_text(StreamStats(), None, None)
+        assert text.startswith("TTFT -")
+        assert "cache -" in text
@@ -0,0 +1,123 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, patch
+from groqmate.core.config import Config
+from groqmate.core.pool import TutorPool
+from groqmate.core.providers import Provider, ProviderConfig
+
+
+@pytest.fixture
+def config(monkeypatch):
+    # Tutor exports its key to the environment; let monkeypatch undo that.
+    monkeypatch.setenv("GROQ_API_KEY", "env-groq")
+    monkeypatch.setenv("OPENAI_API_KEY", "env-openai")
+    config = Config()
+    config.set_api_key("groq", "gsk-one")
+    config.set_api_key("openai", "sk-one")
+    return config
+
+
+GROQ = ProviderConfig(provider=Provider.GROQ)
+OPENAI = ProviderConfig(provider=Provider.OPENAI)
+
+
+class TestTutorPool:
+    def test_reuses_tutor_per_provider(self, config):
+        pool = TutorPool(idle_timeout=60)
+        groq = pool.get(GROQ, config, now=0)
+        openai = pool.get(OPENAI, config, now=1)
+        assert openai is not groq
+        assert pool.get(GROQ, config, now=2) is groq
+        assert len(pool) == 2
+
+    def test_model_and_key_are_part_of_the_key(self, config):
+        pool = TutorPool()
+        groq = pool.get(GROQ, config)
+        other_model = ProviderConfig(
+            provider=Provider.GROQ, model="llama-3.1-8b-instant"
+        )
+        assert pool.get(other_model, config) is not groq
+
+        config.set_api_key("groq", "gsk-two")
+        rotated = pool.get(GROQ, config)
+        assert rotated is not groq
+        assert rotated.api_key == "gsk-two"
+
+    def test_reused_tutor_sees_new_settings(self, config):
+        pool = TutorPool()
+        tutor = pool.get(GROQ, config)
+        updated = config.model_copy(deep=True)
+        updated.settings.llm_grading = False
+        assert pool.get(GROQ, updated) is tutor
+        assert tutor.config.settings.llm_grading is False
+
+    def test_evicts_idle_but_not_current(self, config):
+        pool = TutorPool(idle_timeout=60)
+        pool.get(GROQ, config, now=0)
+        openai = pool.get(OPENAI, config, now=10)
+        assert pool.evict_idle(now=65) == 1
+        assert len(pool) == 1
+        assert pool.evict_idle(now=1000) == 0
+        assert pool.get(OPENAI, config, now=1001) is openai
+
+    def test_shares_ledger(self, config):
+        pool = TutorPool()
+        assert pool.get(GROQ, config).ledger is pool.get(OPENAI, config).ledger
+
+    def test_missing_key_raises(self, config, monkeypatch):
+        monkeypatch.delenv("GROQ_API_KEY")
+        config.set_api_key("groq", "")
+        with pytest.raises(ValueError, match="No API key"):
+            TutorPool().get(GROQ, config)
+
+    @pytest.mark.asyncio
+    async def test_pooled_tutor_keeps_its_own_key(self, config, mock_litellm_response):
+        pool = TutorPool()
+        first = pool.get(GROQ, config)
+        config.set_api_key("groq", "gsk-two")
+        pool.get(GROQ, config)
+
+        with patch("groqmate.core.tutor.acompletion", new_callable=AsyncMock) as mock:
+            mock.return_value = mock_litellm_response
+            await first.generate_plan("Recursion")
+        assert mock.call_args[1]["api_key"] == "gsk-one"
+
+    def test_tutors_share_request_limiter(self, config):
+        pool = TutorPool(max_requests=2)
+        groq = pool.get(GROQ, config)
+        openai = pool.get(OPENAI, config)
+        assert groq.limiter is pool.limiter
+        assert openai.limiter is pool.limiter
+
+    def test_set_max_requests_replaces_limiter(self, config):
+        pool = TutorPool(max_requests=2)
+        tutor = pool.get(GROQ, config)
+        old = pool.limiter
+        pool.set_max_requests(4)
+        assert pool.limiter is not old
+        assert tutor.limiter is pool.limiter
+
+    @pytest.mark.asyncio
+    async def test_caps_concurrent_requests(self, config, mock_litellm_response):
+        pool = TutorPool(max_requests=2)
+        groq = pool.get(GROQ, config)
+        openai = pool.get(OPENAI, config)
+        active = 0
+        peak = 0
+
+        async def slow_completion(**kwargs):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return mock_litellm_response
+
+        with patch("groqmate.core.tutor.acompletion", side_effect=slow_completion):
+            await asyncio.gather(
+                *(
+                    tutor._complete("plan", model=tutor.model, messages=[])
+                    for tutor in (groq, openai, groq, openai, groq)
+                )
+            )
+        assert peak == 2
@@ -0,0 +1,177 @@
+import pytest
+import sqlite3
+from unittest.mock import MagicMock
+from groqmate.core.models import CompactState
+from groqmate.core.progress import ProgressReader, ProgressStore
+from groqmate.core.state import Session
+from groqmate.interfaces.cli.commands import stats_command
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return tmp_path / "progress.db"
+
+
+@pytest.fixture
+def tracked(db_path):
+    store = ProgressStore(db_path)
+    session = Session()
+    tracker = store.track()
+    session.subscribe(tracker.observe)
+    yield session, tracker
+    store.close()
+
+
+def finish_lesson(session, tracker, wrong_first=()):
+    for step in range(session.state.plan.total_steps):
+        if step in wrong_first:
+            tracker.attempt(False)
+        tracker.attempt(True)
+        session.advance()
+
+
+class TestProgressStore:
+    def test_records_lesson_and_steps(self, tracked, db_path, sample_plan):
+        session, tracker = tracked
+        session.load_plan(sample_plan)
+        finish_lesson(session, tracker, wrong_first={1})
+        tracker.wtf()
+        assert tracker.store.flush()
+
+        [topic] = ProgressReader(db_path).topics()
+        assert (topic.topic, topic.lessons, topic.finished) == ("Recursion", 1, 1)
+        assert (topic.attempts, topic.correct, topic.wtf) == (6, 5, 1)
+
+        steps = ProgressReader(db_path).steps("recursion")
+        assert [s.title for s in steps][:2] == ["Self-Reference", "Base Case"]
+        assert steps[1].attempts_per_pass == 2.0
+        assert steps[4].wtf == 1
+        assert all(s.completed == 1 for s in steps)
+
+    def test_unfinished_lesson(self, tracked, db_path, sample_plan):
+        session, tracker = tracked
+        session.load_plan(sample_plan)
+        session.advance()
+        session.load_plan(sample_plan)
+        tracker.store.flush()
+
+        [topic] = ProgressReader(db_path).topics()
+        assert (topic.lessons, topic.finished) == (2, 0)
+        assert topic.completion_rate == 0.0
+
+    def test_events_without_lesson_are_ignored(self, tracked, db_path):
+        _, tracker = tracked
+        tracker.attempt(True)
+        tracker.wtf()
+        assert tracker.store.flush()
+        assert not db_path.exists()
+
+    def test_back_tracks_step(self, tracked, db_path, sample_plan):
+        session, tracker = tracked
+        session.load_plan(sample_plan)
+        session.advance()
+        session.back()
+        tracker.attempt(False)
+        tracker.store.flush()
+        assert ProgressReader(db_path).steps("Recursion")[0].attempts == 1
+
+    def test_resume_continues_open_lesson(self, tracked, db_path, sample_plan):
+        session, tracker = tracked
+        session.load_plan(sample_plan)
+        session.advance()
+        tracker.store.close()
+
+        state = CompactState.from_dict(session.state.to_dict())
+        resumed = ProgressStore(db_path)
+        tracker = resumed.track()
+        tracker.resume(state)
+        tracker.attempt(True)
+        resumed.close()
+
+        [topic] = ProgressReader(db_path).topics()
+        assert topic.lessons == 1
+        assert ProgressReader(db_path).steps("Recursion")[1].correct == 1
+
+    def test_uses_wal(self, tracked, db_path, sample_plan):
+        session, tracker = tracked
+        session.load_plan(sample_plan)
+        tracker.store.flush()
+        mode = sqlite3.connect(db_path).execute("PRAGMA journal_mode").fetchone()
+        assert mode == ("wal",)
+
+    def test_failed_write_is_reported(self, db_path, sample_plan, monkeypatch):
+        errors = []
+        store = ProgressStore(db_path, on_error=errors.append)
+        monkeypatch.setattr(
+            store, "_write_lesson", MagicMock(side_effect=sqlite3.OperationalError)
+        )
+        session = Session()
+        session.subscribe(store.track().observe)
+        for _ in range(2):
+            session.load_plan(sample_plan)
+            assert store.flush()
+        store.close()
+        assert store.failed == 2
+        assert len(errors) == 1
+        assert isinstance(store.error, sqlite3.OperationalError)
+
+    def test_unopenable_database_is_reported(self, tmp_path, sample_plan):
+        path = tmp_path / "progress.db"
+        path.write_text("not a database")
+        errors = []
+        store = ProgressStore(path, on_error=errors.append)
+        store.track().observe("load_plan", {"plan": sample_plan})
+        store._thread.join(timeout=5)
+        assert isinstance(errors[0], sqlite3.DatabaseError)
+
+    def test_sessions_share_one_writer(self, db_path, sample_plan):
+        store = ProgressStore(db_path)
+        first, second = Session(), Session()
+        first_tracker, second_tracker = store.track(), store.track()
+        first.subscribe(first_tracker.observe)
+        second.subscribe(second_tracker.observe)
+        first.load_plan(sample_plan)
+        second.load_plan(sample_plan)
+        second.advance()
+        first_tracker.attempt(False)
+        second_tracker.attempt(True)
+        store.close()
+
+        [topic] = ProgressReader(db_path).topics()
+        assert topic.lessons == 2
+        steps = ProgressReader(db_path).steps("Recursion")
+        assert (steps[0].attempts, steps[0].correct) == (1, 0)
+        assert (steps[1].attempts, steps[1].correct) == (1, 1)
+
+    def test_missing_database(self, tmp_path):
+        reader = ProgressReader(tmp_path / "none.db")
+        assert reader.topics() == []
+        assert reader.steps("anything") == []
+
+
+class TestStatsCommand:
+    def test_topic_table(self, tracked, db_path, sample_plan, capsys):
+        session, tracker = tracked
+        session.load_plan(sample_plan)
+        finish_lesson(session, tracker)
+        tracker.store.close()
+
+        assert stats_command(["--db", str(db_path)]) == 0
+        out = capsys.readouterr().out.splitlines()
+        assert out[0].split()[:3] == ["topic", "lessons", "finished"]
+        assert out[1].split() == ["Recursion", "1", "1", "100%", "5", "100%", "0"]
+
+    def test_step_table(self, tracked, db_path, sample_plan, capsys):
+        session, tracker = tracked
+        session.load_plan(sample_plan)
+        finish_lesson(session, tracker, wrong_first={0})
+        tracker.store.close()
+
+        assert stats_command(["recursion", "--db", str(db_path)]) == 0
+        out = capsys.readouterr().out.splitlines()
+        assert out[1].split() == ["1", "Self-Reference", "1", "2", "2.0", "0"]
+        assert len(out) == 6
+
+    def test_empty(self, tmp_path, capsys):
+        assert stats_command(["--db", str(tmp_path / "none.db")]) == 0
+        assert "No progress" in capsys.readouterr().out
@@ -48,6 +48,15 @@ class TestProviderConfig:
         config = ProviderConfig(provider=Provider.DEEPSEEK)
         assert config.get_model_string() == "deepseek/deepseek-chat"
 
+    def test_grader_model_string_uses_small_default(self, provider_config_groq):
+        assert (
+            provider_config_groq.get_grader_model_string()
+            == "groq/llama-3.1-8b-instant"
+        )
+
+    def test_grader_model_string_override(self, provider_config_groq):
+        assert provider_config_groq.get_grader_model_string("tiny") == "groq/tiny"
+
     def test_get_env_key_groq(self, provider_config_groq):
         assert provider_config_groq.get_env_key() == "GROQ_API_KEY"
 
@@ -0,0 +1,172 @@
+import pytest
+from groqmate.core.grading import Tier, Verdict
+from groqmate.core.models import CompactStep
+from groqmate.core.review import (
+    DAY,
+    MIN_EASINESS,
+    RELEARN_DELAY,
+    SCHEDULE_ENTRY,
+    ReviewDeck,
+    ReviewSession,
+    Schedule,
+    format_wait,
+    quality,
+    sm2,
+)
+
+NOW = 1_700_000_000.0
+
+
+def make_step(n, answer="base case"):
+    return CompactStep(n, f"Step {n}", "concept", f"Question {n}?", answer, ())
+
+
+@pytest.fixture
+def deck(tmp_path):
+    deck = ReviewDeck(tmp_path)
+    yield deck
+    deck.close()
+
+
+class TestSm2:
+    def test_intervals_grow(self):
+        schedule = Schedule(due=NOW)
+        intervals = []
+        for _ in range(4):
+            schedule = sm2(schedule, 5, NOW)
+            intervals.append(schedule.interval)
+        assert intervals[:2] == [1.0, 6.0]
+        assert intervals[2] > 6.0 * 2.5
+        assert intervals[3] > intervals[2]
+        assert schedule.due == NOW + schedule.interval * DAY
+
+    def test_lapse_resets_repetitions(self):
+        schedule = Schedule(due=NOW, interval=20.0, repetitions=4)
+        lapsed = sm2(schedule, 1, NOW)
+        assert (lapsed.repetitions, lapsed.interval, lapsed.lapses) == (0, 0.0, 1)
+        assert lapsed.due == NOW + RELEARN_DELAY
+        assert lapsed.easiness < schedule.easiness
+
+    def test_easiness_floor(self):
+        schedule = Schedule(due=NOW, easiness=MIN_EASINESS)
+        assert sm2(schedule, 0, NOW).easiness == MIN_EASINESS
+
+    def test_quality_from_verdict(self):
+        assert quality(Verdict(True, 1.0, Tier.LOCAL_ACCEPT)) == 5
+        assert quality(Verdict(True, 0.6, Tier.LOCAL_ACCEPT)) == 4
+        assert quality(Verdict(False, 0.3, Tier.LOCAL_REJECT)) == 2
+        assert quality(Verdict(False, 0.0, Tier.LOCAL_REJECT)) == 1
+        assert quality(None) == 0
+
+    def test_format_wait(self):
+        assert format_wait(RELEARN_DELAY) == "10 min"
+        assert format_wait(3 * 3600) == "3 h"
+        assert format_wait(DAY) == "1 day"
+        assert format_wait(6 * DAY) == "6 days"
+
+
+class TestReviewDeck:
+    def test_add_schedules_first_review_tomorrow(self, deck):
+        card_id = deck.add("Recursion", make_step(0), now=NOW)
+        assert deck.card(card_id).quiz_answer == "base case"
+        assert deck.schedule(card_id).due == NOW + DAY
+        assert deck.next_due(NOW) is None
+        assert deck.next_due(NOW + DAY) == card_id
+
+    def test_add_deduplicates(self, deck):
+        first = deck.add("Recursion", make_step(0), now=NOW)
+        assert deck.add("recursion", make_step(0), now=NOW + 5) == first
+        assert len(deck) == 1
+
+    def test_next_due_is_earliest(self, deck):
+        for n in range(5):
+            deck.add("Recursion", make_step(n), now=NOW - n * 100)
+        assert deck.next_due(NOW + DAY) == 4
+        assert deck.due_count(NOW + DAY - 250) == 2
+
+    def test_rescheduled_card_leaves_the_front(self, deck):
+        deck.add("Recursion", make_step(0), now=NOW)
+        deck.add("Recursion", make_step(1), now=NOW + 10)
+        deck.review(0, 5, now=NOW + DAY)
+        assert deck.next_due(NOW + 2 * DAY) == 1
+        deck.review(1, 5, now=NOW + 2 * DAY)
+        assert deck.next_due(NOW + 2 * DAY) is None
+        assert deck.next_due_at() == NOW + DAY + 6 * DAY
+
+    def test_persists_across_reopen(self, tmp_path, deck):
+        deck.add("Recursion", make_step(0), now=NOW)
+        deck.add("Graphs", make_step(1, "vertex"), now=NOW)
+        deck.review(1, 1, now=NOW)
+        deck.close()
+
+        reopened = ReviewDeck(tmp_path)
+        assert len(reopened) == 2
+        assert reopened.card(1).topic == "Graphs"
+        assert reopened.schedule(1).lapses == 1
+        assert reopened.next_due(NOW + RELEARN_DELAY) == 1
+        reopened.close()
+
+    def test_schedule_is_fixed_width(self, tmp_path, deck):
+        for n in range(3):
+            deck.add("Recursion", make_step(n), now=NOW)
+        size = (tmp_path / "schedule.bin").stat().st_size
+        assert size == 3 * SCHEDULE_ENTRY.size
+
+    def test_missing_schedule_entries_are_due(self, tmp_path, deck):
+        deck.add("Recursion", make_step(0), now=NOW)
+        deck.add("Recursion", make_step(1), now=NOW)
+        deck.close()
+        schedule = tmp_path / "schedule.bin"
+        schedule.write_bytes(schedule.read_bytes()[: SCHEDULE_ENTRY.size + 3])
+
+        reopened = ReviewDeck(tmp_path)
+        assert reopened.next_due(NOW) == 1
+        reopened.close()
+
+    def test_torn_card_line_is_skipped(self, tmp_path, deck):
+        deck.add("Recursion", make_step(0), now=NOW)
+        deck.close()
+        with open(tmp_path / "cards.jsonl", "a") as f:
+            f.write('["Recursion", "Quest')
+
+        reopened = ReviewDeck(tmp_path)
+        assert len(reopened) == 1
+        reopened.add("Recursion", make_step(1), now=NOW)
+        reopened.close()
+        assert len(ReviewDeck(tmp_path)) == 2
+
+
+class TestReviewSession:
+    @pytest.mark.asyncio
+    async def test_grades_locally(self, deck):
+        deck.add("Recursion", make_step(0), now=NOW)
+        review = ReviewSession(deck)
+        card = review.next_card(NOW + DAY)
+        assert card.quiz_question == "Question 0?"
+
+        verdict, schedule = await review.answer("the base case", NOW + DAY)
+        assert verdict.correct
+        assert schedule.interval == 6.0
+        assert review.grader.stats.fraction(Tier.LLM, Tier.CACHE) == 0.0
+        assert review.next_card(NOW + DAY) is None
+        assert review.report() == "Reviewed 1 cards, 1 correct."
+
+    @pytest.mark.asyncio
+    async def test_wrong_answer_comes_back(self, deck):
+        deck.add("Recursion", make_step(0), now=NOW)
+        review = ReviewSession(deck)
+        review.next_card(NOW + DAY)
+        verdict, schedule = await review.answer("no idea", NOW + DAY)
+        assert not verdict.correct
+        assert review.next_card(NOW + DAY + RELEARN_DELAY) is not None
+
+    def test_skip(self, deck):
+        deck.add("Recursion", make_step(0), now=NOW)
+        review = ReviewSession(deck)
+        review.next_card(NOW + DAY)
+        assert review.skip(NOW + DAY).repetitions == 0
+
+    @pytest.mark.asyncio
+    async def test_answer_without_card(self, deck):
+        with pytest.raises(ValueError, match="No card to review"):
+            await ReviewSession(deck).answer("anything")
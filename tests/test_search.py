@@ -0,0 +1,156 @@
+import pytest
+import os
+from groqmate.core.models import CompactPlan
+from groqmate.core.search import SearchIndex, has_phrase, snippet, terms
+from groqmate.core.topics import TopicIndex
+
+
+@pytest.fixture
+def notes(tmp_path):
+    path = tmp_path / "notes"
+    path.mkdir()
+    return path
+
+
+@pytest.fixture
+def index(tmp_path, notes):
+    index = SearchIndex(tmp_path / "search.db", notes, tmp_path / "plans.tsv")
+    yield index
+    index.close()
+
+
+def write_note(notes, name, text):
+    path = notes / name
+    path.write_text(text)
+    return path
+
+
+class TestTerms:
+    def test_stems_and_drops_symbols(self):
+        assert terms("# Sorting **arrays** quickly") == ["sort", "array", "quick"]
+
+    def test_has_phrase(self):
+        assert has_phrase([{3, 9}, {4}, {5}])
+        assert not has_phrase([{3}, {5}])
+
+    def test_snippet_prefers_matching_line(self):
+        body = "# Title\nNothing here\nThe call stack grows"
+        assert snippet(body, {"stack"}) == "The call stack grows"
+        assert snippet(body, {"absent"}) == "# Title"
+
+
+class TestSearchIndex:
+    def test_ranks_by_relevance(self, index, notes):
+        write_note(
+            notes, "stack_notes.md", "# Stacks\nA stack is LIFO. Push onto the stack."
+        )
+        write_note(
+            notes, "queue_notes.md", "# Queues\nA queue is FIFO, unlike a stack."
+        )
+        write_note(notes, "trees_notes.md", "# Trees\nBinary trees have two children.")
+        assert index.refresh() == 3
+
+        hits = index.search("stack")
+        assert [h.title for h in hits] == ["Stacks", "Queues"]
+        assert hits[0].kind == "note"
+        assert hits[0].path.endswith("stack_notes.md")
+        assert "stack" in hits[0].snippet.lower()
+
+    def test_phrase_query(self, index, notes):
+        write_note(notes, "a.md", "the call stack tracks recursive calls")
+        write_note(notes, "b.md", "a stack can call many functions")
+        index.refresh()
+        assert [h.key for h in index.search('"call stack"')] == ["note:a.md"]
+        assert len(index.search("call stack")) == 2
+
+    def test_only_changed_notes_are_reindexed(self, index, notes):
+        write_note(notes, "a.md", "graphs have vertices")
+        path = write_note(notes, "b.md", "heaps are trees")
+        assert index.refresh() == 2
+        assert index.refresh() == 0
+
+        path.write_text("heaps are complete binary trees")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert index.refresh() == 1
+        assert index.search("binary")[0].key == "note:b.md"
+
+    def test_deleted_notes_are_dropped(self, index, notes):
+        path = write_note(notes, "a.md", "graphs have vertices")
+        index.refresh()
+        path.unlink()
+        assert index.refresh() == 1
+        assert index.search("graphs") == []
+        assert len(index) == 0
+
+    def test_indexes_saved_plans_incrementally(self, index, tmp_path, sample_plan):
+        topics = TopicIndex(tmp_path / "plans.tsv")
+        topics.add(sample_plan, topic="recursive functions")
+        assert index.refresh() == 2
+        assert len(index) == 1
+
+        hits = index.search("base case")
+        assert hits[0].kind == "plan"
+        assert hits[0].title == "Recursion"
+
+        other = CompactPlan.from_dict(
+            {"topic": "Hash Maps", "steps": [sample_plan.steps[0].model_dump()]}
+        )
+        topics.add(other)
+        assert index.refresh() == 1
+        assert {h.title for h in index.search("recursive")} == {
+            "Recursion",
+            "Hash Maps",
+        }
+
+    def test_rewritten_plans_file_is_reindexed(self, index, tmp_path, sample_plan):
+        TopicIndex(tmp_path / "plans.tsv").add(sample_plan)
+        index.refresh()
+        (tmp_path / "plans.tsv").write_text("")
+        index.refresh()
+        assert index.search("recursion") == []
+
+    def test_compacted_plans_file_is_reindexed(self, index, tmp_path, sample_plan):
+        path = tmp_path / "plans.tsv"
+        topics = TopicIndex(path)
+        renamed = sample_plan.model_copy(update={"topic": "recursion"})
+        for n in range(4):
+            topics.add(sample_plan, topic=f"recursion {n}")
+            topics.add(renamed)
+        index.refresh()
+        indexed = path.stat().st_size
+
+        topics = TopicIndex(path)
+        assert len(topics) == 5  # loading compacts the superseded rows
+        assert path.stat().st_size < indexed
+        step = sample_plan.steps[0].model_dump()
+        n = 0
+        while path.stat().st_size <= indexed:
+            topics.add(
+                CompactPlan.from_dict({"topic": f"Hash Maps {n}", "steps": [step]})
+            )
+            n += 1
+
+        index.refresh()
+        assert len(index) == n + 1
+        assert {h.title for h in index.search("hash", limit=100)} == {
+            f"Hash Maps {i}" for i in range(n)
+        }
+
+    def test_persists_between_opens(self, tmp_path, notes):
+        write_note(notes, "a.md", "dynamic programming memoizes subproblems")
+        first = SearchIndex(tmp_path / "search.db", notes, None)
+        first.refresh()
+        first.close()
+
+        second = SearchIndex(tmp_path / "search.db", notes, None)
+        assert second.refresh() == 0
+        assert second.search("memoize")[0].key == "note:a.md"
+        second.close()
+
+    def test_empty_queries(self, index, notes):
+        assert index.search("anything") == []
+        write_note(notes, "a.md", "text")
+        index.refresh()
+        assert index.search("the") == []
+        assert index.search("missing") == []
@@ -1,6 +1,6 @@
 import pytest
 from groqmate.core.state import Session
-from groqmate.core.models import SessionStatus
+from groqmate.core.models import CompactPlan, SessionStatus
 
 
 class TestSession:
@@ -14,6 +14,10 @@ class TestSession:
         assert session.state.current_step == 0
         assert session.state.completed == []
 
+    def test_load_plan_stores_compact_plan(self, session, sample_plan):
+        assert isinstance(session.state.plan, CompactPlan)
+        assert session.state.plan.to_model() == sample_plan
+
     def test_current_step_returns_step(self, session):
         step = session.current_step()
         assert step is not None
@@ -108,3 +112,88 @@ class TestSession:
         session.exit_quiz()
         session.enter_quiz()
         assert session.is_in_quiz()
+
+    def test_answers_compiled_on_load(self, session):
+        answer = session.current_answer()
+        assert answer is not None
+        assert answer.answer == "base case"
+        assert session.current_answer() is answer
+
+    def test_current_answer_follows_step(self, session):
+        session.advance()
+        assert session.current_answer().answer == "infinite loop"
+
+    def test_current_answer_none_without_plan(self, empty_session):
+        assert empty_session.current_answer() is None
+
+    def test_current_answer_recompiles_for_replaced_plan(self, session, sample_plan):
+        session.state.plan = sample_plan.model_copy(deep=True)
+        session.state.plan.steps[0].quiz_answer = "call stack"
+        assert session.current_answer().answer == "call stack"
+
+
+class TestSessionBack:
+    def test_back_returns_to_previous_step(self, session):
+        session.advance()
+        session.enter_quiz()
+        assert session.back() is True
+        assert session.state.current_step == 0
+        assert session.state.completed == []
+        assert not session.is_in_quiz()
+
+    def test_back_at_first_step(self, session):
+        assert session.back() is False
+
+    def test_back_without_plan(self, empty_session):
+        assert empty_session.back() is False
+
+    def test_back_from_complete(self, session):
+        for _ in range(5):
+            session.advance()
+        assert session.is_complete()
+        assert session.back() is True
+        assert session.state.current_step == 3
+        assert not session.is_complete()
+
+
+class TestSessionEvents:
+    def test_observers_receive_transitions(self, sample_plan):
+        events = []
+        session = Session()
+        session.subscribe(lambda event, data: events.append((event, data)))
+        session.load_plan(sample_plan)
+        session.enter_quiz()
+        session.exit_quiz()
+        session.advance()
+        session.back()
+        session.reset()
+
+        assert [e for e, _ in events] == [
+            "load_plan",
+            "enter_quiz",
+            "exit_quiz",
+            "advance",
+            "back",
+            "reset",
+        ]
+        assert events[3][1] == {"step": 1, "complete": False}
+
+    def test_unsubscribe(self, session):
+        events = []
+
+        def observer(event, data):
+            events.append(event)
+
+        session.subscribe(observer)
+        session.unsubscribe(observer)
+        session.advance()
+        assert events == []
+
+    def test_restore_does_not_emit_and_compiles_lazily(self, session):
+        events = []
+        restored = Session()
+        restored.subscribe(lambda event, data: events.append(event))
+        restored.restore(session.state)
+        assert events == []
+        assert restored._answers == []
+        assert restored.current_answer().answer == "base case"
@@ -0,0 +1,44 @@
+from unittest.mock import MagicMock
+from groqmate.interfaces.cli.tabs import LessonTab, MAX_LABEL
+from groqmate.interfaces.cli.widgets import ChatLog
+
+
+class TestLessonTab:
+    def test_new_tab_is_idle(self):
+        tab = LessonTab(1, ChatLog())
+        assert tab.id == "lesson-1"
+        assert tab.busy is False
+        assert tab.label == "1 New lesson"
+
+    def test_label_follows_plan_topic(self, sample_plan):
+        tab = LessonTab(2, ChatLog())
+        tab.session.load_plan(sample_plan)
+        assert tab.label == f"2 {sample_plan.topic}"
+
+    def test_label_truncates_long_topics(self, sample_plan):
+        tab = LessonTab(1, ChatLog())
+        sample_plan.topic = "x" * 100
+        tab.session.load_plan(sample_plan)
+        title = tab.label.split(" ", 1)[1]
+        assert len(title) == MAX_LABEL
+        assert title.endswith("…")
+
+    def test_busy_while_worker_runs(self):
+        tab = LessonTab(1, ChatLog())
+        tab.worker = MagicMock(is_finished=False)
+        assert tab.busy is True
+        assert tab.label.endswith("•")
+        tab.worker.is_finished = True
+        assert tab.busy is False
+
+    def test_sessions_are_independent(self, sample_plan):
+        first = LessonTab(1, ChatLog())
+        second = LessonTab(2, ChatLog())
+        first.session.load_plan(sample_plan)
+        assert second.session.state.plan is None
+
+    def test_progress_observes_session(self, sample_plan):
+        progress = MagicMock()
+        tab = LessonTab(1, ChatLog(), progress)
+        tab.session.load_plan(sample_plan)
+        assert progress.observe.call_args[0][0] == "load_plan"
@@ -0,0 +1,109 @@
+from groqmate.core.topics import TopicIndex, normalize_topic, trigrams
+from groqmate.core.models import LessonPlan
+
+
+class TestNormalizeTopic:
+    def test_lowercases_and_strips_punctuation(self):
+        assert normalize_topic("Recursion!") == "recursion"
+
+    def test_drops_filler_words(self):
+        assert normalize_topic("teach me recursion") == "recursion"
+        assert normalize_topic("recursion in python") == "recursion python"
+
+    def test_keeps_words_when_only_stopwords(self):
+        assert normalize_topic("how to") == "how to"
+
+    def test_trigrams_are_padded(self):
+        grams = trigrams("ab")
+        assert "  a" in grams
+        assert "ab " in grams
+
+
+class TestTopicIndex:
+    def test_empty_index_has_no_match(self):
+        index = TopicIndex()
+        assert index.lookup("recursion") is None
+        assert len(index) == 0
+
+    def test_exact_match(self, sample_plan):
+        index = TopicIndex()
+        index.add(sample_plan)
+        match = index.lookup("Recursion")
+        assert match is not None
+        assert match.score == 1.0
+        assert match.plan.topic == "Recursion"
+
+    def test_near_duplicate_topics_match(self, sample_plan):
+        index = TopicIndex()
+        index.add(sample_plan)
+        for topic in ("recursion in python", "teach me recursion!", "RECURSION"):
+            match = index.lookup(topic)
+            assert match is not None
+            assert match.plan.total_steps == 5
+
+    def test_unrelated_topic_misses(self, sample_plan):
+        index = TopicIndex()
+        index.add(sample_plan)
+        assert index.lookup("binary search trees") is None
+
+    def test_threshold_is_respected(self, sample_plan):
+        index = TopicIndex(threshold=0.95)
+        index.add(sample_plan)
+        assert index.lookup("recursion in python") is None
+
+    def test_indexes_requested_topic(self, sample_plan):
+        index = TopicIndex()
+        index.add(sample_plan, topic="self-calling functions")
+        assert index.lookup("self calling functions").score == 1.0
+
+    def test_best_match_wins(self):
+        index = TopicIndex()
+        index.add(LessonPlan(topic="Binary Search"))
+        index.add(LessonPlan(topic="Binary Trees"))
+        assert index.lookup("binary search algorithm").plan.topic == "Binary Search"
+
+    def test_persists_to_disk(self, tmp_path, sample_plan):
+        path = tmp_path / "plans.tsv"
+        TopicIndex(path).add(sample_plan)
+
+        reloaded = TopicIndex(path)
+        assert len(reloaded) == 1
+        match = reloaded.lookup("recursion in python")
+        assert match.plan.steps[0].quiz_answer == "base case"
+
+    def test_readding_topic_replaces_plan(self, tmp_path):
+        path = tmp_path / "plans.tsv"
+        index = TopicIndex(path)
+        index.add(LessonPlan(topic="Recursion"))
+        index.add(LessonPlan(topic="recursion", steps=[]))
+
+        reloaded = TopicIndex(path)
+        assert len(reloaded) == 1
+        assert reloaded.lookup("recursion").plan.topic == "recursion"
+
+    def test_readding_same_plan_does_not_append(self, tmp_path, sample_plan):
+        path = tmp_path / "plans.tsv"
+        index = TopicIndex(path)
+        index.add(sample_plan)
+        index.add(sample_plan)
+        TopicIndex(path).add(sample_plan, "recursion")
+        assert len(path.read_text().splitlines()) == 1
+
+    def test_load_compacts_superseded_rows(self, tmp_path):
+        path = tmp_path / "plans.tsv"
+        index = TopicIndex(path)
+        for n in range(3):
+            index.add(LessonPlan(topic="Recursion", steps=[]), f"recursion {n}")
+            index.add(LessonPlan(topic="recursion"))
+        assert len(path.read_text().splitlines()) == 9
+
+        reloaded = TopicIndex(path)
+        assert len(reloaded) == 4
+        assert len(path.read_text().splitlines()) == 4
+        assert reloaded.lookup("recursion").plan.topic == "recursion"
+        assert reloaded.lookup("recursion 2").plan.topic == "Recursion"
+
+    def test_does_not_touch_disk_until_used(self, tmp_path):
+        path = tmp_path / "plans.tsv"
+        TopicIndex(path)
+        assert not path.exists()
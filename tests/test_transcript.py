@@ -0,0 +1,159 @@
+import pytest
+import threading
+from groqmate.core.state import Session
+from groqmate.core.transcript import (
+    INDEX_ENTRY,
+    Transcript,
+    TranscriptWriter,
+    latest_transcript,
+    new_transcript_path,
+    slugify,
+)
+
+
+@pytest.fixture
+def path(tmp_path):
+    return tmp_path / "lesson.jsonl"
+
+
+def write_lesson(path, steps=3):
+    writer = TranscriptWriter(path)
+    writer.message("user", "teach me recursion")
+    for step in range(steps):
+        writer.step = step
+        writer.start("groqmate")
+        for token in ("Step ", str(step), " explained"):
+            writer.chunk(token)
+        writer.end()
+        writer.message("user", f"answer {step}")
+    writer.close()
+    return writer
+
+
+class TestTranscriptPaths:
+    def test_new_path_has_slug(self, tmp_path):
+        path = new_transcript_path("Binary Search Trees!", tmp_path)
+        assert path.parent == tmp_path
+        assert path.name.endswith("-binary-search-trees.jsonl")
+
+    def test_slug_cannot_escape_the_directory(self, tmp_path):
+        path = new_transcript_path("../../etc/passwd", tmp_path)
+        assert path.parent == tmp_path
+        assert slugify("a/b/../c", "_") == "a_b_c"
+        assert slugify("..") == "lesson"
+
+    def test_latest_transcript(self, tmp_path):
+        assert latest_transcript(tmp_path / "missing") is None
+        (tmp_path / "20250101-000000-a.jsonl").touch()
+        (tmp_path / "20250102-000000-b.jsonl").touch()
+        assert latest_transcript(tmp_path).name == "20250102-000000-b.jsonl"
+
+
+class TestTranscriptWriter:
+    def test_round_trip(self, path):
+        write_lesson(path)
+        messages = Transcript(path).messages()
+        assert [m.role for m in messages[:3]] == ["user", "groqmate", "user"]
+        assert messages[1].text == "Step 0 explained"
+        assert messages[1].step == 0
+        assert messages[0].step is None
+        assert messages[1].duration is not None
+        assert messages[1].ttft is not None
+
+    def test_streamed_tokens_are_coalesced(self, path):
+        writer = TranscriptWriter(path)
+        gate = threading.Event()
+        writer._queue.put(gate)
+        writer.start("groqmate")
+        for token in "one two three".split():
+            writer.chunk(token)
+        writer.end()
+        writer.close()
+        lines = path.read_text().splitlines()
+        assert sum('"chunk"' in line for line in lines) == 1
+
+    def test_index_has_one_entry_per_message(self, path):
+        write_lesson(path)
+        transcript = Transcript(path)
+        assert len(transcript) == 7
+        assert transcript.index_path.stat().st_size == 7 * INDEX_ENTRY.size
+
+    def test_chunk_without_stream_is_ignored(self, path):
+        writer = TranscriptWriter(path)
+        writer.chunk("orphan")
+        writer.message("system", "hello")
+        writer.close()
+        assert [m.text for m in Transcript(path).messages()] == ["hello"]
+
+    def test_flush_waits_for_writes(self, path):
+        writer = TranscriptWriter(path)
+        writer.message("user", "hi")
+        assert writer.flush()
+        assert "hi" in path.read_text()
+        writer.close()
+
+    def test_reopen_appends_with_new_ids(self, path):
+        write_lesson(path, steps=1)
+        writer = TranscriptWriter(path)
+        assert writer.message("user", "back again") == 3
+        writer.close()
+        assert Transcript(path).tail(1)[0].text == "back again"
+
+    def test_observes_session_steps(self, path, sample_plan):
+        writer = TranscriptWriter(path)
+        session = Session()
+        session.subscribe(writer.observe)
+        session.load_plan(sample_plan)
+        session.advance()
+        assert writer.step == 1
+        session.reset()
+        assert writer.step is None
+        writer.close()
+
+
+class TestTranscript:
+    def test_tail_reads_only_last_messages(self, path):
+        write_lesson(path, steps=50)
+        transcript = Transcript(path)
+        tail = transcript.tail(3)
+        assert [m.text for m in tail] == [
+            "answer 48",
+            "Step 49 explained",
+            "answer 49",
+        ]
+        assert tail[0].id == len(transcript) - 3
+
+    def test_first_message_of_step(self, path):
+        write_lesson(path)
+        transcript = Transcript(path)
+        message_id = transcript.first_message_of_step(2)
+        assert transcript.messages(message_id)[0].text == "Step 2 explained"
+        assert transcript.first_message_of_step(9) is None
+
+    def test_offset_points_at_record(self, path):
+        write_lesson(path)
+        transcript = Transcript(path)
+        with open(path, "rb") as f:
+            f.seek(transcript.offset_of(1))
+            assert b'"start"' in f.readline()
+
+    def test_missing_index_is_rebuilt(self, path):
+        write_lesson(path)
+        index = path.with_suffix(".idx")
+        expected = index.read_bytes()
+        index.unlink()
+        assert len(Transcript(path)) == 7
+        assert index.read_bytes() == expected
+
+    def test_torn_tail_is_tolerated(self, path):
+        write_lesson(path, steps=1)
+        with open(path, "ab") as f:
+            f.write(b'{"k": "msg", "id": 3, "r": "us')
+        with open(path.with_suffix(".idx"), "ab") as f:
+            f.write(b"\x01\x02")
+        assert [m.text for m in Transcript(path).messages()][-1] == "answer 0"
+
+    def test_empty_transcript(self, tmp_path):
+        transcript = Transcript(tmp_path / "none.jsonl")
+        assert len(transcript) == 0
+        assert transcript.tail(10) == []
@@ -1,4 +1,5 @@
 import pytest
+import asyncio
 import os
 from unittest.mock import AsyncMock, patch, MagicMock
 from groqmate.core.tutor import (
@@ -181,6 +182,47 @@ class TestExplainStepStream:
 
             assert tokens == []
 
+    @pytest.mark.asyncio
+    async def test_cancel_closes_upstream_response(
+        self, session, provider_config_groq, mock_streaming_chunks, monkeypatch
+    ):
+        monkeypatch.setenv("GROQ_API_KEY", "test_key")
+
+        class Response:
+            def __init__(self):
+                self.aclose = AsyncMock()
+
+            def __aiter__(self):
+                return self
+
+            async def __anext__(self):
+                if self.aclose.await_count:
+                    raise StopAsyncIteration
+                if not tokens:
+                    return mock_streaming_chunks[0]
+                await asyncio.sleep(60)
+
+        response = Response()
+        tokens = []
+
+        with patch("groqmate.core.tutor.acompletion", return_value=response):
+            tutor = Tutor(provider_config_groq)
+
+            async def consume():
+                async for token in tutor.explain_step_stream(session):
+                    tokens.append(token)
+
+            task = asyncio.create_task(consume())
+            while not tokens:
+                await asyncio.sleep(0)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+            response.aclose.assert_awaited_once()
+            assert tokens == ["Hello"]
+            assert tutor.ledger.totals.calls == 1
+
 
 class TestCheckAnswer:
     @pytest.mark.asyncio
@@ -220,13 +262,37 @@ class TestCheckAnswer:
         assert "No active lesson" in feedback
 
     @pytest.mark.asyncio
-    async def test_close_answer(self, session, provider_config_groq, monkeypatch):
+    async def test_hyphenated_answer(self, session, provider_config_groq, monkeypatch):
         monkeypatch.setenv("GROQ_API_KEY", "test_key")
         tutor = Tutor(provider_config_groq)
-        correct, feedback = await tutor.check_answer("base", session)
+        correct, _ = await tutor.check_answer("base-case", session)
 
         assert correct is True
 
+    @pytest.mark.asyncio
+    async def test_substring_nonsense_rejected(
+        self, session, provider_config_groq, monkeypatch
+    ):
+        monkeypatch.setenv("GROQ_API_KEY", "test_key")
+        tutor = Tutor(provider_config_groq)
+        correct, feedback = await tutor.check_answer("se", session)
+
+        assert correct is False
+        assert "Not quite" in feedback
+
+    @pytest.mark.asyncio
+    async def test_close_answer_goes_to_the_judge(
+        self, session, provider_config_groq, monkeypatch
+    ):
+        monkeypatch.setenv("GROQ_API_KEY", "test_key")
+        tutor = Tutor(provider_config_groq)
+        monkeypatch.setattr(tutor, "judge", AsyncMock(return_value="INCORRECT"))
+        correct, feedback = await tutor.check_answer("base", session)
+
+        assert correct is False
+        assert "Close!" in feedback
+        tutor.judge.assert_awaited_once()
+
 
 class TestRephraseStream:
     @pytest.mark.asyncio
@@ -345,6 +411,9 @@ class TestPrompts:
     def test_plan_prompt_requests_five_steps(self):
         assert "5 steps" in PLAN_PROMPT
 
+    def test_plan_prompt_requests_accepted_answers(self):
+        assert "accepted_answers" in PLAN_PROMPT
+
     def test_explain_prompt_format(self):
         formatted = EXPLAIN_PROMPT.format(
             topic="Recursion",
@@ -1,5 +1,21 @@
+import asyncio
 import pytest
-from groqmate.interfaces.cli.widgets import ChatMessage, ChatLog, InputBar
+from textual.app import App
+from groqmate.interfaces.cli.widgets import ChatMessage, ChatLog, CustomFooter, InputBar
+
+
+class ChatApp(App):
+    def __init__(self, fps: float = 30, live_limit: int = 100):
+        super().__init__()
+        self.fps = fps
+        self.live_limit = live_limit
+
+    def compose(self):
+        yield ChatLog(fps=self.fps, live_limit=self.live_limit)
+
+
+def live_contents(app):
+    return [m.message_content for m in app.query(ChatMessage)]
 
 
 class TestChatMessage:
@@ -36,6 +52,28 @@ class TestChatMessage:
         assert "Line 2" in rendered
         assert "Line 3" in rendered
 
+    def test_streamed_lines_render_like_whole_content(self):
+        content = "First line\nsecond\n\nthird and last"
+        whole = ChatMessage("Groqmate", content).render()
+        streamed = ChatMessage("Groqmate")
+        for token in ["First", " line\nsec", "ond\n", "\nthird", " and last"]:
+            streamed.append_content(token)
+            streamed.render()
+        rendered = streamed.render()
+        assert rendered.plain == whole.plain
+        assert rendered.spans == whole.spans
+        assert streamed.message_content == content
+
+    def test_prefix_style_does_not_leak(self):
+        rendered = ChatMessage("You", "Hi\nthere", is_user=True).render()
+        assert rendered.style == ""
+        assert rendered.spans[0].style == "bold white"
+
+    def test_set_message_content_replaces(self):
+        msg = ChatMessage("Groqmate", "old\ntext")
+        msg.message_content = "new"
+        assert str(msg.render()) == "Groqmate: new"
+
     def test_streaming_shows_cursor(self):
         msg = ChatMessage("Groqmate", "Test", is_streaming=True)
         rendered = str(msg.render())
@@ -95,3 +133,202 @@ class TestChatLog:
         from groqmate.interfaces.cli.widgets import ChatLog
 
         assert hasattr(ChatLog, "clear_chat")
+
+
+class TestChatLogStreaming:
+    @pytest.mark.asyncio
+    async def test_tokens_coalesce_into_one_frame(self):
+        app = ChatApp(fps=20)
+        async with app.run_test() as pilot:
+            chat = app.query_one(ChatLog)
+            msg = chat.add_message("Groqmate", "", is_streaming=True)
+            appended = []
+            original = msg.append_content
+            msg.append_content = lambda text: appended.append(text) or original(text)
+
+            for token in ["one", " two", " three"]:
+                chat.append_to_streaming(token)
+            assert appended == []
+
+            await asyncio.sleep(0.1)
+            await pilot.pause()
+            assert appended == ["one two three"]
+            assert msg.message_content == "one two three"
+
+    @pytest.mark.asyncio
+    async def test_finalize_flushes_immediately(self):
+        app = ChatApp(fps=1)
+        async with app.run_test():
+            chat = app.query_one(ChatLog)
+            msg = chat.add_message("Groqmate", "", is_streaming=True)
+            chat.append_to_streaming("pending")
+            assert msg.message_content == ""
+            chat.finalize_streaming()
+            assert msg.message_content == "pending"
+            assert msg.is_streaming is False
+
+    @pytest.mark.asyncio
+    async def test_nothing_pending_after_finalize(self):
+        app = ChatApp(fps=1)
+        async with app.run_test():
+            chat = app.query_one(ChatLog)
+            chat.add_message("Groqmate", "", is_streaming=True)
+            chat.finalize_streaming()
+            chat.append_to_streaming("late")
+            assert chat._pending == []
+
+    @pytest.mark.asyncio
+    async def test_background_buffers_until_shown(self):
+        app = ChatApp(fps=100)
+        async with app.run_test() as pilot:
+            chat = app.query_one(ChatLog)
+            msg = chat.add_message("Groqmate", "", is_streaming=True)
+            chat.set_background(True)
+            chat.append_to_streaming("hidden")
+            chat.append_to_streaming(" work")
+            await asyncio.sleep(0.05)
+            await pilot.pause()
+            assert msg.message_content == ""
+
+            chat.set_background(False)
+            assert msg.message_content == "hidden work"
+            assert chat._pending == []
+
+    @pytest.mark.asyncio
+    async def test_stream_stats(self):
+        app = ChatApp(fps=1000)
+        async with app.run_test():
+            chat = app.query_one(ChatLog)
+            chat.add_message("Groqmate", "", is_streaming=True)
+            for token in ["a", "b", "c"]:
+                chat.append_to_streaming(token)
+            chat.finalize_streaming()
+            assert chat.stats.tokens == 3
+            assert chat.stats.frames == 1
+            assert chat.stats.ttft() is not None
+
+
+class TestChatLogWindow:
+    @pytest.mark.asyncio
+    async def test_keeps_only_recent_messages_live(self):
+        app = ChatApp(live_limit=10)
+        async with app.run_test() as pilot:
+            chat = app.query_one(ChatLog)
+            for i in range(50):
+                chat.add_message("You", f"m{i}", is_user=True)
+            await pilot.pause()
+            assert live_contents(app) == [f"m{i}" for i in range(40, 50)]
+            assert len(chat.history) == 50
+
+    @pytest.mark.asyncio
+    async def test_scrolling_to_top_loads_earlier(self):
+        app = ChatApp(live_limit=30)
+        async with app.run_test(size=(60, 10)) as pilot:
+            chat = app.query_one(ChatLog)
+            for i in range(100):
+                chat.add_message("You", f"m{i}", is_user=True)
+            await pilot.pause()
+            chat.scroll_home(animate=False)
+            await pilot.pause()
+            contents = live_contents(app)
+            assert contents[0] == "m45"
+            assert len(contents) == 30
+
+    @pytest.mark.asyncio
+    async def test_wheel_at_bottom_edge_loads_later(self):
+        app = ChatApp(live_limit=30)
+        async with app.run_test(size=(60, 10)) as pilot:
+            chat = app.query_one(ChatLog)
+            for i in range(100):
+                chat.add_message("You", f"m{i}", is_user=True)
+            await pilot.pause()
+            chat.scroll_home(animate=False)
+            await pilot.pause()
+            assert live_contents(app)[-1] == "m74"
+
+            chat.scroll_end(animate=False)
+            await pilot.pause()
+            chat.on_mouse_scroll_down(None)
+            await pilot.pause()
+            assert live_contents(app)[-1] == "m99"
+
+    @pytest.mark.asyncio
+    async def test_new_message_returns_to_tail(self):
+        app = ChatApp(live_limit=30)
+        async with app.run_test(size=(60, 10)) as pilot:
+            chat = app.query_one(ChatLog)
+            for i in range(100):
+                chat.add_message("You", f"m{i}", is_user=True)
+            await pilot.pause()
+            chat.scroll_home(animate=False)
+            await pilot.pause()
+            chat.add_message("System", "latest", is_system=True)
+            await pilot.pause()
+            assert live_contents(app)[-2:] == ["m99", "latest"]
+            assert len(live_contents(app)) == 30
+
+    @pytest.mark.asyncio
+    async def test_streamed_content_kept_in_history(self):
+        app = ChatApp()
+        async with app.run_test():
+            chat = app.query_one(ChatLog)
+            chat.add_message("Groqmate", "", is_streaming=True)
+            chat.append_to_streaming("streamed")
+            chat.finalize_streaming()
+            assert chat.history[-1].content == "streamed"
+
+    @pytest.mark.asyncio
+    async def test_remove_message_drops_record(self):
+        app = ChatApp()
+        async with app.run_test() as pilot:
+            chat = app.query_one(ChatLog)
+            chat.add_message("You", "keep", is_user=True)
+            msg = chat.add_message("Groqmate", "", is_streaming=True)
+            chat.remove_message(msg)
+            await pilot.pause()
+            assert len(chat.history) == 1
+            assert live_contents(app) == ["keep"]
+
+    @pytest.mark.asyncio
+    async def test_clear_chat_clears_history(self):
+        app = ChatApp()
+        async with app.run_test() as pilot:
+            chat = app.query_one(ChatLog)
+            chat.add_message("You", "a", is_user=True)
+            chat.clear_chat()
+            await pilot.pause()
+            assert len(chat.history) == 0
+            assert live_contents(app) == []
+
+
+class TestCustomFooter:
+    def test_shows_provider_and_keys(self):
+        footer = CustomFooter(provider="groq")
+        content = footer._content()
+        assert "groq" in content
+        assert "Ctrl+P" in content
+
+    def test_update_provider(self):
+        footer = CustomFooter(provider="groq")
+        footer.update_provider("gemini")
+        assert "gemini" in footer._content()
+
+    def test_hud_replaces_key_hints(self):
+        footer = CustomFooter()
+        footer.update_hud("TTFT 200ms")
+        assert "TTFT 200ms" in footer._content()
+        assert "Ctrl+P" not in footer._content()
+        footer.update_hud(None)
+        assert "Ctrl+P" in footer._content()
+
+    @pytest.mark.asyncio
+    async def test_update_provider_refreshes_mounted_footer(self):
+        class FooterApp(App):
+            def compose(self):
+                yield CustomFooter(provider="groq")
+
+        app = FooterApp()
+        async with app.run_test():
+            footer = app.query_one(CustomFooter)
+            footer.update_provider("gemini")
+            assert "gemini" in str(footer.query_one("#footer-content").render())